@@ -0,0 +1,86 @@
+# Protocolos de retransmissão disponíveis (replicados do transmissor, arq_transmissor.py)
+GO_BACK_N = "Go-Back-N"
+SELECTIVE_REPEAT = "Selective Repeat"
+
+def ack(seq):
+    """Mensagem de confirmação positiva."""
+    return {"type": "ack", "seq": seq}
+
+def nak(seq):
+    """Mensagem de confirmação negativa (erro detectado no quadro)."""
+    return {"type": "nak", "seq": seq}
+
+class GoBackNReceiver:
+    """
+    Receptor Go-Back-N: aceita apenas o próximo quadro esperado e descarta os demais.
+    O ACK é cumulativo e informa o próximo quadro esperado; um NAK é enviado quando o quadro esperado chega com
+    erro, para que o transmissor volte a partir dele sem esperar o temporizador.
+    """
+
+    def __init__(self):
+        self.expected = 0
+
+    def receive(self, seq, data):
+        """
+        Processa um quadro recebido.
+        :param seq: Número de sequência do quadro (do envelope da mensagem).
+        :param data: Dados decodificados do quadro, ou None se um erro foi detectado.
+        :return: Resposta para o transmissor (ou None) e lista dos dados entregues em ordem.
+        """
+        if data is None:
+            return (nak(seq) if seq == self.expected else None), []
+        if seq != self.expected:
+            # Quadro fora de ordem ou repetido: repete o ACK do último quadro aceito
+            return ack(self.expected), []
+        self.expected += 1
+        return ack(self.expected), [data]
+
+class SelectiveRepeatReceiver:
+    """
+    Receptor Selective Repeat: guarda os quadros corretos dentro da janela, mesmo fora de ordem, e os entrega em
+    ordem assim que as lacunas são preenchidas. Cada quadro é confirmado individualmente.
+    """
+
+    def __init__(self, window_size):
+        """
+        :param window_size: Tamanho da janela (o mesmo do transmissor).
+        """
+        self.window_size = window_size
+        self.base = 0
+        self.buffer = {}
+
+    def receive(self, seq, data):
+        """
+        Processa um quadro recebido.
+        :param seq: Número de sequência do quadro (do envelope da mensagem).
+        :param data: Dados decodificados do quadro, ou None se um erro foi detectado.
+        :return: Resposta para o transmissor (ou None) e lista dos dados entregues em ordem.
+        """
+        in_window = self.base <= seq < self.base + self.window_size
+        if data is None:
+            return (nak(seq) if in_window else None), []
+        if seq < self.base:
+            # Quadro já entregue cujo ACK não chegou a tempo: confirma de novo
+            return ack(seq), []
+        if not in_window:
+            return None, []
+
+        self.buffer[seq] = data
+        delivered = []
+        while self.base in self.buffer:
+            delivered.append(self.buffer.pop(self.base))
+            self.base += 1
+        return ack(seq), delivered
+
+def make_receiver(mode, window_size):
+    """
+    Cria o receptor do protocolo de retransmissão indicado pelo transmissor.
+    :param mode: Protocolo de retransmissão (GO_BACK_N ou SELECTIVE_REPEAT).
+    :param window_size: Tamanho da janela.
+    :return: Receptor com o método receive(seq, data).
+    """
+    if mode == GO_BACK_N:
+        return GoBackNReceiver()
+    if mode == SELECTIVE_REPEAT:
+        return SelectiveRepeatReceiver(window_size)
+    raise ValueError(f"Protocolo de retransmissão inválido: {mode}")
@@ -0,0 +1,157 @@
+import numpy as np
+
+class BinarySymmetricChannel:
+    """
+    Canal binário simétrico: cada bit é invertido de forma independente com a mesma probabilidade.
+    Atua sobre a sequência de bits demodulada.
+    """
+    domain = "bits"
+
+    def __init__(self, error_probability=0.01, seed=None):
+        """
+        :param error_probability: Probabilidade de inversão de cada bit.
+        :param seed: Semente do gerador pseudoaleatório (None para uma semente aleatória).
+        """
+        self.error_probability = error_probability
+        self.rng = np.random.default_rng(seed)
+
+    def __call__(self, binary_sequence):
+        """
+        Aplica o canal à sequência de bits.
+        :param binary_sequence: Lista ou array de bits.
+        :return: Array uint8 com os bits após o canal.
+        """
+        bits = np.asarray(binary_sequence, dtype=np.uint8)
+        errors = self.rng.random(len(bits)) < self.error_probability
+        return bits ^ errors
+
+class AWGNChannel:
+    """
+    Canal com ruído branco gaussiano aditivo, com a potência do ruído definida pela SNR em relação à potência média do sinal.
+    Atua sobre as amostras do sinal modulado.
+    """
+    domain = "samples"
+
+    def __init__(self, snr_db=10.0, seed=None):
+        """
+        :param snr_db: Relação sinal-ruído por amostra, em dB.
+        :param seed: Semente do gerador pseudoaleatório (None para uma semente aleatória).
+        """
+        self.snr_db = snr_db
+        self.rng = np.random.default_rng(seed)
+
+    def __call__(self, signal):
+        """
+        Aplica o canal ao sinal.
+        :param signal: Array em ponto flutuante com as amostras do sinal.
+        :return: Array com as amostras somadas ao ruído, no mesmo tipo do sinal.
+        """
+        signal = np.asarray(signal)
+        if signal.dtype not in (np.float32, np.float64):
+            signal = signal.astype(np.float64)
+
+        power = np.mean(np.square(signal, dtype=np.float64)) if len(signal) else 0.0
+        noise_std = np.sqrt(power / 10 ** (self.snr_db / 10))
+        noise = self.rng.standard_normal(len(signal), dtype=signal.dtype)
+        return signal + signal.dtype.type(noise_std) * noise
+
+class GilbertElliottChannel:
+    """
+    Canal de Gilbert-Elliott: uma cadeia de Markov de dois estados (bom e ruim) gera rajadas de erros.
+    Em cada estado os bits são invertidos com uma probabilidade própria. Atua sobre a sequência de bits demodulada.
+    O estado do canal é mantido entre chamadas, então quadros consecutivos enxergam a mesma rajada.
+    """
+    domain = "bits"
+
+    def __init__(self, p_good_to_bad=0.001, p_bad_to_good=0.1, error_good=0.0, error_bad=0.5, seed=None):
+        """
+        :param p_good_to_bad: Probabilidade de transição do estado bom para o ruim a cada bit.
+        :param p_bad_to_good: Probabilidade de transição do estado ruim para o bom a cada bit.
+        :param error_good: Probabilidade de inversão de um bit no estado bom.
+        :param error_bad: Probabilidade de inversão de um bit no estado ruim.
+        :param seed: Semente do gerador pseudoaleatório (None para uma semente aleatória).
+        """
+        self.p_good_to_bad = p_good_to_bad
+        self.p_bad_to_good = p_bad_to_good
+        self.error_good = error_good
+        self.error_bad = error_bad
+        self.rng = np.random.default_rng(seed)
+        self.bad = False # Estado atual do canal
+
+    def sojourns(self, leave_probability, count, length):
+        """
+        Sorteia a duração (em bits) de várias permanências em um estado.
+        :return: Array com count durações geométricas (ou a sequência inteira, se o estado nunca é deixado).
+        """
+        if leave_probability <= 0:
+            return np.full(count, length)
+        return self.rng.geometric(leave_probability, count)
+
+    def states(self, length):
+        """
+        Gera a sequência de estados do canal para os próximos bits.
+        As permanências são sorteadas em lote, cortadas no total de bits e expandidas com np.repeat, sem um laço por
+        bit; a memória usada é proporcional ao número de bits.
+        :param length: Número de bits.
+        :return: Array booleano (verdadeiro no estado ruim).
+        """
+        blocks = []
+        covered = 0
+        while covered < length:
+            remaining = length - covered
+            leave_current = self.p_bad_to_good if self.bad else self.p_good_to_bad
+            leave_other = self.p_good_to_bad if self.bad else self.p_bad_to_good
+            if leave_current <= 0:
+                # Estado absorvente: o canal permanece nele até o fim
+                blocks.append(np.full(remaining, self.bad))
+                break
+            
+            # Número esperado de ciclos (permanência no estado atual e no outro) nos bits restantes, com folga para
+            # a maioria dos casos caber em um único lote
+            cycle = 1 / leave_current + (1 / leave_other if leave_other > 0 else np.inf)
+            count = int(remaining / cycle) + 16
+            current = self.sojourns(leave_current, count, remaining)
+            other = self.sojourns(leave_other, count, remaining)
+            # self.bad é o estado do último bit já gerado, então a primeira permanência é o restante da atual: pelas
+            # permanências geométricas (sem memória), ela tem uma transição a menos e pode ser vazia
+            current[0] -= 1
+            # Corta as permanências no total de bits restantes, para que np.repeat não gere bits descartados
+            ends = np.minimum(np.cumsum(np.column_stack([current, other]).ravel()), remaining)
+            runs = np.diff(ends, prepend=0)
+            values = np.tile([self.bad, not self.bad], count)
+            block = np.repeat(values, runs)
+            blocks.append(block)
+            covered += len(block)
+            # O lote seguinte continua do estado do último bit
+            self.bad = bool(block[-1])
+        return np.concatenate(blocks) if blocks else np.zeros(0, dtype=bool)
+
+    def __call__(self, binary_sequence):
+        """
+        Aplica o canal à sequência de bits.
+        :param binary_sequence: Lista ou array de bits.
+        :return: Array uint8 com os bits após o canal.
+        """
+        bits = np.asarray(binary_sequence, dtype=np.uint8)
+        error_probability = np.where(self.states(len(bits)), self.error_bad, self.error_good)
+        errors = self.rng.random(len(bits)) < error_probability
+        return bits ^ errors
+
+# Modelos de canal disponíveis, pelo nome usado na configuração
+CHANNEL_MODELS = {
+    "BSC": BinarySymmetricChannel,
+    "AWGN": AWGNChannel,
+    "Gilbert-Elliott": GilbertElliottChannel,
+}
+
+def make_channel(model, seed=None, **kwargs):
+    """
+    Cria um canal a partir do nome do modelo.
+    :param model: Nome do modelo ("BSC", "AWGN" ou "Gilbert-Elliott").
+    :param seed: Semente do gerador pseudoaleatório, para execuções reprodutíveis.
+    :param kwargs: Parâmetros específicos do modelo.
+    :return: Canal chamável, com o atributo domain indicando se atua sobre "bits" ou "samples".
+    """
+    if model not in CHANNEL_MODELS:
+        raise ValueError(f"Modelo de canal desconhecido: {model}")
+    return CHANNEL_MODELS[model](seed=seed, **kwargs)
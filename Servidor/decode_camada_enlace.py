@@ -1,82 +1,330 @@
 import binascii
+import re
+import struct
+import zlib
+from collections import Counter
+import numpy as np
 
-# Funções auxiliares importadas dos questionários
-def text_from_bits(bits, encoding='utf-8', errors='surrogatepass'):
-    n = int(bits, 2)
-    return int2bytes(n).decode(encoding, errors)
+# Flag e Escape do enquadramento por inserção de bytes
+FLAG = bytes([0b01111110])
+ESCAPE = bytes([0b01111011])
 
-def int2bytes(i):
-    hex_string = '%x' % i
-    n = len(hex_string)
-    return binascii.unhexlify(hex_string.zfill(n + (n & 1)))
+# Um escape e o byte protegido por ele
+ESCAPED_BYTE = re.compile(re.escape(ESCAPE) + b"(.)", re.DOTALL)
+
+# Dados de um quadro com inserção de bytes até a flag final (a primeira flag sem escape)
+FRAME_BODY = re.compile(b"(?:[^" + re.escape(ESCAPE) + b"]|" + re.escape(ESCAPE) + b".)*?" + re.escape(FLAG), re.DOTALL)
+
+# Unidades completas dos dados de um quadro com inserção de bytes (bytes comuns ou escape e byte protegido), sem a flag
+# final; usado pelo desenquadrador para continuar a busca da flag final de onde parou
+BODY_UNITS = re.compile(b"(?:[^" + re.escape(ESCAPE + FLAG) + b"]|" + re.escape(ESCAPE) + b".)*", re.DOTALL)
+
+# Peso de cada bit de um byte, do mais significativo para o menos significativo
+BIT_WEIGHTS = 1 << np.arange(7, -1, -1)
+
+# Tamanho, em bits, do campo de contagem do enquadramento Contagem de Caracteres (inteiro binário sem sinal)
+COUNT_WIDTH = 32
+
+# Cabeçalho de cada segmento: identificador da mensagem (16 bits), número de sequência (32 bits),
+# total de segmentos da mensagem (32 bits) e tamanho dos dados do segmento em bytes (16 bits)
+SEGMENT_HEADER = struct.Struct(">HIIH")
+
+# Tamanho máximo, em bits, de um quadro no fluxo contínuo; quadros maiores são tratados como erro
+MAX_FRAME_BITS = 1 << 16
+
+# Número de posições comparadas de cada vez na busca da flag
+FLAG_SEARCH_BLOCK = 4096
+
+def text_from_bits(binary_sequence, encoding='utf-8', errors='surrogatepass'):
+    """
+    Reconstrói o texto a partir dos bits, agrupando-os em bytes e decodificando na codificação escolhida.
+    :param binary_sequence: Lista ou array de bits (o último byte incompleto é completado com zeros).
+    :param encoding: Codificação dos bytes do texto (UTF-8 por padrão).
+    :param errors: Tratamento de erros de decodificação.
+    :return: Texto decodificado.
+    """
+    return bits_to_bytes(binary_sequence).decode(encoding, errors)
+
+def format_bits(binary_sequence):
+    """
+    Formata uma sequência de bits como texto separado em bytes, para exibição na interface.
+    :param binary_sequence: Lista ou array de bits.
+    :return: String com os bits agrupados de 8 em 8.
+    """
+    digits = (np.asarray(binary_sequence, dtype=np.uint8) + ord("0")).tobytes().decode("ascii")
+    return ' '.join(digits[i:i+8] for i in range(0, len(digits), 8))
+
+def bits_to_bytes(binary_sequence):
+    """
+    Agrupa uma sequência de bits em bytes.
+    :param binary_sequence: Lista ou array de bits (com comprimento múltiplo de 8).
+    :return: Bytes correspondentes.
+    """
+    return np.packbits(np.asarray(binary_sequence, dtype=np.uint8)).tobytes()
+
+def bytes_to_bits(data):
+    """
+    Expande bytes em bits.
+    :param data: Bytes a serem convertidos.
+    :return: Array uint8 de bits.
+    """
+    return np.unpackbits(np.frombuffer(data, dtype=np.uint8))
+
+def unstuff_bytes(payload):
+    """
+    Remove os escapes inseridos pelo transmissor, mantendo o byte protegido por cada um.
+    Feito com expressões regulares, em passadas lineares sobre os bytes.
+    :param payload: Bytes entre as flags do quadro.
+    :return: Bytes de dados originais.
+    """
+    # Uma flag ou escape sem escape (ou um escape no final) indica erro de transmissão
+    unescaped = ESCAPED_BYTE.sub(b"", payload)
+    if FLAG in unescaped or ESCAPE in unescaped:
+        raise Exception("Erro de transmissão detectado - Inserção de Bytes")
+    return ESCAPED_BYTE.sub(rb"\1", payload)
+
+def find_flag(bits, start=0, stop=None):
+    """
+    Procura a flag (01111110) em qualquer alinhamento de bit, comparando de uma vez as janelas de 8 bits de cada bloco.
+    A busca avança em blocos de FLAG_SEARCH_BLOCK posições e para no primeiro bloco com uma flag, então o custo é
+    proporcional à distância até a flag, e não ao tamanho de bits.
+    :param bits: Array de bits.
+    :param start: Posição a partir da qual a flag é procurada.
+    :param stop: Posição limite (exclusiva) para o início da flag, ou None para procurar até o fim.
+    :return: Posição do primeiro bit da primeira flag encontrada, ou -1 se não houver flag.
+    """
+    stop = len(bits) - 7 if stop is None else min(stop, len(bits) - 7)
+    for begin in range(start, stop, FLAG_SEARCH_BLOCK):
+        windows = np.lib.stride_tricks.sliding_window_view(bits[begin:min(begin + FLAG_SEARCH_BLOCK, stop) + 7], 8)
+        hits = np.flatnonzero(windows @ BIT_WEIGHTS == FLAG[0])
+        if len(hits):
+            return begin + int(hits[0])
+    return -1
+
+def crc_table(polynomial, width):
+    """
+    Monta a tabela de 256 entradas para o cálculo byte a byte de um CRC (sem reflexão de bits).
+    :param polynomial: Polinômio gerador, sem o termo de maior grau.
+    :param width: Grau do polinômio (tamanho do CRC em bits).
+    :return: Lista com o resto da divisão de cada byte possível.
+    """
+    top_bit = 1 << (width - 1)
+    mask = (1 << width) - 1
+    table = []
+    for byte in range(256):
+        register = byte << (width - 8)
+        for _ in range(8):
+            register = (register << 1) ^ polynomial if register & top_bit else register << 1
+        table.append(register & mask)
+    return table
+
+# Tabela do CRC-8 (polinômio x^8 + x^2 + x + 1)
+CRC8_TABLE = crc_table(0x07, 8)
+
+def crc_shift_tables(table, levels=48):
+    """
+    Monta as tabelas que deslocam um CRC de 8 bits por blocos de bytes nulos.
+    :param table: Tabela de 256 entradas do CRC (o deslocamento por um byte nulo).
+    :param levels: Número de tabelas.
+    :return: Lista em que a k-ésima tabela leva o CRC c ao CRC de c seguido de 2^k bytes nulos.
+    """
+    shifts = [np.array(table, dtype=np.uint8)]
+    for _ in range(levels - 1):
+        shifts.append(shifts[-1][shifts[-1]])
+    return shifts
+
+# Tabelas de deslocamento do CRC-8 por 2^k bytes nulos
+CRC8_SHIFTS = crc_shift_tables(CRC8_TABLE)
+
+# Tabela de 65536 entradas com o CRC-8 de cada par de bytes (lido como inteiro big-endian de 16 bits)
+CRC8_PAIRS = CRC8_SHIFTS[0][CRC8_SHIFTS[0][np.arange(1 << 16) >> 8]] ^ CRC8_SHIFTS[0][np.arange(1 << 16) & 0xFF]
+
+# Abaixo deste tamanho (em bytes), o laço com a tabela é mais rápido que as operações vetorizadas
+CRC8_VECTOR_MIN = 1024
+
+def crc8(data):
+    """
+    Calcula o CRC-8 de uma sequência de bytes com as tabelas pré-calculadas.
+    Sequências curtas usam um acesso à tabela por byte. Nas demais, o CRC de cada par de bytes sai de uma única
+    tabela, e os pares são combinados em uma árvore, com NumPy: como o CRC (valor inicial 0) é linear, o CRC de A
+    seguido de B é o CRC de A deslocado por len(B) bytes nulos, combinado por ou-exclusivo com o CRC de B. Os dados
+    são completados à esquerda com bytes nulos, que não mudam o CRC, até uma potência de 2.
+    :param data: Bytes de entrada.
+    :return: Valor do CRC.
+    """
+    if len(data) < CRC8_VECTOR_MIN:
+        register = 0
+        for byte in data:
+            register = CRC8_TABLE[register ^ byte]
+        return register
+    
+    values = np.frombuffer(data, dtype=np.uint8)
+    padded = np.zeros(1 << (len(values) - 1).bit_length(), dtype=np.uint8)
+    padded[len(padded) - len(values):] = values
+    values = CRC8_PAIRS[padded.view(">u2")]
+    for shift in CRC8_SHIFTS[1:]:
+        if len(values) == 1:
+            break
+        values = shift[values[0::2]] ^ values[1::2]
+    return int(values[0])
+
+def crc16_ccitt(data):
+    """
+    Calcula o CRC-16-CCITT (polinômio 0x1021, valor inicial 0xFFFF) com a implementação em C por tabela do binascii.
+    :param data: Bytes de entrada.
+    :return: Valor do CRC.
+    """
+    return binascii.crc_hqx(data, 0xFFFF)
+
+# Padrões de CRC disponíveis: nome -> (tamanho em bits, função de cálculo sobre bytes)
+# O CRC-32 usa o zlib, implementado em C
+CRC_STANDARDS = {
+    "CRC-8": (8, crc8),
+    "CRC-16-CCITT": (16, crc16_ccitt),
+    "CRC-32": (32, zlib.crc32),
+}
+
+# Padrão usado quando a configuração é apenas "CRC"
+DEFAULT_CRC = "CRC-32"
+
+# Posições (a partir de 1) dos bits de dados em cada bloco de Hamming(12, 8)
+HAMMING_DATA_POSITIONS = np.array([3, 5, 6, 7, 9, 10, 11, 12])
+
+# Matriz de verificação (4 x 12): a linha k marca as posições cobertas pelo bit de paridade 2^k
+HAMMING_CHECK = ((np.arange(1, 13) >> np.arange(4)[:, np.newaxis]) & 1).astype(np.uint8)
+
+# Tabela síndrome -> correção: a síndrome s (1 a 12) indica o bit s com erro; 0 e 13 a 15 não corrigem nada
+HAMMING_CORRECTION = np.zeros((16, 12), dtype=np.uint8)
+HAMMING_CORRECTION[np.arange(1, 13), np.arange(12)] = 1
+
+# Código convolucional de taxa 1/2 e comprimento de restrição 7, com os geradores 133 e 171 (octal)
+CONVOLUTIONAL_CONSTRAINT = 7
+CONVOLUTIONAL_GENERATORS = [0o133, 0o171]
+
+def convolutional_trellis():
+    """
+    Monta a treliça do código convolucional. O estado guarda os 6 últimos bits de entrada, o mais recente no bit
+    mais significativo, então cada estado de destino tem dois estados de origem, que diferem no bit mais antigo.
+    :return: Estados de origem (64, 2) e índice da saída esperada (0 a 3, os dois bits de saída) de cada ramo (64, 2).
+    """
+    memory = CONVOLUTIONAL_CONSTRAINT - 1
+    states = np.arange(1 << memory)
+    predecessors = ((states & ((1 << (memory - 1)) - 1)) << 1)[:, np.newaxis] | np.array([0, 1])
+    
+    # Registrador do codificador no ramo: bit de entrada (o mais recente do estado de destino) seguido do estado de origem
+    registers = ((states >> (memory - 1)) << memory)[:, np.newaxis] | predecessors
+    outputs = np.zeros_like(registers)
+    for generator in CONVOLUTIONAL_GENERATORS:
+        taps = (registers & generator)[..., np.newaxis] >> np.arange(CONVOLUTIONAL_CONSTRAINT)
+        outputs = (outputs << 1) | (np.sum(taps & 1, axis=-1) & 1)
+    return predecessors, outputs
+
+CONVOLUTIONAL_PREDECESSORS, CONVOLUTIONAL_BRANCH_OUTPUTS = convolutional_trellis()
+
+# Os quatro pares de bits de saída possíveis, na ordem dos índices de CONVOLUTIONAL_BRANCH_OUTPUTS
+CONVOLUTIONAL_OUTPUTS = np.array([[0, 0], [0, 1], [1, 0], [1, 1]])
+
+def ones_run_position(binary_sequence):
+    """
+    Calcula a posição de cada bit dentro da sequência de bits 1 consecutivos a que ele pertence.
+    Feito com somas acumuladas, sem laço em Python.
+    :param binary_sequence: Lista ou array de bits.
+    :return: Array com 1, 2, 3... para os bits 1 de cada sequência e 0 para os bits 0.
+    """
+    bits = np.asarray(binary_sequence, dtype=np.int64)
+    count = np.cumsum(bits)
+    # Contagem acumulada no último bit 0 antes de cada posição
+    last_zero = np.maximum.accumulate(np.where(bits == 0, count, 0))
+    return count - last_zero
 
 def decode_hamming(binary_sequence):
     """
     Realiza a decodificação do método de Hamming.
-    :param binary_sequence: Lista de bits representando a sequência binária.
-    :return: Lista de bits com a sequência decodificada.
+    A mensagem inteira é tratada como uma matriz (n_blocos, 12): as síndromes saem de um produto pela matriz de
+    verificação e a correção de cada bloco vem da tabela de 16 entradas.
+    :param binary_sequence: Array de bits representando a sequência binária.
+    :return: Array de bits com a sequência decodificada.
     """
+    bits = np.asarray(binary_sequence, dtype=np.uint8)
     
     # Agrupa em grupos de 12 bits, uma vez que a função de Hamming é aplicada em grupos de 8 bits
-    grouped_bytes = [binary_sequence[i:i + 12] for i in range(0, len(binary_sequence), 12)]
-    
-    decoded_list = []
-    for byte in grouped_bytes:
-        # Em casos em que o byte não é completo, ele é ignorado (possível melhoria - mais robustez)
-        if len(byte) == 12:
-            # Cálculo dos bits de paridade
-            t1 = (byte[0] + byte[2] + byte[4] + byte[6] + byte[8]+ byte[10]) % 2
-            t2 = (byte[1] + byte[2] + byte[5] + byte[6] + byte[9] + byte[10]) % 2
-            t4 = (byte[3] + byte[4] + byte[5] + byte[6] + byte[11]) % 2
-            t8 = (byte[7] + byte[8] + byte[9] + byte[10] + byte[11]) % 2
-            
-            # Cálculo do erro e correção
-            error = t1*1 + t2*2 + t4*4 + t8*8
-            if error != 0:
-                byte[error-1] = 1 - byte[error-1]
-            
-            # Remoção dos bits de paridade e adição dos bits na lista        
-            original_byte = [byte[2], byte[4], byte[5], byte[6], byte[8], byte[9],  byte[10], byte[11]]
-            decoded_list.extend(original_byte)
-        else:
-            # Adição dos bits na lista
-            decoded_list.extend(byte)
+    # Em casos em que o grupo não é completo, ele segue sem decodificação
+    complete = len(bits) - len(bits) % 12
+    blocks = bits[:complete].reshape(-1, 12)
+    
+    # Cálculo da síndrome (t1 + 2*t2 + 4*t4 + 8*t8) e correção do bit indicado
+    syndromes = ((blocks @ HAMMING_CHECK.T) & 1) @ np.array([1, 2, 4, 8])
+    corrected = blocks ^ HAMMING_CORRECTION[syndromes]
     
-    return decoded_list
+    # Remoção dos bits de paridade
+    decoded = corrected[:, HAMMING_DATA_POSITIONS - 1]
+    return np.concatenate([decoded.ravel(), bits[complete:]])
 
-def decode_crc(binary_sequence):
+def decode_convolutional(binary_sequence):
     """
-    Realiza a decodificação do método de CRC.
-    :param binary_sequence: Lista de bits representando a sequência binária.
-    :return: Lista de bits com a sequência decodificada (Sem o CRC).
+    Decodifica o código convolucional com o algoritmo de Viterbi.
+    A cada par recebido, a etapa de soma-comparação-seleção é feita de uma vez para os 64 estados da treliça.
+    A métrica de ramo é a distância L1 entre o par recebido e a saída esperada: com bits (decisão abrupta) é a
+    distância de Hamming, e valores entre 0 e 1 (decisão suave, a confiança de que o bit é 1) também são aceitos.
+    :param binary_sequence: Lista ou array de bits, ou de valores entre 0 e 1, com as duas saídas intercaladas.
+    :return: Array de bits decodificados, sem os bits de cauda.
     """
-    # Dividendo
-    dividendo = binary_sequence.copy()
+    received = np.asarray(binary_sequence, dtype=np.float64)
+    tail = CONVOLUTIONAL_CONSTRAINT - 1
+    if len(received) % 2 != 0 or len(received) < 2 * tail:
+        raise Exception("Erro de transmissão detectado - Convolucional")
+    pairs = received.reshape(-1, 2)
     
-    # Polinômio gerador
-    polynomial = [1, 1, 0, 1]
+    # Distância de cada par recebido para cada um dos quatro pares de saída possíveis
+    distances = np.abs(pairs[:, np.newaxis, :] - CONVOLUTIONAL_OUTPUTS).sum(axis=2)
+    
+    # O codificador começa no estado 0
+    metrics = np.full(len(CONVOLUTIONAL_PREDECESSORS), np.inf)
+    metrics[0] = 0.0
+    choices = np.empty((len(pairs), len(metrics)), dtype=np.intp)
+    for step, distance in enumerate(distances):
+        candidates = metrics[CONVOLUTIONAL_PREDECESSORS] + distance[CONVOLUTIONAL_BRANCH_OUTPUTS]
+        choice = candidates[:, 1] < candidates[:, 0]
+        metrics = np.where(choice, candidates[:, 1], candidates[:, 0])
+        choices[step] = choice
+    
+    # A cauda leva o codificador de volta ao estado 0, de onde o caminho sobrevivente é percorrido de trás para frente
+    decoded = np.empty(len(pairs), dtype=np.uint8)
+    state = 0
+    for step in range(len(pairs) - 1, -1, -1):
+        decoded[step] = state >> (tail - 1)
+        state = CONVOLUTIONAL_PREDECESSORS[state, choices[step, state]]
+    return decoded[:len(pairs) - tail]
+
+def decode_crc(binary_sequence, standard="CRC"):
+    """
+    Realiza a decodificação do método de CRC, recalculando o CRC por tabela e comparando com o recebido.
+    :param binary_sequence: Array de bits representando a sequência binária.
+    :param standard: Padrão do CRC ("CRC-8", "CRC-16-CCITT", "CRC-32" ou "CRC" para o padrão DEFAULT_CRC).
+    :return: Array de bits com a sequência decodificada (Sem o CRC).
+    """
+    if standard == "CRC":
+        standard = DEFAULT_CRC
+    width, compute = CRC_STANDARDS[standard]
     
-    # Dividir o dividendo pelo polinômio gerador
-    for i in range(len(dividendo)-3):
-        if dividendo[i] == 1:  # Se o bit atual do CRC for 1
-            for j in range(len(polynomial)):
-                # Realiza a operação XOR com o polinômio gerador
-                dividendo[i + j] ^= polynomial[j]
-    resto = dividendo[-(len(polynomial) - 1):]
+    if len(binary_sequence) < width:
+        raise Exception("Erro de transmissão detectado - CRC")
+    data = binary_sequence[:-width]
     
-    # Verificação do resto
-    if resto != [0,0,0]:
+    # Verificação do CRC recebido
+    received = int.from_bytes(bits_to_bytes(binary_sequence[-width:]), "big")
+    if compute(bits_to_bytes(data)) != received:
         raise Exception("Erro de transmissão detectado - CRC")
-    return binary_sequence[:-3]
+    return data
 
 def decode_parity_bit(binary_sequence):
     """
     Realiza a decodificação do método de Bit de Paridade.
-    :param binary_sequence: Lista de bits representando a sequência binária.
-    :return: Lista de bits com a sequência decodificada (Sem o bit de paridade).
+    :param binary_sequence: Array de bits representando a sequência binária.
+    :return: Array de bits com a sequência decodificada (Sem o bit de paridade).
     """
     # Cálculo do bit de paridade
-    parity = sum(binary_sequence) % 2 
+    parity = np.count_nonzero(binary_sequence) % 2
     
     # Verificação do bit de paridade, retorna erro se o número de bits 1 for ímpar    
     if parity != 0:
@@ -86,100 +334,156 @@ def decode_parity_bit(binary_sequence):
 
 def decode_char_insertion(binary_sequence):
     """
-    Realiza a decodificação do método de Inserção de Caracteres.
-    :param binary_sequence: Lista de bits representando a sequência binária.
-    :return: Lista de bits com a sequência decodificada (Sem a flag).
+    Realiza a decodificação do método de Inserção de Bits (bit stuffing).
+    :param binary_sequence: Array de bits representando a sequência binária.
+    :return: Array de bits com a sequência decodificada (Sem a flag e sem os bits inseridos).
     """
     # Declaração da Flag
-    flag = [0,1,1,1,1,1,1,0]
-    trimmed_sequence = binary_sequence[8:-8]
+    flag = np.array([0,1,1,1,1,1,1,0], dtype=np.uint8)
     
     # Verifica se as flags de início e fim recebidas batem com a flag
     flag_inicial = binary_sequence[:8]
     flag_final = binary_sequence[-8:]
-    if flag_inicial != flag or flag_final != flag:
+    if len(binary_sequence) < 16 or not np.array_equal(flag_inicial, flag) or not np.array_equal(flag_final, flag):
+        raise Exception("Erro de transmissão detectado - Inserção de Caracteres")
+    
+    trimmed_sequence = np.asarray(binary_sequence[8:-8], dtype=np.uint8)
+    run = ones_run_position(trimmed_sequence)
+
+    # Nos dados com inserção nunca há mais de cinco bits 1 seguidos, e o bit após cinco bits 1 é sempre um 0 inserido
+    stuffed_positions = np.flatnonzero(run == 5) + 1
+    if run.max(initial=0) > 5 or np.any(stuffed_positions >= len(trimmed_sequence)):
         raise Exception("Erro de transmissão detectado - Inserção de Caracteres")
     
-    flag_inserted_char = [0,1,1,1,1,1,0,1,0]
-    for bit in range(len(trimmed_sequence)):
-        if trimmed_sequence[bit:bit+9] == flag_inserted_char:
-            trimmed_sequence = trimmed_sequence[:bit] + flag + trimmed_sequence[bit+9:]
-    return trimmed_sequence
+    return np.delete(trimmed_sequence, stuffed_positions)
 
 def decode_byte_insertion(binary_sequence):
     """
     Função para decodificação do enquadramento Inserção de Bytes.
-    :param binary_sequence: Lista de bits representando a sequência binária.
-    :return: Lista de bits com a sequência decodificada e os escapes inseridos pela camada de enlace transmissora removidos.
+    :param binary_sequence: Array de bits representando a sequência binária.
+    :return: Array de bits com a sequência decodificada e os escapes inseridos pela camada de enlace transmissora removidos.
     """
-    # Declaração da Flag e Escape
-    flag =   [0,1,1,1,1,1,1,0]
-    escape = [0,1,1,1,1,0,1,1]
-    
-    # Sequência sem os bytes de flag
-    trimmed_sequence = binary_sequence[8:-8]
+    # O quadro deve ter um número inteiro de bytes e conter as flags de início e fim
+    if len(binary_sequence) % 8 != 0 or len(binary_sequence) < 16:
+        raise Exception("Erro de transmissão detectado - Inserção de Bytes")
+    frame = bits_to_bytes(binary_sequence)
     
     # Verifica se as flags de início e fim recebidas batem com a flag
-    flag_inicial = binary_sequence[:8]
-    flag_final = binary_sequence[-8:]
-    if flag_inicial != flag or flag_final != flag:
+    if frame[:1] != FLAG or frame[-1:] != FLAG:
         raise Exception("Erro de transmissão detectado - Inserção de Bytes")
     
-    # Verifica se encontra um escape e remove-o
-    ignore_next_flag_or_escape = False
-    for i in range(len(trimmed_sequence)):
-        if trimmed_sequence[i:i+8] == escape and not ignore_next_flag_or_escape:
-            ignore_next_flag_or_escape = True
-            trimmed_sequence = trimmed_sequence[:i] + trimmed_sequence[i+8:]
-        else:
-            if trimmed_sequence[i:i+8] == flag or trimmed_sequence[i:i+8] == escape:
-                ignore_next_flag_or_escape = False
-    return trimmed_sequence
+    # Remove os escapes dos bytes entre as flags
+    return bytes_to_bits(unstuff_bytes(frame[1:-1]))
 
 def decode_char_count(binary_sequence):
     """
     Função para decodificação do enquadramento Contagem de Caracteres.
-    :param binary_sequence: Lista de bits representando a sequência binária.
-    :return: Lista de bits com a sequência decodificada.
-    """
-    # Separa os 8 primeiros bits para obter o número de caracteres
-    first_8_bits = text_from_bits(''.join(map(str,binary_sequence[:8])))
-    # Separa os próximos 8 bits para obter o número de caracteres (caso necessário)
-    second_8_bits = text_from_bits(''.join(map(str,binary_sequence[8:16])))
-    
-    # Inicializa a sequência de dados
-    data_sequence = binary_sequence[8:]
-    char_number=first_8_bits
-    # Verifica se o número de caracteres é um número decimal e se a sequência binária é maior que 16, ou seja, se o segundo byte também faz parte da contagem
-    if second_8_bits.isdecimal() and len(binary_sequence) > 16:
-        char_number += second_8_bits
-        # Modifica a sequência de dados para a partir do 17º bit
-        data_sequence = binary_sequence[16:]
+    :param binary_sequence: Array de bits representando a sequência binária.
+    :return: Array de bits com a sequência decodificada.
+    """
+    if len(binary_sequence) < COUNT_WIDTH:
+        raise Exception("Erro de transmissão detectado - Contagem de Caracteres")
+    
+    # Os primeiros COUNT_WIDTH bits trazem o número de bits de dados como inteiro binário
+    char_number = int.from_bytes(bits_to_bytes(binary_sequence[:COUNT_WIDTH]), "big")
+    data_sequence = binary_sequence[COUNT_WIDTH:]
     
     # Lança exceção caso o número de caracteres recebido não corresponda ao tamanho da sequência de dados
-    if len(data_sequence) != int(char_number):
+    if len(data_sequence) != char_number:
         raise Exception("Erro de transmissão detectado - Contagem de Caracteres")
         
     return data_sequence
 
-def main(framing, error_detection, error_correction, binary_sequence):
+def parse_segment(data):
     """
-    Função principal para decodificação da camada de enlace.
-    :param binary_sequence: Sequência binária de entrada.
+    Separa o cabeçalho de segmentação dos dados de um segmento e verifica a sua consistência.
+    :param data: Bytes do segmento (cabeçalho + dados).
+    :return: Identificador da mensagem, número de sequência, total de segmentos e bytes de dados.
+    """
+    if len(data) < SEGMENT_HEADER.size:
+        raise Exception("Erro de transmissão detectado - Segmentação")
+    message_id, seq, total, length = SEGMENT_HEADER.unpack_from(data)
+    payload = data[SEGMENT_HEADER.size:]
+    if len(payload) != length or seq >= total:
+        raise Exception("Erro de transmissão detectado - Segmentação")
+    return message_id, seq, total, payload
+
+class Reassembler:
+    """
+    Remonta as mensagens segmentadas pelo transmissor a partir dos segmentos recebidos, em qualquer ordem.
+    Quadros com erro detectado são descartados antes de chegar aqui, e os seus segmentos aparecem em missing().
+    Uma mensagem é remontada por vez: um segmento de outra mensagem descarta a mensagem incompleta, o que mantém
+    a memória limitada a uma mensagem.
+    """
+
+    def __init__(self):
+        self.message_id = None
+        self.total = 0
+        self.segments = {}
+        # Mensagens descartadas incompletas e segmentos inválidos recebidos
+        self.lost_messages = 0
+        self.invalid_segments = 0
+
+    def add(self, data):
+        """
+        Guarda um segmento e, se ele completar a mensagem, devolve a mensagem remontada.
+        :param data: Bytes do segmento (cabeçalho + dados), já decodificados pela camada de enlace.
+        :return: Bytes da mensagem completa, ou None enquanto faltarem segmentos.
+        """
+        try:
+            message_id, seq, total, payload = parse_segment(data)
+        except Exception:
+            self.invalid_segments += 1
+            raise
+        
+        # Início de uma nova mensagem
+        if message_id != self.message_id or total != self.total:
+            if self.segments:
+                self.lost_messages += 1
+            self.message_id = message_id
+            self.total = total
+            self.segments = {}
+        
+        # Segmentos repetidos substituem os anteriores
+        self.segments[seq] = payload
+        if len(self.segments) < self.total:
+            return None
+        
+        message = b"".join(self.segments[i] for i in range(self.total))
+        self.message_id = None
+        self.total = 0
+        self.segments = {}
+        return message
+
+    def missing(self):
+        """
+        Lista os segmentos da mensagem atual que ainda não foram recebidos (perdidos ou descartados por erro).
+        :return: Lista de números de sequência.
+        """
+        return [seq for seq in range(self.total) if seq not in self.segments]
+
+def decode_frame(framing, error_detection, error_correction, binary_sequence):
+    """
+    Decodifica um quadro: aplica a correção de erros, a detecção de erros e o desenquadramento selecionados.
     :param framing: Tipo de enquadramento selecionado.
     :param error_detection: Tipo de detecção de erros selecionado.
     :param error_correction: Tipo de correção de erros selecionado.
-    :return: Mensagem decodificada e sequência binária.
+    :param binary_sequence: Lista ou array de bits do quadro demodulado.
+    :return: Array de bits com os dados do quadro.
     """
+    binary_sequence = np.asarray(binary_sequence, dtype=np.uint8)
+
     # Correção de erros
     if error_correction == "Hamming":
         binary_sequence = decode_hamming(binary_sequence)
+    elif error_correction == "Convolucional":
+        binary_sequence = decode_convolutional(binary_sequence)
         
     # Decodificação de erros
     if error_detection == "Bit de Paridade":
         binary_sequence = decode_parity_bit(binary_sequence)
-    elif error_detection == "CRC":
-        binary_sequence = decode_crc(binary_sequence)
+    elif error_detection == "CRC" or error_detection in CRC_STANDARDS:
+        binary_sequence = decode_crc(binary_sequence, error_detection)
         
     # Decodificação do enquadramento
     if framing == "Contagem de Caracteres":
@@ -189,5 +493,253 @@ def main(framing, error_detection, error_correction, binary_sequence):
     elif framing == "Inserção de Bits":
         binary_sequence = decode_char_insertion(binary_sequence)
     
-    x = ''.join(map(str,binary_sequence))
-    return text_from_bits(''.join(map(str,binary_sequence))), ' '.join(x[i:i+8] for i in range(0, len(x), 8))
\ No newline at end of file
+    return binary_sequence
+
+def edc_width(error_detection):
+    """
+    Informa quantos bits a detecção de erros acrescenta ao final do quadro.
+    :param error_detection: Tipo de detecção de erros selecionado.
+    :return: Número de bits do código de detecção.
+    """
+    if error_detection == "Bit de Paridade":
+        return 1
+    if error_detection == "CRC":
+        error_detection = DEFAULT_CRC
+    if error_detection in CRC_STANDARDS:
+        return CRC_STANDARDS[error_detection][0]
+    return 0
+
+class Deframer:
+    """
+    Desenquadrador incremental: recebe o fluxo demodulado em pedaços de qualquer tamanho e devolve cada quadro
+    assim que ele se fecha, guardando apenas o quadro ainda incompleto.
+    Os quadros são localizados pelas flags (inserção de bits ou de bytes) ou pelo cabeçalho de contagem. Quando a
+    verificação falha, a busca recomeça um bit após o início do quadro descartado, para voltar a se sincronizar.
+    Com contagem (ou inserção de bytes com bit de paridade), um erro logo após um quadro válido descarta apenas o
+    quadro até o fim indicado, já que o erro provavelmente está nos dados; a busca bit a bit só começa se o quadro
+    seguinte também falhar (ver flag_resync).
+    Com Hamming, o fluxo é decodificado em blocos de 12 bits à medida que chega, o que exige quadros com número
+    inteiro de bytes antes da codificação.
+    O custo é linear no tamanho do fluxo: a busca do fim do quadro incompleto continua de onde parou a cada pedaço
+    (com 7 bits de sobreposição para a flag), sem ultrapassar o limite de espera (ver wait_limit), e o buffer cresce com
+    capacidade dobrada em vez de ser concatenado a cada pedaço.
+    """
+
+    def __init__(self, framing, error_detection, error_correction, max_frame_bits=MAX_FRAME_BITS):
+        if framing not in ("Contagem de Caracteres", "Inserção de Bytes", "Inserção de Bits"):
+            raise ValueError("O enquadramento selecionado não permite separar quadros de um fluxo contínuo")
+        if error_correction not in ("Nenhum", "Hamming"):
+            raise ValueError("A correção de erros selecionada não pode ser decodificada em fluxo contínuo")
+        if error_correction == "Hamming" and (framing == "Inserção de Bits" or error_detection == "Bit de Paridade"):
+            raise ValueError("Com Hamming, o fluxo contínuo exige quadros com número inteiro de bytes")
+        self.framing = framing
+        self.error_detection = error_detection
+        self.error_correction = error_correction
+        self.edc_width = edc_width(error_detection)
+        self.max_frame_bits = max_frame_bits
+        # Bits já corrigidos ainda não consumidos (os primeiros length bits de storage) e bits com Hamming
+        # aguardando um bloco completo
+        self.storage = np.zeros(0, dtype=np.uint8)
+        self.length = 0
+        # Bits do fluxo já descartados do buffer, para calcular o alinhamento de uma posição no fluxo
+        self.offset = 0
+        self.coded = np.zeros(0, dtype=np.uint8)
+        # Posição até onde o fim do quadro incompleto já foi procurado, ou None se nenhum quadro está pendente
+        self.scan = None
+        # Indica se o último quadro foi aceito, isto é, se o fluxo está sincronizado com os quadros
+        self.synchronized = True
+        # Tamanho, em bits, do maior quadro aceito e alinhamento (posição no fluxo módulo 8) do último quadro aceito
+        self.longest = 0
+        self.alignment = None
+        # Quadros entregues e erros detectados (pela mensagem de erro de cada etapa)
+        self.frames = 0
+        self.errors = Counter()
+
+    @property
+    def buffer(self):
+        """
+        Bits ainda não consumidos (visão do armazenamento interno).
+        """
+        return self.storage[:self.length]
+
+    def append(self, bits):
+        """
+        Acrescenta bits ao buffer, dobrando a capacidade quando ela se esgota.
+        :param bits: Array de bits.
+        """
+        needed = self.length + len(bits)
+        if needed > len(self.storage):
+            storage = np.empty(max(needed, 2 * len(self.storage)), dtype=np.uint8)
+            storage[:self.length] = self.storage[:self.length]
+            self.storage = storage
+        self.storage[self.length:needed] = bits
+        self.length = needed
+
+    def consume(self, count):
+        """
+        Descarta os primeiros bits do buffer.
+        :param count: Número de bits descartados.
+        """
+        if count:
+            remaining = self.length - count
+            self.storage[:remaining] = self.storage[count:self.length]
+            self.length = remaining
+            self.offset += count
+            if self.scan is not None:
+                self.scan -= count
+
+    def feed(self, chunk):
+        """
+        Acrescenta um pedaço do fluxo e extrai os quadros completos.
+        :param chunk: Bytes, ou lista/array de bits.
+        :return: Lista de arrays de bits com os dados de cada quadro fechado neste pedaço.
+        """
+        if isinstance(chunk, (bytes, bytearray, memoryview)):
+            bits = bytes_to_bits(chunk)
+        else:
+            bits = np.asarray(chunk, dtype=np.uint8)
+        
+        # Decodifica apenas os blocos de Hamming completos; o restante espera o próximo pedaço
+        if self.error_correction == "Hamming":
+            coded = np.concatenate([self.coded, bits])
+            complete = len(coded) - len(coded) % 12
+            self.coded = coded[complete:]
+            bits = decode_hamming(coded[:complete])
+        
+        self.append(bits)
+        return self.extract()
+
+    def flag_resync(self):
+        """
+        Informa se, depois de um erro, a busca pode recomeçar pela próxima flag do fluxo.
+        Com inserção de bits, os dados nunca formam a flag. Com inserção de bytes e um código de detecção com número
+        inteiro de bytes, as flags fora do alinhamento dos quadros são ignoradas (ver next_flag). Nos demais casos
+        (contagem, ou inserção de bytes com bit de paridade), um erro logo após um quadro válido descarta apenas esse
+        quadro, até o fim indicado pelo cabeçalho ou pela flag final, já que o erro provavelmente está nos dados.
+        :return: Verdadeiro se a próxima flag é um início de quadro confiável.
+        """
+        return self.framing == "Inserção de Bits" or (self.framing == "Inserção de Bytes" and self.edc_width % 8 == 0)
+
+    def next_flag(self, position):
+        """
+        Procura a próxima flag que pode iniciar um quadro.
+        Com inserção de bytes e um código de detecção com número inteiro de bytes, todos os quadros do fluxo têm
+        número inteiro de bytes e começam no mesmo alinhamento de bit. Depois do primeiro quadro aceito, as flags em
+        outro alinhamento (padrões 01111110 formados entre bytes dos dados) são ignoradas.
+        :param position: Posição a partir da qual a flag é procurada.
+        :return: Posição da flag no buffer, ou -1 se não houver flag.
+        """
+        start = find_flag(self.buffer, position)
+        if self.framing == "Inserção de Bytes" and self.flag_resync() and self.alignment is not None:
+            while start >= 0 and (self.offset + start) % 8 != self.alignment:
+                start = find_flag(self.buffer, start + 1)
+        return start
+
+    def wait_limit(self):
+        """
+        Tamanho, em bits, até o qual um quadro incompleto é aguardado.
+        Fora de sincronia, o início do quadro pode ser uma flag falsa, como um padrão 01111110 fora do alinhamento
+        dos bytes com inserção de bytes, cujo fim nunca chega. Nesse caso a espera vai só até o dobro do maior quadro
+        já aceito, e não até o tamanho máximo, para que os quadros seguintes não fiquem retidos.
+        :return: Número de bits.
+        """
+        if self.synchronized or not self.longest:
+            return self.max_frame_bits
+        return min(self.max_frame_bits, 2 * self.longest)
+
+    def frame_end(self, start):
+        """
+        Procura o fim do quadro que começa em start (antes do código de detecção de erros), continuando a busca de
+        onde a chamada anterior para o mesmo quadro parou.
+        :param start: Posição do início do quadro no buffer.
+        :return: Posição logo após o quadro, ou None se o fim ainda não chegou.
+        """
+        buffer = self.buffer
+        if self.framing == "Contagem de Caracteres":
+            if len(buffer) - start < COUNT_WIDTH:
+                return None
+            return start + COUNT_WIDTH + int.from_bytes(bits_to_bytes(buffer[start:start + COUNT_WIDTH]), "big")
+        
+        if self.scan is None:
+            self.scan = start + 8
+        # Nenhum quadro aguardado passa do limite de espera, então a flag final não é procurada além dele
+        limit = min(len(buffer), start + self.wait_limit() + 8)
+        
+        if self.framing == "Inserção de Bits":
+            closing = find_flag(buffer[:limit], self.scan)
+            if closing < 0:
+                # Os últimos 7 bits podem ser o começo da flag final
+                self.scan = max(self.scan, limit - 7)
+                return None
+            self.scan = closing
+            return closing + 8
+        
+        # Inserção de Bytes: os dados seguem alinhados em bytes a partir da flag inicial; a busca continua no
+        # primeiro byte ainda não lido (um escape no final fica para o próximo pedaço, com o byte protegido)
+        body = bits_to_bytes(buffer[self.scan:limit - (limit - self.scan) % 8])
+        units = BODY_UNITS.match(body).end()
+        self.scan += 8 * units
+        return self.scan + 8 if units < len(body) and body[units] == FLAG[0] else None
+
+    def extract(self):
+        """
+        Extrai do buffer todos os quadros completos, descartando os que falham na verificação.
+        :return: Lista de arrays de bits com os dados de cada quadro.
+        """
+        frames = []
+        position = 0
+        while True:
+            # Com contagem, o quadro começa onde o anterior terminou; com flags, na próxima flag
+            if self.framing == "Contagem de Caracteres":
+                start = position
+            else:
+                start = self.next_flag(position)
+                if start < 0:
+                    # Os últimos 7 bits podem ser o começo de uma flag
+                    position = max(position, len(self.buffer) - 7)
+                    break
+            
+            end = self.frame_end(start)
+            if end is None or end + self.edc_width > len(self.buffer):
+                # Quadro incompleto: espera mais bits, a menos que ele já passe do limite de espera
+                length = len(self.buffer) - start if end is None else end - start
+                if length <= self.wait_limit():
+                    position = start
+                    break
+                self.errors[f"Erro de transmissão detectado - {self.framing}"] += 1
+                self.synchronized = False
+                self.scan = None
+                position = start + 1
+                continue
+            
+            self.scan = None
+            try:
+                frame = decode_frame(self.framing, self.error_detection, "Nenhum", self.buffer[start:end + self.edc_width].copy())
+            except Exception as e:
+                self.errors[str(e)] += 1
+                skip_frame = self.synchronized and not self.flag_resync()
+                self.synchronized = False
+                position = end + self.edc_width if skip_frame else start + 1
+                continue
+            
+            frames.append(frame)
+            self.frames += 1
+            self.synchronized = True
+            self.longest = max(self.longest, end + self.edc_width - start)
+            self.alignment = (self.offset + start) % 8
+            position = end + self.edc_width
+        
+        self.consume(position)
+        return frames
+
+def main(framing, error_detection, error_correction, binary_sequence):
+    """
+    Função principal para decodificação da camada de enlace de um quadro único, sem segmentação.
+    :param binary_sequence: Sequência binária de entrada.
+    :param framing: Tipo de enquadramento selecionado.
+    :param error_detection: Tipo de detecção de erros selecionado.
+    :param error_correction: Tipo de correção de erros selecionado.
+    :return: Mensagem decodificada e sequência binária.
+    """
+    binary_sequence = decode_frame(framing, error_detection, error_correction, binary_sequence)
+    return text_from_bits(binary_sequence), format_bits(binary_sequence)
\ No newline at end of file
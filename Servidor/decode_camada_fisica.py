@@ -1,198 +1,253 @@
 import numpy as np
-import matplotlib.pyplot as plt
-import random
+import os
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
 
-def demodulate_ask(signal, A, F, digi_mod):
+# Tipos de amostra aceitos para o sinal modulado
+SAMPLE_DTYPES = {"float64": np.float64, "float32": np.float32, "int16": np.int16}
+
+@dataclass(frozen=True)
+class SignalParams:
+    """
+    Parâmetros do sinal compartilhados entre transmissor e receptor.
+    As frequências são dadas em Hz; cada símbolo dura 1 / symbol_rate segundos e é amostrado samples_per_symbol vezes.
+    No tipo "int16" o sinal é transmitido em ponto fixo, com a amplitude mapeada para o maior valor do tipo.
+    """
+    samples_per_symbol: int = 100
+    symbol_rate: float = 1.0
+    amplitude: float = 1.0
+    carrier_frequency: float = 1.0   # Portadora do ASK e do 8-QAM
+    fsk_frequency_one: float = 1.0   # Portadora do FSK para o bit 1
+    fsk_frequency_zero: float = 3.0  # Portadora do FSK para o bit 0
+    dtype: str = "float64"
+
+    def __post_init__(self):
+        if self.dtype not in SAMPLE_DTYPES:
+            raise ValueError(f"Tipo de amostra inválido: {self.dtype}")
+
+    @property
+    def sample_rate(self):
+        """Taxa de amostragem do sinal em amostras por segundo."""
+        return self.samples_per_symbol * self.symbol_rate
+
+    @property
+    def scale(self):
+        """Fator entre a amplitude em ponto flutuante e o valor transmitido."""
+        if self.dtype == "int16":
+            return np.iinfo(np.int16).max / self.amplitude
+        return 1.0
+
+    def to_samples(self, waveform):
+        """
+        Converte formas de onda em ponto flutuante para o tipo de amostra configurado.
+        :param waveform: Array em ponto flutuante.
+        :return: Array no tipo de amostra configurado.
+        """
+        dtype = SAMPLE_DTYPES[self.dtype]
+        if np.issubdtype(dtype, np.integer):
+            return np.round(waveform * self.scale).astype(dtype)
+        return waveform.astype(dtype, copy=False)
+
+    def from_samples(self, signal):
+        """
+        Converte o sinal recebido de volta para ponto flutuante na escala da amplitude.
+        :param signal: Lista ou array com as amostras no tipo configurado.
+        :return: Array em ponto flutuante.
+        """
+        signal = np.asarray(signal)
+        if np.issubdtype(SAMPLE_DTYPES[self.dtype], np.integer):
+            return signal.astype(np.float32) / np.float32(self.scale)
+        return signal.astype(SAMPLE_DTYPES[self.dtype], copy=False)
+
+# Parâmetros originais do projeto (replicados do transmissor, que os envia junto com o quadro): 100 amostras por símbolo em float64
+DEFAULT_PARAMS = SignalParams()
+
+def symbol_segments(signal, samples_per_symbol=100):
+    """
+    Reorganiza o sinal recebido em uma matriz com um símbolo por linha.
+    :param signal: Array em ponto flutuante representando o sinal modulado.
+    :param samples_per_symbol: Número de amostras por símbolo.
+    :return: Matriz (n_simbolos, samples_per_symbol); amostras incompletas no final são descartadas.
+    """
+    signal = np.asarray(signal)
+    num_symbols = len(signal) // samples_per_symbol
+    return signal[:num_symbols * samples_per_symbol].reshape(num_symbols, samples_per_symbol)
+
+def levels_from_decisions(decisions, digi_mod):
+    """
+    Converte as decisões do demodulador (presença do bit 1) nas tensões da modulação digital.
+    :param decisions: Array booleano com a decisão de cada símbolo.
+    :param digi_mod: Tipo de modulação digital.
+    :return: Array int8 com as tensões da modulação digital.
+    """
+    bits = decisions.astype(np.int8)
+    if digi_mod == "NRZ-Polar":
+        return 2 * bits - 1 # -V para 0
+    elif digi_mod == "Bipolar":
+        # Reconstrói a alternância de polaridade a partir da paridade da soma acumulada de bits 1
+        ones_parity = np.cumsum(bits, dtype=np.uint8) & 1
+        return bits * (2 * ones_parity.view(np.int8) - 1)
+    return bits
+
+def demodulate_ask(signal, A, F, digi_mod, params=DEFAULT_PARAMS):
     """
     Demodula um sinal ASK e reconstitui o bit stream original.
-    :param signal: Array representando o sinal modulado ASK.
+    Todos os símbolos são correlacionados com a portadora em um único produto matricial (filtro casado).
+    :param signal: Array em ponto flutuante representando o sinal modulado ASK (ver SignalParams.from_samples).
     :param A: Amplitude da onda portadora.
     :param F: Frequência da onda portadora.
-    :param digi_mod: Tipo de modulação digital (3 para bipolar, caso contrário unipolar).
-    :param samples_per_bit: Número de amostras por bit no sinal modulado.
-    :return: Lista representando o stream de bits demodulado.
-    """
-    num_bits = len(signal) // 100
-    bit_stream = []
-
-    last_bit_one = -1
-    for i in range(num_bits):
-        # Extrair o segmento do sinal correspondente ao bit atual
-        segment = signal[i * 100:(i + 1) * 100]
-        
-        # Calcula a energia média do segmento
-        avg_amplitude = np.mean(np.abs(segment))
-
-        if digi_mod == "NRZ-Polar":
-            if avg_amplitude > A / 2:  # Limite para considerar presença de onda
-                bit_stream.append(1)
-            elif avg_amplitude < A / 4:  # Limite para ausência de onda
-                bit_stream.append(-1)
-        elif digi_mod == "Manchester":
-            if avg_amplitude > A / 2:
-                bit_stream.append(1)
-            elif avg_amplitude < A / 4:
-                bit_stream.append(0)
-        elif digi_mod == "Bipolar":
-            if avg_amplitude > A / 2:
-                if last_bit_one == 1:
-                    bit_stream.append(-1)
-                    last_bit_one = -1
-                else:
-                    bit_stream.append(1)
-                    last_bit_one = 1
-            elif avg_amplitude < A / 4:
-                bit_stream.append(0)
-    
-    return bit_stream
+    :param digi_mod: Tipo de modulação digital.
+    :param params: Parâmetros do sinal.
+    :return: Array int8 representando o stream de bits demodulado.
+    """
+    segments = symbol_segments(signal, params.samples_per_symbol)
+    carrier = carrier_waveforms(A, F, params).astype(segments.dtype)
+
+    # Estimativa da amplitude de cada símbolo pela projeção sobre a portadora
+    amplitudes = A * (segments @ carrier) / (carrier @ carrier)
 
-def demodulate_fsk(signal, A, F1, F2, digi_mod):
+    return levels_from_decisions(amplitudes > A / 2, digi_mod) # Limite para considerar presença de onda
+
+def demodulate_fsk(signal, A, F1, F2, digi_mod, params=DEFAULT_PARAMS):
     """
     Demodula um sinal FSK e reconstitui o bit stream original.
-    :param signal: Array representando o sinal modulado FSK.
+    Todos os símbolos são correlacionados com o banco de portadoras em um único produto matricial.
+    :param signal: Array em ponto flutuante representando o sinal modulado FSK (ver SignalParams.from_samples).
     :param A: Amplitude da onda portadora.
     :param F1: Frequência da onda portadora para o valor de tensão do bit 1.
     :param F2: Frequência da onda portadora para o valor de tensão do bit 0.
-    :param samples_per_bit: Número de amostras por bit no sinal modulado.
-    :return: Lista representando o stream de bits demodulado.
-    """
-    num_bits = len(signal) // 100
-    bit_stream = []
-
-    # Gera as portadoras para demodulação
-    t = np.arange(0, 100) / 100
-    carrier_f1 = A * np.sin(2 * np.pi * F1 * t)
-    carrier_f2 = A * np.sin(2 * np.pi * F2 * t)
-
-    last_bit_one = -1
-    for i in range(num_bits):
-        # Extrair o segmento do sinal correspondente ao bit atual
-        segment = signal[i * 100:(i + 1) * 100]
-
-        # Calcula a energia média para cada frequência portadora
-        energy_f1 = np.sum(segment * carrier_f1)
-        energy_f2 = np.sum(segment * carrier_f2)
-            
-        if digi_mod == "NRZ-Polar":
-            if energy_f1 > energy_f2:  # Limite para considerar presença de onda
-                bit_stream.append(1)
-            else:  # Limite para ausência de onda
-                bit_stream.append(-1)
-        elif digi_mod == "Manchester":
-            if energy_f1 > energy_f2:
-                bit_stream.append(1)
-            else:
-                bit_stream.append(0)
-        elif digi_mod == "Bipolar":
-            if energy_f1 > energy_f2:
-                if last_bit_one == 1:
-                    bit_stream.append(-1)
-                    last_bit_one = -1
-                else:
-                    bit_stream.append(1)
-                    last_bit_one = 1
-            else:
-                bit_stream.append(0)
-
-    return bit_stream
+    :param digi_mod: Tipo de modulação digital.
+    :param params: Parâmetros do sinal.
+    :return: Array int8 representando o stream de bits demodulado.
+    """
+    segments = symbol_segments(signal, params.samples_per_symbol)
+
+    # Banco de portadoras: uma coluna por frequência
+    carrier_bank = np.stack([carrier_waveforms(A, F1, params), carrier_waveforms(A, F2, params)], axis=1).astype(segments.dtype)
+    energies = segments @ carrier_bank
+
+    return levels_from_decisions(energies[:, 0] > energies[:, 1], digi_mod)
+
+def qam8_constellation(A):
+    """
+    Tabela com as coordenadas I/Q dos 8 pontos da constelação 8-QAM.
+    O índice da linha são os 3 bits do símbolo: o primeiro define a amplitude e os dois últimos a fase.
+    :param A: Amplitude base da onda portadora.
+    :return: Array (8, 2) com as componentes em fase (seno) e em quadratura (cosseno) de cada símbolo.
+    """
+    index = np.arange(8)
+    amplitude = np.where(index & 4, A, A / 2)
+    phase = (index & 3) * np.pi / 4
+    return np.stack([amplitude * np.cos(phase), amplitude * np.sin(phase)], axis=1)
+
+# Bits de cada símbolo 8-QAM, indexados pelo número do símbolo
+QAM8_BITS = (np.arange(8)[:, np.newaxis] >> np.array([2, 1, 0])) & 1
+
+def demodulate_qam8(signal, A, F, digi_mod, num_levels=None, params=DEFAULT_PARAMS):
+    """
+    Demodula um sinal 8-QAM de forma coerente e reconstitui o bit stream original.
+    Todos os símbolos são projetados sobre as referências seno/cosseno em um único produto matricial
+    e decididos pelo ponto mais próximo da constelação.
+    :param signal: Array em ponto flutuante representando o sinal modulado 8-QAM (ver SignalParams.from_samples).
+    :param A: Amplitude base da onda portadora.
+    :param F: Frequência da onda portadora.
+    :param digi_mod: Tipo de modulação digital.
+    :param num_levels: Número de tensões transmitidas, usado para descartar o preenchimento do último símbolo.
+    :param params: Parâmetros do sinal.
+    :return: Array int8 representando o stream de bits demodulado.
+    """
+    samples_per_symbol = params.samples_per_symbol
+    segments = symbol_segments(signal, samples_per_symbol)
+
+    # Referências em fase e em quadratura, normalizadas para que a projeção devolva a amplitude
+    t = np.linspace(0, 1 / params.symbol_rate, samples_per_symbol, endpoint=False)
+    references = np.stack([np.sin(2 * np.pi * F * t), np.cos(2 * np.pi * F * t)], axis=1) * 2 / samples_per_symbol
+    iq = segments @ references.astype(segments.dtype)
+
+    # Ponto mais próximo: maximiza <iq, c> - |c|²/2, equivalente a minimizar a distância euclidiana
+    constellation = qam8_constellation(A)
+    metric = iq @ constellation.T - 0.5 * np.sum(constellation ** 2, axis=1)
+    symbols = np.argmax(metric, axis=1)
+
+    decisions = QAM8_BITS[symbols].ravel()[:num_levels]
+    return levels_from_decisions(decisions.astype(bool), digi_mod)
 
 
 def demodulate_nrz_polar(binary_sequence):
     """
     Demodula um sinal NRZ polar e reconstitui o bit stream original.
     :param binary_sequence: Lista ou array representando o stream de bits.
-    :return: Lista representando o stream de bits demodulado.
-    """
-    # Percorrer o sinal e converter as tensões em bits
-    demodutaled_bits = []
-    for bit in binary_sequence:
-        if bit == 1:
-            demodutaled_bits.extend([1])
-        else:
-            demodutaled_bits.extend([0])
-    
-    return demodutaled_bits
+    :return: Array uint8 representando o stream de bits demodulado.
+    """
+    # Converte as tensões em bits: +V é o bit 1
+    return (np.asarray(binary_sequence) == 1).astype(np.uint8)
 
 def demodulate_manchester(binary_sequence):
     """
     Função para demodulação Manchester.
     :param signal: Sinal modulado em Manchester.
-    :return: Lista de bits demodulados e eixo do tempo correspondente.
+    :return: Array uint8 de bits demodulados.
     """
-    demodulated_bits = []
+    # Cada bit é representado por dois valores; um valor sem par no final é ignorado
+    levels = np.asarray(binary_sequence)
+    pairs = levels[:len(levels) - len(levels) % 2].reshape(-1, 2)
     
-    # Percorrer o sinal em pares de valores (cada bit é representado por dois valores)
-    for i in range(0, len(binary_sequence), 2):
-        # Detectar a transição no meio do bit
-        if binary_sequence[i] == 0 and binary_sequence[i + 1] == 1:
-            demodulated_bits.append(0)  # Transição de 0 para 1
-        elif binary_sequence[i] == 1 and binary_sequence[i + 1] == 0:
-            demodulated_bits.append(1)  # Transição de 1 para 0
-
-    return demodulated_bits
+    # Transição de 1 para 0 é o bit 1 e de 0 para 1 é o bit 0; pares sem transição no meio do bit são descartados
+    transitions = ((pairs[:, 0] == 1) & (pairs[:, 1] == 0)) | ((pairs[:, 0] == 0) & (pairs[:, 1] == 1))
+    return pairs[transitions, 0].astype(np.uint8)
 
 def demodulate_bipolar(binary_sequence):
     """
     Função para demodulação bipolar.
     :param signal: Sinal modulado em bipolar.
-    :return: Lista de bits demodulados e eixo do tempo correspondente.
+    :return: Array uint8 de bits demodulados.
     """
-    demodulated_bits = []
-    
-    # Percorrer o sinal e converter as tensões em bits
-    for bit in binary_sequence:
-        if bit == 1 or bit == -1:
-            demodulated_bits.append(1)
-        else:
-            demodulated_bits.append(0)
+    # Converte as tensões em bits: +V e -V são o bit 1
+    return (np.abs(np.asarray(binary_sequence)) == 1).astype(np.uint8)
 
-    return demodulated_bits
+def carrier_waveforms(A, F, params=DEFAULT_PARAMS):
+    """
+    Calcula uma única vez a forma de onda da portadora para um intervalo de símbolo.
+    :param A: Amplitude da onda portadora.
+    :param F: Frequência da onda portadora.
+    :param params: Parâmetros do sinal (amostras por símbolo e taxa de amostragem).
+    :return: Array em ponto flutuante com as amostras da portadora em um intervalo de símbolo.
+    """
+    j = np.arange(params.samples_per_symbol)
+    return A * np.sin(2 * np.pi * F * j / params.sample_rate)
 
-def add_error(binary_sequence):
+def carrier_modulation(waveforms, bit_stream, digi_mod):
     """
-    Função para emular erros de transmissão à sequência binária.	
+    Monta o sinal modulado por portadora copiando a forma de onda pré-calculada de cada símbolo.
+    :param waveforms: Array (2, amostras) com a forma de onda do bit 0 (linha 0) e do bit 1 (linha 1).
+    :param bit_stream: Lista ou array representando o stream de bits.
+    :param digi_mod: Tipo de modulação digital.
+    :return: Array representando o sinal modulado.
     """
-    # Define a probabilidade de erro
-    error_probability = 0.01 
+    levels = np.asarray(bit_stream)
+    if digi_mod == "Bipolar": # Se for bipolar
+        symbols = levels != 0 # Inclui a tensão -1 V como bit 1
+    else:
+        symbols = levels == 1
 
-    # Itera sobre a sequência binária e aplica a chance de inverter cada bit
-    for i in range(len(binary_sequence)):
-        if random.random() <= error_probability:
-            # Inverte o bit
-            binary_sequence[i] = 1 - binary_sequence[i]
-    return binary_sequence
+    # Uma única indexação monta todos os símbolos de uma vez
+    return waveforms[symbols.astype(np.intp)].ravel()
 
-def ask_modulation(A, F, bit_stream, digi_mod):
+def ask_modulation(A, F, bit_stream, digi_mod, params=DEFAULT_PARAMS):
     """
     Realiza modulação ASK (Amplitude Shift Keying) em um stream de bits.
     :param A: Amplitude da onda portadora.
     :param F: Frequência da onda portadora.
     :param bit_stream: Lista ou array representando o stream de bits.
     :param digi_mod: Tipo de modulação digital.
-    :return: Array representando o sinal modulado ASK.
+    :param params: Parâmetros do sinal.
+    :return: Array representando o sinal modulado ASK, no tipo de amostra configurado.
     """
-    sig_size = len(bit_stream)
-    signal = np.zeros(sig_size * 100)  # Inicializa o array para o sinal modulado
-    
-    for i in range(sig_size):
-        if digi_mod == "Bipolar": # Se for bipolar
-            if bit_stream[i] in (1, -1): # Inclui a tensão -1 V como bit 1 
-                for j in range(100):
-                    signal[(i * 100) + j] = A * np.sin(2 * np.pi * F * j / 100)
-            else:
-                for j in range(100):
-                    signal[(i * 100) + j] = 0
-        else:
-            if bit_stream[i] == 1:
-                for j in range(100):
-                    signal[(i * 100) + j] = A * np.sin(2 * np.pi * F * j / 100)
-            else:
-                for j in range(100):
-                    signal[(i * 100) + j] = 0
-
-    return signal
-
-def fsk_modulation(A, F1, F2, bit_stream, digi_mod):
+    carrier = carrier_waveforms(A, F, params)
+    waveforms = params.to_samples(np.stack([np.zeros_like(carrier), carrier])) # Bit 0 sem portadora, bit 1 com portadora
+    return carrier_modulation(waveforms, bit_stream, digi_mod)
+
+def fsk_modulation(A, F1, F2, bit_stream, digi_mod, params=DEFAULT_PARAMS):
     """
     Realiza modulação FSK (Frequency Shift Keying) em um stream de bits.
     :param A: Amplitude da onda portadora.
@@ -200,80 +255,191 @@ def fsk_modulation(A, F1, F2, bit_stream, digi_mod):
     :param F2: Frequência da onda portadora para o valor de tensão do bit 0.
     :param bit_stream: Lista ou array representando o stream de bits.
     :param digi_mod: Tipo de modulação digital.
-    :return: Array representando o sinal modulado FSK.
+    :param params: Parâmetros do sinal.
+    :return: Array representando o sinal modulado FSK, no tipo de amostra configurado.
     """
-    sig_size = len(bit_stream)
-    signal = np.zeros(sig_size * 100)  # Inicializa o array para o sinal modulado
-    
-    for i in range(sig_size):
-        if digi_mod == "Bipolar": # Se for bipolar
-            if bit_stream[i] in (1, -1): # Inclui a tensão -1 V como bit 1 
-                for j in range(100):
-                    signal[(i * 100) + j] = A * np.sin(2 * np.pi * F1 * j / 100)
-            else:
-                for j in range(100):
-                    signal[(i * 100) + j] = A * np.sin(2 * np.pi * F2 * j / 100)
-        else:
-            if bit_stream[i] == 1:
-                for j in range(100):
-                    signal[(i * 100) + j] = A * np.sin(2 * np.pi * F1 * j / 100)
-            else:
-                for j in range(100):
-                    signal[(i * 100) + j] = A * np.sin(2 * np.pi * F2 * j / 100)
-
-    return signal
-
-def main(digital_modulation_selected, analogical_modulation_selected, binary_input):
+    waveforms = params.to_samples(np.stack([carrier_waveforms(A, F2, params), carrier_waveforms(A, F1, params)]))
+    return carrier_modulation(waveforms, bit_stream, digi_mod)
+
+def qam8_waveforms(A, F, params=DEFAULT_PARAMS):
+    """
+    Calcula a forma de onda de cada um dos 8 símbolos da constelação 8-QAM.
+    :param A: Amplitude base da onda portadora.
+    :param F: Frequência da onda portadora.
+    :param params: Parâmetros do sinal (amostras por símbolo e taxa de símbolos).
+    :return: Array (8, amostras por símbolo) em ponto flutuante, indexado pelos 3 bits do símbolo.
+    """
+    t = np.linspace(0, 1 / params.symbol_rate, params.samples_per_symbol, endpoint=False)  # Intervalo de tempo para um símbolo
+    index = np.arange(8)
+    amplitude = np.where(index & 4, A, A / 2)
+    phase = (index & 3) * np.pi / 4
+    return amplitude[:, np.newaxis] * np.sin(2 * np.pi * F * t + phase[:, np.newaxis])
+
+def qam8_symbols(bit_stream, digi_mod):
+    """
+    Agrupa o stream de bits em símbolos de 3 bits, completando o último símbolo com bits 0.
+    :param bit_stream: Lista ou array representando o stream de bits.
+    :param digi_mod: Tipo de modulação digital.
+    :return: Array com o índice (0 a 7) de cada símbolo.
+    """
+    levels = np.asarray(bit_stream)
+    if digi_mod == "Bipolar":
+        ones = levels != 0 # Inclui a tensão -1 V como bit 1
+    else:
+        ones = levels == 1
+
+    symbols = np.zeros(-(-len(ones) // 3), dtype=np.intp)
+    for shift in range(3):
+        column = ones[shift::3]
+        symbols[:len(column)] |= column.astype(np.intp) << (2 - shift)
+    return symbols
+
+def qam8_modulation(A, F, bit_stream, digi_mod, params=DEFAULT_PARAMS):
+    """
+    Realiza modulação 8-QAM (Quadrature Amplitude Modulation com 8 estados) em um stream de bits.
+    :param A: Amplitude base da onda portadora.
+    :param F: Frequência da onda portadora.
+    :param bit_stream: Lista ou array representando o stream de bits.
+    :param digi_mod: Tipo de modulação digital.
+    :param params: Parâmetros do sinal.
+    :return: Array representando o sinal modulado 8-QAM, no tipo de amostra configurado.
+    """
+    return params.to_samples(qam8_waveforms(A, F, params))[qam8_symbols(bit_stream, digi_mod)].ravel()
+
+# Os gráficos são renderizados por uma única thread em segundo plano, fora do caminho de transmissão
+plot_executor = None
+pending_plots = {} # Caminho do arquivo -> renderização agendada
+
+def min_max_envelope(signal, max_points=4000):
+    """
+    Decima o sinal para plotagem mantendo o mínimo e o máximo de cada intervalo, de forma que o custo de
+    renderização seja limitado independentemente do tamanho do quadro.
+    :param signal: Array representando o sinal.
+    :param max_points: Número máximo de pontos devolvidos.
+    :return: Eixo x (índice das amostras) e valores do envelope.
+    """
+    signal = np.asarray(signal)
+    if len(signal) <= max_points:
+        return np.arange(len(signal)), signal
+
+    width = -(-len(signal) // (max_points // 2)) # Amostras por intervalo
+    starts = np.arange(0, len(signal), width)
+    envelope = np.column_stack([np.minimum.reduceat(signal, starts), np.maximum.reduceat(signal, starts)])
+    return np.repeat(starts, 2), envelope.ravel()
+
+def render_plot(path, x, y, title, xlabel, figsize, steps=False):
+    """
+    Renderiza um gráfico e salva em arquivo.
+    Usa a API orientada a objetos do matplotlib (sem pyplot), que pode rodar fora da thread principal.
+    :param path: Caminho do arquivo PNG.
+    :param x: Eixo x.
+    :param y: Valores a serem plotados.
+    :param title: Título do gráfico.
+    :param xlabel: Rótulo do eixo x.
+    :param figsize: Tamanho da figura.
+    :param steps: Se verdadeiro, desenha o sinal em degraus (sinal digital).
+    """
+    from matplotlib.figure import Figure # Importado apenas quando algum gráfico é gerado
+
+    figure = Figure(figsize=figsize)
+    axes = figure.subplots()
+    if steps:
+        axes.plot(x, y, drawstyle='steps-post', label="Sinal")
+        axes.legend()
+    else:
+        axes.plot(x, y)
+    axes.set_title(title)
+    axes.set_xlabel(xlabel)
+    axes.set_ylabel("Amplitude")
+    axes.grid(True)
+    # Salva em um arquivo temporário e o renomeia, para que a interface nunca carregue uma imagem pela metade
+    # (os quadros podem ser processados em vários processos ao mesmo tempo)
+    temporary_path = f"{path}.{os.getpid()}.tmp"
+    figure.savefig(temporary_path, format=os.path.splitext(path)[1][1:])
+    os.replace(temporary_path, path)
+
+def submit_plot(path, x, y, title, xlabel, figsize, steps=False):
+    """
+    Agenda a renderização de um gráfico em segundo plano, sem bloquear quem chamou.
+    Se um gráfico anterior para o mesmo arquivo ainda não começou a ser renderizado, ele é descartado.
+    """
+    global plot_executor
+    if plot_executor is None:
+        plot_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="plot")
+
+    previous = pending_plots.get(path)
+    if previous is not None:
+        previous.cancel()
+    pending_plots[path] = plot_executor.submit(render_plot, path, x, y, title, xlabel, figsize, steps)
+
+def plot_digital_signal(path, signal, title):
+    """
+    Agenda o gráfico de um sinal digital (em degraus), decimado para um número limitado de pontos.
+    """
+    x, y = min_max_envelope(signal)
+    # Correção do eixo x para plotagem: repete o último valor até o fim do último bit
+    x = np.append(x, len(signal))
+    y = np.append(y, y[-1] if len(y) else 0)
+    submit_plot(path, x, y, title, "Tempo", (10, 4), steps=True)
+
+def plot_analog_signal(path, signal, title):
+    """
+    Agenda o gráfico de um sinal modulado por portadora, decimado para um número limitado de pontos.
+    """
+    x, y = min_max_envelope(signal)
+    submit_plot(path, x, y, title, "Amostras", (12, 4))
+
+def wait_for_plots():
+    """
+    Aguarda a renderização dos gráficos agendados (por exemplo, antes de a interface carregar as imagens).
+    """
+    for path, future in list(pending_plots.items()):
+        if not future.cancelled():
+            future.result()
+        if pending_plots.get(path) is future:
+            del pending_plots[path]
+
+def main(digital_modulation_selected, analogical_modulation_selected, binary_input, num_bits=None, params=DEFAULT_PARAMS, plot=False, channel=None, plot_prefix="demodulacao"):
     """
     Função principal para decodificação da camada física.
     :param digital_modulation_selected: Modulação digital selecionada.
     :param analogical_modulation_selected: Modulação analógica selecionada.
     :param binary_input: Sequência binária de entrada.
+    :param num_bits: Número de bits do quadro transmitido (necessário para remover o preenchimento do 8-QAM).
+    :param params: Parâmetros do sinal usados pelo transmissor.
+    :param plot: Se verdadeiro, os gráficos são gerados em segundo plano (ver wait_for_plots).
+    :param channel: Canal para emular erros de transmissão (ver canal.py); atua sobre as amostras ou sobre os bits demodulados.
+    :param plot_prefix: Caminho dos gráficos sem o final: {plot_prefix}_analogica.png e {plot_prefix}_digital.png.
     :return: Sequência de bits demodulada.
     """
-    # Adicionar erro à sequência binária
-    binary_input = add_error(binary_input)
+    # Converte as amostras recebidas (possivelmente em ponto fixo) para ponto flutuante
+    binary_input = params.from_samples(binary_input)
+
+    # Adicionar erro às amostras recebidas
+    if channel is not None and channel.domain == "samples":
+        binary_input = channel(binary_input)
     
     # Demodulação analógica
     # As funções de modulação foram replicadas do arquivo camada_fisica.py para evitar qualquer dependência entre transmissor e receptor
     # Elas foram úteis para montar novamente o gráfico do sinal exibido na interface
     if analogical_modulation_selected == "ASK":
-        signal = demodulate_ask(binary_input, 1, 1, digital_modulation_selected)
-        signal_to_plot = ask_modulation(1, 1, signal, digital_modulation_selected)
+        signal = demodulate_ask(binary_input, params.amplitude, params.carrier_frequency, digital_modulation_selected, params)
+        remodulate = lambda: ask_modulation(params.amplitude, params.carrier_frequency, signal, digital_modulation_selected, params)
     elif analogical_modulation_selected == "FSK":
-        signal = demodulate_fsk(binary_input, 1, 1, 3, digital_modulation_selected)
-        signal_to_plot = fsk_modulation(1, 1, 3, signal, digital_modulation_selected)
+        signal = demodulate_fsk(binary_input, params.amplitude, params.fsk_frequency_one, params.fsk_frequency_zero, digital_modulation_selected, params)
+        remodulate = lambda: fsk_modulation(params.amplitude, params.fsk_frequency_one, params.fsk_frequency_zero, signal, digital_modulation_selected, params)
     elif analogical_modulation_selected == "8-QAM":
-        pass
-
-    
-    # Plotar o sinal analógico demodulado
-    plt.figure(figsize=(12, 4))
-    plt.plot(signal_to_plot)
-    plt.title(f"Sinal {analogical_modulation_selected} Demodulado")
-    plt.xlabel("Amostras")
-    plt.ylabel("Amplitude")
-    plt.grid(True)
-    plt.savefig(f"demodulacao_analogica.png")
-    plt.close()  # Fecha a figura para liberar memória
+        num_levels = None
+        if num_bits is not None:
+            # Manchester transmite duas tensões por bit
+            num_levels = num_bits * 2 if digital_modulation_selected == "Manchester" else num_bits
+        signal = demodulate_qam8(binary_input, params.amplitude, params.carrier_frequency, digital_modulation_selected, num_levels, params)
+        remodulate = lambda: qam8_modulation(params.amplitude, params.carrier_frequency, signal, digital_modulation_selected, params)
     
-    # Geração do eixo do tempo
-    time = np.linspace(0, len(signal), len(signal), endpoint=False)
-    
-    # Correção do eixo x para plotagem
-    time_extended = np.append(time, time[-1] + (time[1] - time[0]))
-    signal_extended = np.append(signal, signal[-1])
-    
-    # Plotar o sinal digital demodulado
-    plt.figure(figsize=(10, 4))
-    plt.plot(time_extended, signal_extended, drawstyle='steps-post', label="Sinal")
-    plt.title(f"Demodulação {digital_modulation_selected}")
-    plt.xlabel("Tempo")
-    plt.ylabel("Amplitude")
-    plt.grid(True)
-    plt.legend()
-    plt.savefig(f"demodulacao_digital.png")
-    plt.close()  # Fecha a figura para liberar memória
+    # Plotar os sinais analógico e digital demodulados (a remodulação só é feita quando há gráfico)
+    if plot:
+        plot_analog_signal(f"{plot_prefix}_analogica.png", remodulate(), f"Sinal {analogical_modulation_selected} Demodulado")
+        plot_digital_signal(f"{plot_prefix}_digital.png", signal, f"Demodulação {digital_modulation_selected}")
     
     # Modulação digital
     if digital_modulation_selected == "NRZ-Polar":
@@ -283,4 +449,8 @@ def main(digital_modulation_selected, analogical_modulation_selected, binary_inp
     elif digital_modulation_selected == "Bipolar":
         bit_stream = demodulate_bipolar(signal)
 
+    # Adicionar erro à sequência binária demodulada
+    if channel is not None and channel.domain == "bits":
+        bit_stream = channel(bit_stream)
+
     return bit_stream
\ No newline at end of file
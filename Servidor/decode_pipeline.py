@@ -0,0 +1,183 @@
+from dataclasses import dataclass
+from functools import partial
+import numpy as np
+
+import decode_camada_enlace as dce
+import decode_camada_fisica as dcf
+
+@dataclass(frozen=True)
+class CodecConfig:
+    """
+    Configuração completa de codificação de um enlace, com os mesmos nomes usados na interface.
+    Replicada do transmissor (pipeline.py) para evitar qualquer dependência entre transmissor e receptor.
+    """
+    digital_mod: str
+    analog_mod: str
+    framing: str
+    error_detection: str
+    error_correction: str
+    params: dcf.SignalParams = dcf.DEFAULT_PARAMS
+
+# Etapas da camada de enlace, na ordem em que são desfeitas; opções ausentes das tabelas não fazem nada
+ERROR_CORRECTIONS = {"Hamming": dce.decode_hamming, "Convolucional": dce.decode_convolutional}
+ERROR_DETECTIONS = {"Bit de Paridade": dce.decode_parity_bit}
+ERROR_DETECTIONS.update({standard: partial(dce.decode_crc, standard=standard) for standard in ["CRC", *dce.CRC_STANDARDS]})
+FRAMINGS = {
+    "Contagem de Caracteres": dce.decode_char_count,
+    "Inserção de Bytes": dce.decode_byte_insertion,
+    "Inserção de Bits": dce.decode_char_insertion,
+}
+
+class DecodePipeline:
+    """
+    Cadeia de decodificação do receptor montada uma única vez para uma configuração:
+    portadora -> codificação de linha -> correção de erros -> detecção de erros -> desenquadramento.
+    As referências do filtro casado são calculadas na construção, e as projeções dos símbolos são escritas em um
+    buffer reaproveitado entre as chamadas, que só cresce quando um quadro maior aparece.
+    Com o código convolucional sobre ASK ou FSK (sem Manchester), o decodificador de Viterbi recebe decisões
+    suaves: a confiança de cada bit, tirada diretamente das projeções.
+    """
+
+    def __init__(self, config, channel=None):
+        """
+        :param config: Configuração de codificação (CodecConfig).
+        :param channel: Canal para emular erros de transmissão (ver canal.py), ou None.
+        """
+        if config.digital_mod not in ("NRZ-Polar", "Manchester", "Bipolar"):
+            raise ValueError(f"Modulação digital inválida: {config.digital_mod}")
+        self.config = config
+        self.channel = channel
+        self.link_stages = [
+            stage for stage in (
+                ERROR_CORRECTIONS.get(config.error_correction),
+                ERROR_DETECTIONS.get(config.error_detection),
+                FRAMINGS.get(config.framing),
+            ) if stage is not None
+        ]
+
+        # Tipo em ponto flutuante das amostras depois da conversão de SignalParams.from_samples
+        params = config.params
+        sample_dtype = params.from_samples(np.zeros(0, dtype=dcf.SAMPLE_DTYPES[params.dtype])).dtype
+        self.references = self.reference_matrix().astype(sample_dtype)
+        self.projections = np.empty((0, self.references.shape[1]), dtype=sample_dtype)
+
+        # Decisão suave apenas quando cada símbolo carrega exatamente um bit e o canal não atua sobre os bits
+        self.soft = (
+            config.error_correction == "Convolucional"
+            and config.analog_mod in ("ASK", "FSK")
+            and config.digital_mod != "Manchester"
+            and (channel is None or channel.domain != "bits")
+        )
+        if config.analog_mod == "FSK":
+            # Energia da portadora em um símbolo, que normaliza a diferença entre as projeções do FSK
+            self.symbol_energy = self.references[:, 0] @ self.references[:, 0]
+
+        if config.analog_mod == "8-QAM":
+            # Métrica do ponto mais próximo: <iq, c> - |c|²/2 para cada ponto c da constelação
+            constellation = dcf.qam8_constellation(params.amplitude)
+            self.constellation = constellation.T
+            self.constellation_offset = 0.5 * np.sum(constellation ** 2, axis=1)
+
+    def reference_matrix(self):
+        """
+        Monta a matriz do filtro casado: uma coluna por forma de onda de referência.
+        :return: Array (amostras por símbolo, referências) em ponto flutuante.
+        """
+        params = self.config.params
+        A = params.amplitude
+        if self.config.analog_mod == "ASK":
+            # Projeção normalizada, que devolve a amplitude estimada do símbolo
+            carrier = dcf.carrier_waveforms(A, params.carrier_frequency, params)
+            return (A * carrier / (carrier @ carrier))[:, np.newaxis]
+        if self.config.analog_mod == "FSK":
+            return np.stack([dcf.carrier_waveforms(A, params.fsk_frequency_one, params), dcf.carrier_waveforms(A, params.fsk_frequency_zero, params)], axis=1)
+        if self.config.analog_mod == "8-QAM":
+            # Referências em fase e em quadratura, normalizadas para que a projeção devolva a amplitude
+            t = np.linspace(0, 1 / params.symbol_rate, params.samples_per_symbol, endpoint=False)
+            F = params.carrier_frequency
+            return np.stack([np.sin(2 * np.pi * F * t), np.cos(2 * np.pi * F * t)], axis=1) * 2 / params.samples_per_symbol
+        raise ValueError(f"Modulação analógica inválida: {self.config.analog_mod}")
+
+    def decisions(self, projections, num_levels):
+        """
+        Decide a presença do bit 1 em cada tensão a partir das projeções dos símbolos.
+        :param projections: Array (símbolos, referências) com as projeções.
+        :param num_levels: Número de tensões transmitidas (descarta o preenchimento do 8-QAM), ou None.
+        :return: Array booleano com uma decisão por tensão.
+        """
+        if self.config.analog_mod == "ASK":
+            return projections[:, 0] > self.config.params.amplitude / 2
+        if self.config.analog_mod == "FSK":
+            return projections[:, 0] > projections[:, 1]
+        symbols = np.argmax(projections @ self.constellation - self.constellation_offset, axis=1)
+        return dcf.QAM8_BITS[symbols].ravel()[:num_levels].astype(bool)
+
+    def soft_decisions(self, projections):
+        """
+        Estima a confiança (de 0 a 1) de que cada símbolo carrega o bit 1, a partir das projeções.
+        :param projections: Array (símbolos, referências) com as projeções.
+        :return: Array em ponto flutuante com um valor por bit.
+        """
+        if self.config.analog_mod == "ASK":
+            confidence = projections[:, 0] / self.config.params.amplitude
+        else:
+            confidence = 0.5 + (projections[:, 0] - projections[:, 1]) / (2 * self.symbol_energy)
+        return np.clip(confidence, 0.0, 1.0)
+
+    def demodulate(self, samples, num_bits=None):
+        """
+        Desfaz a portadora e a codificação de linha.
+        As decisões já são os bits no NRZ-Polar e no Bipolar; só o Manchester precisa ser decodificado aos pares.
+        :param samples: Amostras recebidas, no tipo configurado.
+        :param num_bits: Número de bits do quadro transmitido (necessário para remover o preenchimento do 8-QAM).
+        :return: Array uint8 de bits demodulados (ou, com decisão suave, a confiança de cada bit).
+        """
+        signal = self.config.params.from_samples(samples)
+        if self.channel is not None and self.channel.domain == "samples":
+            signal = self.channel(signal)
+
+        # Filtro casado de todos os símbolos em um único produto, escrito no buffer de projeções
+        segments = dcf.symbol_segments(signal, self.config.params.samples_per_symbol)
+        if len(self.projections) < len(segments):
+            self.projections = np.empty((max(len(segments), 2 * len(self.projections)), self.references.shape[1]), dtype=self.projections.dtype)
+        projections = np.matmul(segments, self.references, out=self.projections[:len(segments)])
+
+        if self.soft:
+            return self.soft_decisions(projections)
+
+        num_levels = None
+        if num_bits is not None:
+            # Manchester transmite duas tensões por bit
+            num_levels = num_bits * 2 if self.config.digital_mod == "Manchester" else num_bits
+        decisions = self.decisions(projections, num_levels)
+
+        if self.config.digital_mod == "Manchester":
+            bits = dcf.demodulate_manchester(decisions.astype(np.int8))
+        else:
+            bits = decisions.astype(np.uint8)
+
+        if self.channel is not None and self.channel.domain == "bits":
+            bits = self.channel(bits)
+        return bits
+
+    def decode(self, binary_sequence):
+        """
+        Desfaz as etapas da camada de enlace.
+        :param binary_sequence: Lista ou array de bits do quadro demodulado (ou valores de confiança, com decisão suave).
+        :return: Array de bits com os dados do quadro.
+        """
+        binary_sequence = np.asarray(binary_sequence)
+        if not self.soft:
+            binary_sequence = binary_sequence.astype(np.uint8, copy=False)
+        for stage in self.link_stages:
+            binary_sequence = stage(binary_sequence)
+        return binary_sequence
+
+    def __call__(self, samples, num_bits=None):
+        """
+        Demodula e decodifica um quadro.
+        :param samples: Amostras recebidas.
+        :param num_bits: Número de bits do quadro transmitido.
+        :return: Array de bits com os dados do quadro.
+        """
+        return self.decode(self.demodulate(samples, num_bits))
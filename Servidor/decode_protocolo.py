@@ -0,0 +1,129 @@
+import json
+import struct
+from dataclasses import dataclass
+import numpy as np
+
+import decode_camada_fisica as dcf
+import decode_pipeline as dpl
+
+# Uma conexão carrega uma sessão: a configuração de codificação chega uma única vez, em uma mensagem de texto
+# {"type": "config", ...}, e vale para todos os quadros seguintes da conexão, até a próxima configuração.
+
+# Formato binário das mensagens de quadro (replicado do transmissor, protocolo.py):
+# cabeçalho fixo (little-endian) seguido das amostras brutas no tipo de amostra da sessão.
+MAGIC = b"TR1Q"
+VERSION = 2
+FRAME_HEADER = struct.Struct("<4sBB2xIII4x")
+HAS_SEQ = 0x01 # Indicador: o quadro tem número de sequência (ARQ)
+
+# Tamanho máximo de uma mensagem de quadro (o mesmo usado pelo transmissor para dimensionar os segmentos)
+MAX_MESSAGE_BYTES = 1 << 22
+
+# Opções de configuração aceitas
+DIGITAL_MODS = ("NRZ-Polar", "Manchester", "Bipolar")
+ANALOG_MODS = ("ASK", "FSK", "8-QAM")
+FRAMINGS = ("Nenhum", "Contagem de Caracteres", "Inserção de Bytes", "Inserção de Bits")
+ERROR_DETECTIONS = ("Nenhum", "Bit de Paridade", "CRC", "CRC-8", "CRC-16-CCITT", "CRC-32")
+ERROR_CORRECTIONS = ("Nenhum", "Hamming", "Convolucional")
+ARQ_MODES = (None, "Go-Back-N", "Selective Repeat")
+
+@dataclass(frozen=True)
+class Session:
+    """
+    Sessão de uma conexão: a configuração de codificação dos quadros e o protocolo de retransmissão.
+    """
+    config: dpl.CodecConfig
+    arq: str = None
+    window: int = 1
+
+def check_option(options, name, kind):
+    """
+    Verifica se uma opção de configuração é aceita.
+    :param options: Tupla com os nomes aceitos.
+    :param name: Nome recebido.
+    :param kind: Descrição da opção, para a mensagem de erro.
+    :return: O nome recebido.
+    """
+    if name not in options:
+        raise ValueError(f"Valor inválido para {kind}: {name}")
+    return name
+
+def decode_config(message):
+    """
+    Lê a configuração de uma sessão (mensagem {"type": "config", ...} ou mensagem de quadro completa em JSON).
+    :param message: Dicionário da mensagem.
+    :return: Sessão (Session).
+    """
+    params = dcf.SignalParams(**message["params"]) if "params" in message else dcf.DEFAULT_PARAMS
+    config = dpl.CodecConfig(
+        check_option(DIGITAL_MODS, message.get("digital_mod"), "modulação digital"),
+        check_option(ANALOG_MODS, message.get("analog_mod"), "modulação analógica"),
+        check_option(FRAMINGS, message.get("framing"), "enquadramento"),
+        check_option(ERROR_DETECTIONS, message.get("error_detection"), "detecção de erros"),
+        check_option(ERROR_CORRECTIONS, message.get("error_correction"), "correção de erros"),
+        params,
+    )
+    window = message.get("window", 1)
+    if not isinstance(window, int) or window < 1:
+        raise ValueError(f"Janela inválida: {window}")
+    return Session(config, check_option(ARQ_MODES, message.get("arq"), "protocolo de retransmissão"), window)
+
+def decode_binary(payload, session):
+    """
+    Lê uma mensagem de quadro no formato binário.
+    As amostras não são copiadas: o array devolvido é uma visão somente leitura dos bytes recebidos.
+    :param payload: Bytes da mensagem.
+    :param session: Sessão da conexão, que define a configuração do quadro.
+    :return: Dicionário com o quadro (array NumPy), o número de bits, o número de sequência (ou None) e a sessão.
+    """
+    if session is None:
+        raise ValueError("Quadro recebido antes da configuração da sessão")
+    if len(payload) < FRAME_HEADER.size:
+        raise ValueError("Mensagem binária menor que o cabeçalho")
+    magic, version, flags, seq, num_bits, num_samples = FRAME_HEADER.unpack_from(payload)
+    if magic != MAGIC:
+        raise ValueError("Mensagem binária com identificador inválido")
+    if version != VERSION:
+        raise ValueError(f"Versão do formato binário não suportada: {version}")
+
+    sample_dtype = np.dtype(dcf.SAMPLE_DTYPES[session.config.params.dtype]).newbyteorder("<")
+    if len(payload) != FRAME_HEADER.size + num_samples * sample_dtype.itemsize:
+        raise ValueError("Tamanho da mensagem binária não corresponde ao número de amostras")
+    return {
+        "quadro": np.frombuffer(payload, dtype=sample_dtype, count=num_samples, offset=FRAME_HEADER.size),
+        "num_bits": num_bits,
+        "seq": seq if flags & HAS_SEQ else None,
+        "session": session,
+    }
+
+def decode_json(message, session):
+    """
+    Lê uma mensagem de quadro em JSON (formato legível, usado para depuração).
+    Uma mensagem com as configurações completas (como as do formato antigo) não depende da sessão.
+    :param message: Dicionário da mensagem.
+    :param session: Sessão da conexão, ou None.
+    :return: Dicionário com o quadro (array NumPy), o número de bits, o número de sequência (ou None) e a sessão.
+    """
+    if "digital_mod" in message:
+        session = decode_config(message)
+    elif session is None:
+        raise ValueError("Quadro recebido antes da configuração da sessão")
+    return {
+        "quadro": np.array(message.get("quadro", [])),
+        "num_bits": message.get("num_bits"),
+        "seq": message.get("seq"),
+        "session": session,
+    }
+
+def decode_message(data, session=None):
+    """
+    Lê uma mensagem de quadro recebida pelo WebSocket: frames binários usam o formato binário e frames de texto, JSON.
+    :param data: Bytes, texto JSON ou dicionário já decodificado do JSON.
+    :param session: Sessão da conexão, ou None se nenhuma configuração foi recebida.
+    :return: Dicionário com o quadro (array NumPy), o número de bits, o número de sequência (ou None) e a sessão.
+    """
+    if isinstance(data, (bytes, bytearray, memoryview)):
+        return decode_binary(data, session)
+    if isinstance(data, str):
+        data = json.loads(data)
+    return decode_json(data, session)
@@ -0,0 +1,130 @@
+import atexit
+import itertools
+import multiprocessing
+import os
+import shutil
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+import numpy as np
+
+import decode_camada_enlace as dce
+import decode_camada_fisica as dcf
+import decode_pipeline as dpl
+import decode_protocolo as dp
+
+# Processamento dos quadros nos processos do pool do servidor (ver server.py).
+# Este módulo não importa a interface gráfica, então pode ser carregado pelos processos sem o GTK.
+
+# Canal do processo, definido por init_worker
+channel = None
+
+# Pasta temporária e contador dos gráficos do processo, criados no primeiro quadro com gráficos
+plot_dir = None
+plot_counter = itertools.count()
+
+def init_worker(worker_channel, seeds=None):
+    """
+    Inicializa um processo do pool com a sua cópia do canal.
+    Todos os processos recebem o mesmo estado do gerador pseudoaleatório, então cada um retira da fila seeds a sua
+    própria semente, derivada da semente do canal (ver make_executor): com a mesma semente, o n-ésimo processo
+    iniciado sorteia sempre a mesma sequência. O ruído aplicado a um quadro depende, porém, do processo que o
+    decodifica e de quantos quadros esse processo já tratou, o que varia de uma execução para outra; para reproduzir
+    exatamente o ruído de cada quadro, use um único processo. O estado de canais com memória (como o de
+    Gilbert-Elliott) também é mantido por processo.
+    :param worker_channel: Canal para emular erros de transmissão (ver canal.py), ou None.
+    :param seeds: Fila com as sementes (numpy.random.SeedSequence) dos processos, ou None se o canal não sorteia.
+    """
+    global channel
+    channel = worker_channel
+    if seeds is not None:
+        channel.rng = np.random.default_rng(seeds.get())
+
+def make_executor(worker_channel, workers=None):
+    """
+    Cria o pool de processos que decodifica os quadros.
+    Os processos usam o contexto "spawn", que evita copiar as threads do GTK, e cada um recebe uma semente própria,
+    derivada deterministicamente da semente do canal (SeedSequence.spawn), na ordem em que os processos iniciam.
+    :param worker_channel: Canal para emular erros de transmissão (ver canal.py), ou None.
+    :param workers: Número de processos do pool, ou None para o número de CPUs.
+    :return: ProcessPoolExecutor que executa decode_payload.
+    """
+    workers = workers or os.cpu_count()
+    if workers < 1:
+        raise ValueError("O pool deve ter pelo menos um processo")
+    context = multiprocessing.get_context("spawn")
+    seeds = None
+    if worker_channel is not None and hasattr(worker_channel, "rng"):
+        seeds = context.Queue()
+        for seed in worker_channel.rng.bit_generator.seed_seq.spawn(workers):
+            seeds.put(seed)
+    return ProcessPoolExecutor(max_workers=workers, mp_context=context, initializer=init_worker,
+                               initargs=(worker_channel, seeds))
+
+def plot_prefix():
+    """
+    Caminho (sem o final) dos gráficos de um novo quadro, único entre os quadros e os processos do pool.
+    A pasta dos gráficos é removida quando o processo termina; antes disso, a interface apaga os arquivos depois de
+    carregá-los, e o servidor apaga os dos quadros que não são exibidos (ver discard_plots).
+    :return: Prefixo para dcf.main.
+    """
+    global plot_dir
+    if plot_dir is None:
+        plot_dir = tempfile.mkdtemp(prefix="tr1_graficos_")
+        atexit.register(shutil.rmtree, plot_dir, ignore_errors=True)
+    return os.path.join(plot_dir, f"quadro_{next(plot_counter)}")
+
+def discard_plots(plots):
+    """
+    Apaga os arquivos dos gráficos de um quadro.
+    :param plots: Caminhos dos gráficos (analógico e digital), como devolvidos por decode_payload.
+    """
+    for path in plots:
+        try:
+            os.remove(path)
+        except FileNotFoundError:
+            pass
+
+@lru_cache(maxsize=32)
+def decoder(config):
+    """
+    Cadeia de decodificação do processo para uma configuração, montada na primeira vez em que ela aparece.
+    :param config: Configuração de codificação (CodecConfig).
+    :return: DecodePipeline da configuração.
+    """
+    return dpl.DecodePipeline(config, channel)
+
+def decode_payload(payload, session=None, plot=False):
+    """
+    Lê, demodula e decodifica uma mensagem de quadro recebida pelo WebSocket.
+    Com os gráficos, o quadro passa por dcf.main, que também desenha os sinais; sem eles, pela cadeia de
+    decodificação da configuração, reaproveitada entre os quadros. Os gráficos de cada quadro vão para arquivos
+    próprios (ver plot_prefix) e são aguardados antes do retorno, então a interface nunca carrega o gráfico de outro
+    quadro nem um arquivo incompleto.
+    :param payload: Bytes (formato binário), texto ou dicionário (JSON) recebido.
+    :param session: Sessão da conexão (decode_protocolo.Session), ou None se nenhuma configuração foi recebida.
+    :param plot: Se verdadeiro, os gráficos do quadro são gerados.
+    :return: Dicionário com o número de sequência (ou None), a sessão do quadro, os bits do segmento (None se um
+    erro foi detectado), a mensagem de erro (ou None), os caminhos dos gráficos (analógico e digital, ou None) e o
+    tempo de decodificação em milissegundos.
+    """
+    start = time.perf_counter()
+    result = {"seq": None, "session": session, "plots": None}
+    try:
+        message = dp.decode_message(payload, session)
+        result.update(seq=message["seq"], session=message["session"])
+        config = message["session"].config
+        if plot:
+            prefix = plot_prefix()
+            demodulated_frame = dcf.main(config.digital_mod, config.analog_mod, message["quadro"], message["num_bits"], config.params, plot=True, channel=channel, plot_prefix=prefix)
+            result["plots"] = (f"{prefix}_analogica.png", f"{prefix}_digital.png")
+            dcf.wait_for_plots()
+            segment = dce.decode_frame(config.framing, config.error_detection, config.error_correction, demodulated_frame)
+        else:
+            segment = decoder(config)(message["quadro"], message["num_bits"])
+        result.update(segment=segment, error=None)
+    except Exception as e:
+        result.update(segment=None, error=str(e))
+    result["decode_ms"] = 1000 * (time.perf_counter() - start)
+    return result
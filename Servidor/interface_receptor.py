@@ -0,0 +1,72 @@
+import os
+import gi
+
+gi.require_version("Gtk", "3.0")
+from gi.repository import Gtk, GdkPixbuf
+
+class ReceiverInterface(Gtk.Window):
+    def __init__(self):
+        super().__init__(title="Receptor - Resultados")
+        self.set_default_size(800, 600)
+        self.set_border_width(10)
+
+        # Layout principal
+        layout = Gtk.Box(orientation=Gtk.Orientation.VERTICAL, spacing=10)
+        self.add(layout)
+
+        # Imagem da demodulação analógica
+        self.analog_img = Gtk.Image()
+        analog_label = Gtk.Label(label="Demodulação Analógica")
+        layout.pack_start(analog_label, False, False, 0)
+        layout.pack_start(self.analog_img, True, True, 0)
+
+        # Imagem da demodulação digital
+        self.digital_img = Gtk.Image()
+        digital_label = Gtk.Label(label="Demodulação Digital")
+        layout.pack_start(digital_label, False, False, 0)
+        layout.pack_start(self.digital_img, True, True, 0)
+
+        # Resultados em binário
+        self.binary_label = Gtk.Label(label="Resultado em Binário: ")
+        layout.pack_start(self.binary_label, False, False, 0)
+
+        # Resultado em ASCII
+        self.ascii_label = Gtk.Label(label="Resultado em ASCII: ")
+        layout.pack_start(self.ascii_label, False, False, 0)
+
+        # Inicializar com imagens padrão
+        self.load_default_images()
+
+    def load_default_images(self):
+        """
+        Carrega imagens padrão (caso os arquivos ainda não existam).
+        """
+        placeholder_image = "placeholder.png"
+        self.set_image(self.analog_img, placeholder_image)
+        self.set_image(self.digital_img, placeholder_image)
+
+    def set_image(self, image_widget, file_path):
+        """
+        Define uma imagem no widget fornecido.
+        """
+        if os.path.exists(file_path):
+            pixbuf = GdkPixbuf.Pixbuf.new_from_file_at_scale(file_path, 600, 300, True)
+            image_widget.set_from_pixbuf(pixbuf)
+        else:
+            image_widget.set_from_stock(Gtk.STOCK_MISSING_IMAGE, Gtk.IconSize.DIALOG)
+
+    def show_results(self, binary_result, ascii_result, plots=None):
+        """
+        Mostra os resultados fornecidos pelo servidor.
+        Os gráficos são do quadro que completou a mensagem; os arquivos são apagados depois de carregados. Sem
+        gráficos, as imagens anteriores são mantidas.
+        """
+        if plots is not None:
+            analog_path, digital_path = plots
+            self.set_image(self.analog_img, analog_path)
+            self.set_image(self.digital_img, digital_path)
+            for path in plots:
+                if os.path.exists(path):
+                    os.remove(path)
+        self.binary_label.set_text(f"Resultado em Binário: {binary_result}")
+        self.ascii_label.set_text(f"Resultado em ASCII: {ascii_result}")
@@ -0,0 +1,181 @@
+import asyncio
+import json
+import time
+from collections import Counter, deque
+import numpy as np
+
+# Prefixo das mensagens de erro de transmissão das camadas do receptor; o restante da mensagem é a etapa
+ERROR_PREFIX = "Erro de transmissão detectado - "
+
+# Quantis publicados para os tempos de decodificação e de resposta
+QUANTILES = (0.5, 0.9, 0.99)
+
+def error_stage(error):
+    """
+    Identifica a etapa que detectou um erro a partir da mensagem.
+    :param error: Mensagem de erro.
+    :return: Nome da etapa (como "CRC" ou "Hamming"), ou "Outros" para erros fora das camadas de decodificação.
+    """
+    return error[len(ERROR_PREFIX):] if error.startswith(ERROR_PREFIX) else "Outros"
+
+class Metrics:
+    """
+    Métricas do receptor: quadros decodificados, erros detectados por etapa, vazão das mensagens entregues e
+    quantis dos tempos de decodificação e de resposta.
+    Os quantis e a vazão usam apenas as observações recentes, então refletem o estado atual do servidor.
+    """
+
+    def __init__(self, latency_window=1024, throughput_window=10.0):
+        """
+        :param latency_window: Número de quadros recentes usados nos quantis dos tempos.
+        :param throughput_window: Intervalo, em segundos, usado no cálculo da vazão.
+        """
+        self.start = time.monotonic()
+        self.throughput_window = throughput_window
+        self.connections = 0      # Conexões abertas
+        self.sessions = 0         # Conexões aceitas desde o início
+        self.frames = 0           # Quadros processados
+        self.frames_decoded = 0   # Quadros decodificados sem erro
+        self.errors = Counter()   # Etapa -> erros detectados
+        self.messages = 0         # Mensagens completas entregues
+        self.bytes_delivered = 0
+        self.decode_ms_sum = 0.0
+        self.latency_ms_sum = 0.0
+        self.decode_ms = deque(maxlen=latency_window)
+        self.latency_ms = deque(maxlen=latency_window)
+        self.deliveries = deque() # (instante, bytes) das mensagens entregues dentro da janela de vazão
+
+    def record_frame(self, decode_ms, latency_ms, error=None):
+        """
+        Registra um quadro processado.
+        :param decode_ms: Tempo de decodificação, em milissegundos.
+        :param latency_ms: Tempo entre a chegada do quadro e a resposta, em milissegundos.
+        :param error: Mensagem de erro, ou None se o quadro foi decodificado.
+        """
+        self.frames += 1
+        if error is None:
+            self.frames_decoded += 1
+        else:
+            self.record_error(error)
+        self.decode_ms_sum += decode_ms
+        self.latency_ms_sum += latency_ms
+        self.decode_ms.append(decode_ms)
+        self.latency_ms.append(latency_ms)
+
+    def record_error(self, error):
+        """
+        Registra um erro detectado.
+        :param error: Mensagem de erro.
+        """
+        self.errors[error_stage(error)] += 1
+
+    def record_message(self, size):
+        """
+        Registra uma mensagem completa entregue.
+        :param size: Tamanho da mensagem, em bytes.
+        """
+        self.messages += 1
+        self.bytes_delivered += size
+        self.deliveries.append((time.monotonic(), size))
+
+    def bytes_per_second(self):
+        """
+        Vazão das mensagens entregues na janela recente.
+        :return: Bytes por segundo.
+        """
+        now = time.monotonic()
+        while self.deliveries and self.deliveries[0][0] < now - self.throughput_window:
+            self.deliveries.popleft()
+        window = min(self.throughput_window, now - self.start)
+        return sum(size for _, size in self.deliveries) / window if window > 0 else 0.0
+
+    @staticmethod
+    def quantiles(samples):
+        """
+        Calcula os quantis publicados de uma janela de tempos.
+        :param samples: Tempos, em milissegundos.
+        :return: Dicionário quantil -> tempo (vazio se não houver observações).
+        """
+        if not samples:
+            return {}
+        return dict(zip(QUANTILES, np.quantile(np.fromiter(samples, dtype=np.float64), QUANTILES).tolist()))
+
+    def snapshot(self):
+        """
+        Estado atual das métricas.
+        :return: Dicionário serializável em JSON.
+        """
+        return {
+            "uptime_s": time.monotonic() - self.start,
+            "connections": self.connections,
+            "sessions": self.sessions,
+            "frames": self.frames,
+            "frames_decoded": self.frames_decoded,
+            "errors": dict(self.errors),
+            "messages": self.messages,
+            "bytes_delivered": self.bytes_delivered,
+            "bytes_per_second": self.bytes_per_second(),
+            "decode_ms": {str(q): value for q, value in self.quantiles(self.decode_ms).items()},
+            "latency_ms": {str(q): value for q, value in self.quantiles(self.latency_ms).items()},
+        }
+
+    def prometheus(self):
+        """
+        Métricas no formato de texto do Prometheus.
+        :return: Texto com uma métrica por linha.
+        """
+        lines = []
+        def metric(name, kind, description, samples):
+            lines.append(f"# HELP tr1_{name} {description}")
+            lines.append(f"# TYPE tr1_{name} {kind}")
+            for labels, value in samples:
+                lines.append(f"tr1_{name}{labels} {value}")
+
+        metric("connections", "gauge", "Conexões abertas.", [("", self.connections)])
+        metric("sessions_total", "counter", "Conexões aceitas.", [("", self.sessions)])
+        metric("frames_total", "counter", "Quadros processados.", [("", self.frames)])
+        metric("frames_decoded_total", "counter", "Quadros decodificados sem erro.", [("", self.frames_decoded)])
+        metric("errors_total", "counter", "Erros detectados por etapa.",
+               [(f'{{stage="{stage}"}}', count) for stage, count in sorted(self.errors.items())])
+        metric("messages_total", "counter", "Mensagens completas entregues.", [("", self.messages)])
+        metric("bytes_delivered_total", "counter", "Bytes das mensagens entregues.", [("", self.bytes_delivered)])
+        metric("bytes_per_second", "gauge", "Vazão recente das mensagens entregues.", [("", self.bytes_per_second())])
+        for name, samples, total, description in (
+            ("decode_ms", self.decode_ms, self.decode_ms_sum, "Tempo de decodificação de um quadro, em milissegundos."),
+            ("latency_ms", self.latency_ms, self.latency_ms_sum, "Tempo entre a chegada de um quadro e a resposta, em milissegundos."),
+        ):
+            quantiles = [(f'{{quantile="{q}"}}', value) for q, value in self.quantiles(samples).items()]
+            metric(name, "summary", description, quantiles + [("_sum", total), ("_count", self.frames)])
+        return "\n".join(lines) + "\n"
+
+async def serve_metrics(metrics, host="localhost", port=9100):
+    """
+    Inicia um servidor HTTP mínimo com as métricas: /metrics no formato do Prometheus e /metrics.json em JSON.
+    :param metrics: Métricas do receptor (Metrics).
+    :param host: Endereço de escuta.
+    :param port: Porta de escuta.
+    :return: Servidor asyncio já iniciado.
+    """
+    async def handle(reader, writer):
+        try:
+            request = await reader.readline()
+            # Descarta os cabeçalhos da requisição
+            while (await reader.readline()).strip():
+                pass
+            parts = request.decode("latin-1").split()
+            path = parts[1].split("?")[0] if len(parts) > 1 else ""
+            if path == "/metrics":
+                status, content_type, body = "200 OK", "text/plain; version=0.0.4; charset=utf-8", metrics.prometheus()
+            elif path == "/metrics.json":
+                status, content_type, body = "200 OK", "application/json", json.dumps(metrics.snapshot())
+            else:
+                status, content_type, body = "404 Not Found", "text/plain; charset=utf-8", "Não encontrado\n"
+            body = body.encode("utf-8")
+            writer.write(f"HTTP/1.0 {status}\r\nContent-Type: {content_type}\r\nContent-Length: {len(body)}\r\n\r\n".encode("latin-1") + body)
+            await writer.drain()
+        except ConnectionError:
+            pass
+        finally:
+            writer.close()
+
+    return await asyncio.start_server(handle, host, port)
@@ -1,123 +1,265 @@
+import argparse
 import asyncio
-import websockets
-import gi
+import base64
 import json
+import sys
+import time
+from contextlib import contextmanager
+import websockets
 import decode_camada_enlace as dce
-import decode_camada_fisica as dcf
-import numpy as np
-
-gi.require_version("Gtk", "3.0")
-from gi.repository import Gtk, GdkPixbuf, GLib
-import os
-
-class ReceiverInterface(Gtk.Window):
-    def __init__(self):
-        super().__init__(title="Receptor - Resultados")
-        self.set_default_size(800, 600)
-        self.set_border_width(10)
-
-        # Layout principal
-        layout = Gtk.Box(orientation=Gtk.Orientation.VERTICAL, spacing=10)
-        self.add(layout)
-
-        # Imagem da demodulação analógica
-        self.analog_img = Gtk.Image()
-        analog_label = Gtk.Label(label="Demodulação Analógica")
-        layout.pack_start(analog_label, False, False, 0)
-        layout.pack_start(self.analog_img, True, True, 0)
-
-        # Imagem da demodulação digital
-        self.digital_img = Gtk.Image()
-        digital_label = Gtk.Label(label="Demodulação Digital")
-        layout.pack_start(digital_label, False, False, 0)
-        layout.pack_start(self.digital_img, True, True, 0)
-
-        # Resultados em binário
-        self.binary_label = Gtk.Label(label="Resultado em Binário: ")
-        layout.pack_start(self.binary_label, False, False, 0)
-
-        # Resultado em ASCII
-        self.ascii_label = Gtk.Label(label="Resultado em ASCII: ")
-        layout.pack_start(self.ascii_label, False, False, 0)
-
-        # Inicializar com imagens padrão
-        self.load_default_images()
-
-    def load_default_images(self):
-        """
-        Carrega imagens padrão (caso os arquivos ainda não existam).
-        """
-        placeholder_image = "placeholder.png"
-        self.set_image(self.analog_img, placeholder_image)
-        self.set_image(self.digital_img, placeholder_image)
-
-    def set_image(self, image_widget, file_path):
-        """
-        Define uma imagem no widget fornecido.
-        """
-        if os.path.exists(file_path):
-            pixbuf = GdkPixbuf.Pixbuf.new_from_file_at_scale(file_path, 600, 300, True)
-            image_widget.set_from_pixbuf(pixbuf)
-        else:
-            image_widget.set_from_stock(Gtk.STOCK_MISSING_IMAGE, Gtk.IconSize.DIALOG)
-
-    def show_results(self, binary_result, ascii_result):
-        """
-        Mostra os resultados fornecidos pelo servidor.
-        """
-        analog_path = "demodulacao_analogica.png"
-        digital_path = "demodulacao_digital.png"
-        self.set_image(self.analog_img, analog_path)
-        self.set_image(self.digital_img, digital_path)
-        self.binary_label.set_text(f"Resultado em Binário: {binary_result}")
-        self.ascii_label.set_text(f"Resultado em ASCII: {ascii_result}")
-
-
-async def websocket_server(interface):
+import decode_protocolo as dp
+import decode_worker as dw
+import canal as cn
+import arq_receptor as ar
+import metricas as mt
+
+# A interface gráfica (GTK) e os gráficos (matplotlib) só são importados fora do modo sem interface
+
+async def websocket_server(deliver, executor, metrics, host="localhost", port=8765, max_in_flight=8, plot=True):
     """
-    Servidor WebSocket que se comunica com a interface.
+    Servidor WebSocket do receptor.
+    Cada conexão é uma sessão: a configuração de codificação chega uma vez, em uma mensagem {"type": "config", ...},
+    e vale para os quadros seguintes. Cada quadro recebe uma resposta (ACK/NAK, com ARQ, ou o resultado da
+    decodificação) com o seu índice na conexão e os tempos de decodificação e de resposta.
+    A demodulação e a decodificação rodam no pool de processos, fora do loop de eventos, então um quadro grande não
+    atrasa as outras conexões. Os quadros de uma mesma conexão são tratados na ordem de chegada.
+    :param deliver: Função chamada (no loop de eventos) com os bytes de cada mensagem completa recebida e os caminhos
+    dos gráficos do quadro que a completou (ou None).
+    :param executor: Pool de processos que executa decode_worker.decode_payload.
+    :param metrics: Métricas do receptor (metricas.Metrics).
+    :param host: Endereço de escuta.
+    :param port: Porta de escuta.
+    :param max_in_flight: Número máximo de quadros de uma conexão em processamento; ao atingi-lo, o servidor
+    para de ler a conexão até que um quadro termine.
+    :param plot: Se verdadeiro, os gráficos de cada quadro são gerados para a interface.
     """
     async def handler(websocket):
+        loop = asyncio.get_running_loop()
+        metrics.connections += 1
+        metrics.sessions += 1
+
+        # Receptor do protocolo de retransmissão da conexão, criado no primeiro quadro com número de sequência
+        arq = None
+
+        # Remonta as mensagens segmentadas da conexão (os identificadores de mensagem são de cada transmissor)
+        reassembler = dce.Reassembler()
+
+        # Quadros em processamento, na ordem de chegada; None marca o fim da conexão
+        in_flight = asyncio.Semaphore(max_in_flight)
+        pending = asyncio.Queue()
+
+        async def read_frames():
+            # Recebe as mensagens da conexão até que o cliente a encerre e despacha os quadros para o pool
+            session = None
+            frames = 0
+            try:
+                async for payload in websocket:
+                    if isinstance(payload, str):
+                        try:
+                            payload = json.loads(payload)
+                        except ValueError as e:
+                            await websocket.send(json.dumps({"type": "error", "error": f"JSON inválido: {e}"}))
+                            continue
+                        if isinstance(payload, dict) and payload.get("type") == "config":
+                            # Nova configuração da sessão, usada pelos quadros que chegarem depois dela
+                            try:
+                                session = dp.decode_config(payload)
+                            except (TypeError, ValueError) as e:
+                                session = None
+                                await websocket.send(json.dumps({"type": "error", "error": f"Configuração inválida: {e}"}))
+                            continue
+
+                    await in_flight.acquire()
+                    future = loop.run_in_executor(executor, dw.decode_payload, payload, session, plot)
+                    pending.put_nowait((frames, loop.time(), future))
+                    frames += 1
+            except websockets.ConnectionClosed:
+                pass
+            finally:
+                pending.put_nowait(None)
+
+        reader = asyncio.create_task(read_frames())
         try:
-            # Recebe o JSON do cliente
-            data_json = await websocket.recv()
+            while (item := await pending.get()) is not None:
+                frame, received, future = item
+                try:
+                    try:
+                        result = await future
+                    finally:
+                        in_flight.release()
+                    seq = result["seq"]
+                    segment = result["segment"]
+                    error = result["error"]
+                    plots = result["plots"]
+                    timings = {
+                        "frame": frame,
+                        "decode_ms": round(result["decode_ms"], 3),
+                        "latency_ms": round(1000 * (loop.time() - received), 3),
+                    }
+                    metrics.record_frame(timings["decode_ms"], timings["latency_ms"], error)
+                    if error is not None:
+                        print(f"Erro: {error}" if seq is None else f"Erro no quadro {seq}: {error}", file=sys.stderr)
 
-            # Decodifica o JSON recebido
-            data = json.loads(data_json)
+                    # Com ARQ, o quadro é confirmado (ACK/NAK) e os segmentos são entregues em ordem
+                    reply = None
+                    if seq is None:
+                        segments = [segment] if error is None else []
+                    else:
+                        if arq is None:
+                            session = result["session"]
+                            arq = ar.make_receiver(session.arq or ar.GO_BACK_N, session.window)
+                        reply, segments = arq.receive(seq, segment)
 
-            # Extrai os dados do JSON
-            quadro_array = np.array(data.get("quadro", []))
-            digital_modulation = data.get("digital_mod")
-            analogical_modulation = data.get("analog_mod")
-            framing = data.get("framing")
-            error_detection = data.get("error_detection")
-            error_correction = data.get("error_correction")
+                    # Todo quadro recebe uma resposta; sem ACK/NAK, ela traz o resultado da decodificação
+                    if reply is None:
+                        reply = {"type": "result", "seq": seq, "ok": error is None, "error": error}
+                    await websocket.send(json.dumps(dict(reply, **timings)))
 
-            # Realiza a demodulação e decodificação de sinais
-            demodulated_frame = dcf.main(digital_modulation, analogical_modulation, quadro_array)
-            final_message, final_message_bin = dce.main(framing, error_detection, error_correction, demodulated_frame)
+                    # Guarda os segmentos; a mensagem só é entregue quando estiver completa
+                    messages = []
+                    for segment in segments:
+                        message = reassembler.add(dce.bits_to_bytes(segment))
+                        if message is None:
+                            continue
+                        metrics.record_message(len(message))
+                        messages.append(message)
 
-            # Atualiza a interface pelo GLib
-            GLib.idle_add(interface.show_results, final_message_bin, final_message)
+                    # Os gráficos do quadro acompanham a última mensagem que ele completou; sem mensagem, são apagados
+                    for index, message in enumerate(messages):
+                        deliver(message, plots if index == len(messages) - 1 else None)
+                    if plots is not None and not messages:
+                        dw.discard_plots(plots)
 
-        except Exception as e:
-            print(f"Erro: {e}")
+                except websockets.ConnectionClosed:
+                    # O cliente encerrou a conexão (normalmente ou não): não há a quem responder
+                    break
+                except Exception as e:
+                    metrics.record_error(str(e))
+                    print(f"Erro: {e}", file=sys.stderr)
+        finally:
+            reader.cancel()
+            # Os quadros ainda na fila não são mais decodificados
+            while not pending.empty():
+                if (item := pending.get_nowait()) is not None:
+                    item[2].cancel()
+            metrics.connections -= 1
 
-    # Inicializa o servidor
-    async with websockets.serve(handler, "localhost", 8765):
+    # Inicializa o servidor, aceitando mensagens até o tamanho máximo de um quadro
+    async with websockets.serve(handler, host, port, max_size=dp.MAX_MESSAGE_BYTES):
         await asyncio.Future()
 
 
-def main():
-    # Cria a interface
-    interface = ReceiverInterface()
-    interface.connect("destroy", Gtk.main_quit)
-    interface.show_all()
+async def serve(deliver, executor, metrics, args, plot):
+    """
+    Executa o servidor WebSocket e, se configurado, o endpoint HTTP de métricas.
+    :param deliver: Função chamada com os bytes de cada mensagem completa recebida e os caminhos dos gráficos.
+    :param executor: Pool de processos da decodificação.
+    :param metrics: Métricas do receptor.
+    :param args: Argumentos da linha de comando.
+    :param plot: Se verdadeiro, os gráficos de cada quadro são gerados.
+    """
+    metrics_server = None
+    if args.metrics_port is not None:
+        metrics_server = await mt.serve_metrics(metrics, args.metrics_host, args.metrics_port)
+        print(f"Métricas em http://{args.metrics_host}:{args.metrics_port}/metrics", file=sys.stderr)
+    try:
+        await websocket_server(deliver, executor, metrics, args.host, args.port, args.max_in_flight, plot)
+    finally:
+        # Encerra o endpoint de métricas junto com o servidor WebSocket
+        if metrics_server is not None:
+            metrics_server.close()
+            await metrics_server.wait_closed()
+
+@contextmanager
+def message_writer(path):
+    """
+    Cria a função que grava as mensagens recebidas no modo sem interface, uma por linha, em JSON.
+    Uma mensagem que não é UTF-8 válido (como as corrompidas por erros que a detecção não percebe) é gravada em
+    base64, no campo "base64" em vez de "message". O arquivo é fechado na saída do bloco with.
+    :param path: Caminho do arquivo (acrescentado ao final), ou "-" para a saída padrão.
+    :return: Gerenciador de contexto com a função que recebe os bytes de uma mensagem (e os gráficos, ignorados).
+    """
+    stream = sys.stdout if path == "-" else open(path, "a", encoding="utf-8")
+    def write(message, plots=None):
+        record = {"time": time.time(), "bytes": len(message)}
+        try:
+            record["message"] = message.decode("utf-8", "surrogatepass")
+        except UnicodeDecodeError:
+            record["base64"] = base64.b64encode(message).decode("ascii")
+        stream.write(json.dumps(record) + "\n")
+        stream.flush()
+    try:
+        yield write
+    finally:
+        if stream is not sys.stdout:
+            stream.close()
+
+def make_channel(args):
+    """
+    Cria o canal usado para emular erros de transmissão nos quadros recebidos.
+    :param args: Argumentos da linha de comando.
+    :return: Canal, ou None sem canal.
+    """
+    if args.channel == "Nenhum":
+        return None
+    if args.channel == "AWGN":
+        return cn.make_channel(args.channel, seed=args.seed, snr_db=args.snr)
+    if args.channel == "BSC":
+        return cn.make_channel(args.channel, seed=args.seed, error_probability=args.error_rate)
+    return cn.make_channel(args.channel, seed=args.seed)
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Receptor: servidor WebSocket que demodula e decodifica os quadros recebidos.")
+    parser.add_argument("--host", default="localhost", help="Endereço do servidor WebSocket")
+    parser.add_argument("--port", type=int, default=8765, help="Porta do servidor WebSocket")
+    parser.add_argument("--headless", action="store_true", help="Executa sem interface gráfica e sem gráficos (não importa GTK nem matplotlib)")
+    parser.add_argument("--output", default="-", help="No modo sem interface, arquivo onde as mensagens recebidas são gravadas, uma por linha em JSON (\"-\" para a saída padrão)")
+    parser.add_argument("--metrics-host", default="localhost", help="Endereço do endpoint de métricas")
+    parser.add_argument("--metrics-port", type=int, default=None, help="Porta do endpoint HTTP de métricas (/metrics e /metrics.json); desativado se omitida")
+    parser.add_argument("--workers", type=int, default=None, help="Processos do pool de decodificação (padrão: número de CPUs)")
+    parser.add_argument("--max-in-flight", type=int, default=8, help="Quadros de uma conexão em processamento ao mesmo tempo")
+    parser.add_argument("--channel", choices=[*cn.CHANNEL_MODELS, "Nenhum"], default="AWGN", help="Modelo do canal que emula os erros de transmissão")
+    parser.add_argument("--snr", type=float, default=10.0, help="SNR (dB) do canal AWGN")
+    parser.add_argument("--error-rate", type=float, default=0.01, help="Probabilidade de erro de bit do canal binário simétrico")
+    parser.add_argument("--seed", type=int, default=None, help="Semente do canal, para execuções reprodutíveis")
+    return parser.parse_args(argv)
+
+def main(argv=None):
+    args = parse_args(argv)
+
+    # Processos que demodulam e decodificam os quadros
+    executor = dw.make_executor(make_channel(args), args.workers)
+    metrics = mt.Metrics()
+
+    try:
+        if args.headless:
+            with message_writer(args.output) as deliver:
+                asyncio.run(serve(deliver, executor, metrics, args, plot=False))
+            return
+
+        import interface_receptor as ir
+        from gi.repository import Gtk, GLib
+
+        # Cria a interface
+        interface = ir.ReceiverInterface()
+        interface.connect("destroy", Gtk.main_quit)
+        interface.show_all()
+
+        def deliver(message, plots):
+            # Atualiza a interface pelo GLib
+            final_message = message.decode("utf-8", "replace")
+            final_message_bin = dce.format_bits(dce.bytes_to_bits(message))
+            GLib.idle_add(interface.show_results, final_message_bin, final_message, plots)
 
-    # Cria um loop para o servidor WebSocket
-    loop = asyncio.get_event_loop()
-    loop.run_in_executor(None, Gtk.main)
-    loop.run_until_complete(websocket_server(interface))
+        # Cria um loop para o servidor WebSocket
+        loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(loop)
+        loop.run_in_executor(None, Gtk.main)
+        loop.run_until_complete(serve(deliver, executor, metrics, args, plot=True))
+    except KeyboardInterrupt:
+        pass
+    finally:
+        executor.shutdown(cancel_futures=True)
 
 
 if __name__ == "__main__":
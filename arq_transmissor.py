@@ -0,0 +1,215 @@
+import asyncio
+import json
+
+# Protocolos de retransmissão disponíveis
+GO_BACK_N = "Go-Back-N"
+SELECTIVE_REPEAT = "Selective Repeat"
+
+class ARQSender:
+    """
+    Transmissor com janela deslizante sobre uma conexão WebSocket, em Go-Back-N ou Selective Repeat.
+    Cada quadro vai com um número de sequência no envelope da mensagem, e o receptor responde com mensagens
+    {"type": "ack" | "nak", "seq": n}, acompanhadas dos tempos de processamento do quadro no receptor:
+    - Go-Back-N: o ACK é cumulativo (n é o próximo quadro esperado) e um NAK ou o fim do temporizador do quadro
+      mais antigo retransmitem todos os quadros a partir dele;
+    - Selective Repeat: cada quadro é confirmado individualmente e tem o seu próprio temporizador, e apenas o
+      quadro com NAK ou com o temporizador vencido é retransmitido.
+    Apenas os quadros da janela ficam guardados, então a memória não depende do tamanho da transmissão.
+    """
+
+    def __init__(self, websocket, mode=GO_BACK_N, window_size=4, timeout=1.0, max_attempts=10, serialize=json.dumps):
+        """
+        :param websocket: Conexão aberta com o receptor.
+        :param mode: Protocolo de retransmissão (GO_BACK_N ou SELECTIVE_REPEAT).
+        :param window_size: Número máximo de quadros enviados e ainda não confirmados.
+        :param timeout: Tempo, em segundos, até a retransmissão de um quadro não confirmado.
+        :param max_attempts: Número máximo de envios de um mesmo quadro antes de desistir.
+        :param serialize: Função que converte o envelope de um quadro em texto ou bytes (ver protocolo.py).
+        """
+        if mode not in (GO_BACK_N, SELECTIVE_REPEAT):
+            raise ValueError(f"Protocolo de retransmissão inválido: {mode}")
+        if window_size < 1:
+            raise ValueError("A janela deve ter pelo menos um quadro")
+        self.websocket = websocket
+        self.mode = mode
+        self.window_size = window_size
+        self.timeout = timeout
+        self.max_attempts = max_attempts
+        self.serialize = serialize
+
+        self.base = 0            # Quadro não confirmado mais antigo
+        self.next_seq = 0        # Próximo quadro a ser enviado
+        self.sent_up_to = 0      # Quadros já enviados ao menos uma vez: 0 a sent_up_to - 1
+        self.outstanding = {}    # Número de sequência -> mensagem serializada, para os quadros da janela
+        self.attempts = {}       # Número de sequência -> envios feitos
+        self.acked = set()       # Quadros confirmados acima da base (Selective Repeat)
+        self.deadlines = {}      # Temporizadores: número de sequência -> instante de expiração
+        self.retransmit = set()  # Quadros com NAK a serem retransmitidos (Selective Repeat)
+        self.progress = asyncio.Event()
+
+        # Estatísticas da transmissão
+        self.transmissions = 0
+        self.retransmissions = 0
+        self.naks = 0
+        self.timeouts = 0
+        self.replies = 0          # Respostas com os tempos do receptor
+        self.decode_ms = 0.0      # Soma dos tempos de decodificação informados pelo receptor
+        self.latency_ms = 0.0     # Soma dos tempos entre a chegada do quadro e a resposta, no receptor
+
+    async def transmit(self, seq):
+        """
+        Envia (ou reenvia) um quadro da janela e reinicia o seu temporizador.
+        :param seq: Número de sequência do quadro.
+        """
+        attempts = self.attempts.get(seq, 0) + 1
+        if attempts > self.max_attempts:
+            raise TimeoutError(f"Quadro {seq} não confirmado após {self.max_attempts} envios")
+        self.attempts[seq] = attempts
+        self.transmissions += 1
+        self.retransmissions += attempts > 1
+
+        await self.websocket.send(self.outstanding[seq])
+        self.sent_up_to = max(self.sent_up_to, seq + 1)
+
+        # No Go-Back-N há um único temporizador, o do quadro mais antigo da janela
+        if self.mode == SELECTIVE_REPEAT:
+            self.deadlines[seq] = asyncio.get_running_loop().time() + self.timeout
+        elif seq == self.base or self.base not in self.deadlines:
+            self.deadlines = {self.base: asyncio.get_running_loop().time() + self.timeout}
+
+    def handle_reply(self, reply):
+        """
+        Atualiza a janela com um ACK ou NAK recebido.
+        :param reply: Mensagem de resposta decodificada.
+        """
+        if "decode_ms" in reply:
+            self.replies += 1
+            self.decode_ms += reply["decode_ms"]
+            self.latency_ms += reply.get("latency_ms", 0.0)
+
+        seq = reply.get("seq")
+        if not isinstance(seq, int):
+            return
+
+        if reply.get("type") == "ack":
+            if self.mode == GO_BACK_N:
+                # ACK cumulativo: todos os quadros antes de seq foram recebidos
+                if seq > self.base:
+                    self.advance(min(seq, self.sent_up_to))
+            elif self.base <= seq < self.sent_up_to:
+                self.acked.add(seq)
+                self.deadlines.pop(seq, None)
+                self.retransmit.discard(seq)
+                base = self.base
+                while base in self.acked:
+                    self.acked.discard(base)
+                    base += 1
+                self.advance(base)
+
+        elif reply.get("type") == "nak" and self.base <= seq < self.sent_up_to:
+            self.naks += 1
+            if self.mode == GO_BACK_N:
+                self.go_back()
+            elif seq not in self.acked:
+                self.retransmit.add(seq)
+
+        self.progress.set()
+
+    def advance(self, base):
+        """
+        Desliza a janela até base, liberando os quadros confirmados.
+        :param base: Novo quadro não confirmado mais antigo.
+        """
+        for seq in range(self.base, base):
+            self.outstanding.pop(seq, None)
+            self.attempts.pop(seq, None)
+            self.deadlines.pop(seq, None)
+        self.base = base
+        # Depois de um Go-Back-N, confirmações de quadros enviados antes do retorno também avançam o envio
+        self.next_seq = max(self.next_seq, base)
+
+        # O temporizador do Go-Back-N passa para o novo quadro mais antigo, se ainda houver quadros pendentes
+        if self.mode == GO_BACK_N:
+            self.deadlines = {base: asyncio.get_running_loop().time() + self.timeout} if base < self.next_seq else {}
+
+    def go_back(self):
+        """
+        Volta o envio para o quadro mais antigo da janela (Go-Back-N): todos os quadros pendentes são reenviados.
+        """
+        self.next_seq = self.base
+        self.deadlines = {}
+
+    async def receive_replies(self):
+        """
+        Recebe as respostas do receptor enquanto a transmissão estiver em andamento.
+        """
+        async for message in self.websocket:
+            try:
+                reply = json.loads(message)
+            except (TypeError, ValueError):
+                continue
+            if isinstance(reply, dict):
+                self.handle_reply(reply)
+
+    async def send(self, messages):
+        """
+        Transmite uma sequência de mensagens (uma por quadro) e retorna quando todas forem confirmadas.
+        :param messages: Iterável de dicionários com o quadro e as configurações; o número de sequência e o
+        protocolo são acrescentados ao envelope de cada um.
+        :return: Número de quadros transmitidos.
+        """
+        messages = iter(messages)
+        exhausted = False
+        replies = asyncio.create_task(self.receive_replies())
+        try:
+            while True:
+                # Respostas que chegarem a partir daqui acordam a espera no fim desta iteração
+                self.progress.clear()
+
+                # Preenche a janela, gerando os quadros novos sob demanda
+                while self.next_seq < self.base + self.window_size:
+                    if self.next_seq not in self.outstanding:
+                        message = next(messages, None)
+                        if message is None:
+                            exhausted = True
+                            break
+                        envelope = dict(message, seq=self.next_seq, arq=self.mode, window=self.window_size)
+                        self.outstanding[self.next_seq] = self.serialize(envelope)
+                    await self.transmit(self.next_seq)
+                    self.next_seq += 1
+
+                if exhausted and self.base == self.sent_up_to:
+                    return self.base
+
+                # Reenvia os quadros com NAK (Selective Repeat)
+                for seq in sorted(self.retransmit):
+                    if seq in self.outstanding and seq not in self.acked:
+                        await self.transmit(seq)
+                self.retransmit.clear()
+
+                # Espera uma resposta ou o próximo temporizador
+                if replies.done():
+                    replies.result()
+                    raise ConnectionError("Conexão encerrada antes da confirmação de todos os quadros")
+                delay = min(self.deadlines.values(), default=None)
+                if delay is not None:
+                    delay = max(0.0, delay - asyncio.get_running_loop().time())
+                try:
+                    await asyncio.wait_for(self.progress.wait(), delay)
+                    continue
+                except asyncio.TimeoutError:
+                    pass
+
+                # Temporizadores vencidos
+                now = asyncio.get_running_loop().time()
+                expired = sorted(seq for seq, deadline in self.deadlines.items() if deadline <= now)
+                if expired:
+                    self.timeouts += 1
+                if self.mode == GO_BACK_N:
+                    if expired:
+                        self.go_back()
+                else:
+                    for seq in expired:
+                        await self.transmit(seq)
+        finally:
+            replies.cancel()
@@ -1,162 +1,304 @@
 import binascii
+import struct
+import zlib
+import numpy as np
+
+# Flag e Escape do enquadramento por inserção de bytes
+FLAG = bytes([0b01111110])
+ESCAPE = bytes([0b01111011])
+
+# Tamanho, em bits, do campo de contagem do enquadramento Contagem de Caracteres (inteiro binário sem sinal)
+COUNT_WIDTH = 32
+
+# Cabeçalho de cada segmento: identificador da mensagem (16 bits), número de sequência (32 bits),
+# total de segmentos da mensagem (32 bits) e tamanho dos dados do segmento em bytes (16 bits)
+SEGMENT_HEADER = struct.Struct(">HIIH")
+
+# Quantidade máxima de bytes de dados por quadro quando o tamanho do quadro modulado não é considerado;
+# o transmissor deriva o MTU do orçamento de bytes de cada mensagem (ver protocolo.segment_mtu)
+DEFAULT_MTU = 64
 
-# Função auxiliar importada dos questionários
 def text_to_bits(text, encoding='utf-8', errors='surrogatepass'):
-    bits = bin(int(binascii.hexlify(text.encode(encoding, errors)), 16))[2:]
-    return bits.zfill(8 * ((len(bits) + 7) // 8))
+    """
+    Converte um texto (qualquer caractere Unicode) para bits, byte a byte, na codificação escolhida.
+    :param text: String a ser convertida.
+    :param encoding: Codificação usada para obter os bytes do texto (UTF-8 por padrão).
+    :param errors: Tratamento de erros de codificação.
+    :return: Array uint8 de bits (bit mais significativo de cada byte primeiro).
+    """
+    return bytes_to_bits(text.encode(encoding, errors))
+
+def format_bits(binary_sequence):
+    """
+    Formata uma sequência de bits como texto separado em bytes, para exibição na interface.
+    :param binary_sequence: Lista ou array de bits.
+    :return: String com os bits agrupados de 8 em 8.
+    """
+    digits = (np.asarray(binary_sequence, dtype=np.uint8) + ord("0")).tobytes().decode("ascii")
+    return ' '.join(digits[i:i+8] for i in range(0, len(digits), 8))
+
+def bits_to_bytes(binary_sequence):
+    """
+    Agrupa uma sequência de bits em bytes.
+    :param binary_sequence: Lista ou array de bits (com comprimento múltiplo de 8).
+    :return: Bytes correspondentes.
+    """
+    return np.packbits(np.asarray(binary_sequence, dtype=np.uint8)).tobytes()
+
+def bytes_to_bits(data):
+    """
+    Expande bytes em bits.
+    :param data: Bytes a serem convertidos.
+    :return: Array uint8 de bits.
+    """
+    return np.unpackbits(np.frombuffer(data, dtype=np.uint8))
+
+def stuff_bytes(payload):
+    """
+    Insere um escape antes de cada flag ou escape acidental nos dados.
+    Cada substituição é uma única passada linear feita em C sobre os bytes.
+    :param payload: Bytes de dados do quadro.
+    :return: Bytes com os escapes inseridos.
+    """
+    # O escape é tratado primeiro para que os escapes inseridos antes das flags não sejam duplicados
+    return payload.replace(ESCAPE, ESCAPE + ESCAPE).replace(FLAG, ESCAPE + FLAG)
+
+def crc_table(polynomial, width):
+    """
+    Monta a tabela de 256 entradas para o cálculo byte a byte de um CRC (sem reflexão de bits).
+    :param polynomial: Polinômio gerador, sem o termo de maior grau.
+    :param width: Grau do polinômio (tamanho do CRC em bits).
+    :return: Lista com o resto da divisão de cada byte possível.
+    """
+    top_bit = 1 << (width - 1)
+    mask = (1 << width) - 1
+    table = []
+    for byte in range(256):
+        register = byte << (width - 8)
+        for _ in range(8):
+            register = (register << 1) ^ polynomial if register & top_bit else register << 1
+        table.append(register & mask)
+    return table
+
+# Tabela do CRC-8 (polinômio x^8 + x^2 + x + 1)
+CRC8_TABLE = crc_table(0x07, 8)
+
+def crc_shift_tables(table, levels=48):
+    """
+    Monta as tabelas que deslocam um CRC de 8 bits por blocos de bytes nulos.
+    :param table: Tabela de 256 entradas do CRC (o deslocamento por um byte nulo).
+    :param levels: Número de tabelas.
+    :return: Lista em que a k-ésima tabela leva o CRC c ao CRC de c seguido de 2^k bytes nulos.
+    """
+    shifts = [np.array(table, dtype=np.uint8)]
+    for _ in range(levels - 1):
+        shifts.append(shifts[-1][shifts[-1]])
+    return shifts
+
+# Tabelas de deslocamento do CRC-8 por 2^k bytes nulos
+CRC8_SHIFTS = crc_shift_tables(CRC8_TABLE)
+
+# Tabela de 65536 entradas com o CRC-8 de cada par de bytes (lido como inteiro big-endian de 16 bits)
+CRC8_PAIRS = CRC8_SHIFTS[0][CRC8_SHIFTS[0][np.arange(1 << 16) >> 8]] ^ CRC8_SHIFTS[0][np.arange(1 << 16) & 0xFF]
+
+# Abaixo deste tamanho (em bytes), o laço com a tabela é mais rápido que as operações vetorizadas
+CRC8_VECTOR_MIN = 1024
+
+def crc8(data):
+    """
+    Calcula o CRC-8 de uma sequência de bytes com as tabelas pré-calculadas.
+    Sequências curtas usam um acesso à tabela por byte. Nas demais, o CRC de cada par de bytes sai de uma única
+    tabela, e os pares são combinados em uma árvore, com NumPy: como o CRC (valor inicial 0) é linear, o CRC de A
+    seguido de B é o CRC de A deslocado por len(B) bytes nulos, combinado por ou-exclusivo com o CRC de B. Os dados
+    são completados à esquerda com bytes nulos, que não mudam o CRC, até uma potência de 2.
+    :param data: Bytes de entrada.
+    :return: Valor do CRC.
+    """
+    if len(data) < CRC8_VECTOR_MIN:
+        register = 0
+        for byte in data:
+            register = CRC8_TABLE[register ^ byte]
+        return register
+    
+    values = np.frombuffer(data, dtype=np.uint8)
+    padded = np.zeros(1 << (len(values) - 1).bit_length(), dtype=np.uint8)
+    padded[len(padded) - len(values):] = values
+    values = CRC8_PAIRS[padded.view(">u2")]
+    for shift in CRC8_SHIFTS[1:]:
+        if len(values) == 1:
+            break
+        values = shift[values[0::2]] ^ values[1::2]
+    return int(values[0])
+
+def crc16_ccitt(data):
+    """
+    Calcula o CRC-16-CCITT (polinômio 0x1021, valor inicial 0xFFFF) com a implementação em C por tabela do binascii.
+    :param data: Bytes de entrada.
+    :return: Valor do CRC.
+    """
+    return binascii.crc_hqx(data, 0xFFFF)
+
+# Padrões de CRC disponíveis: nome -> (tamanho em bits, função de cálculo sobre bytes)
+# O CRC-32 usa o zlib, implementado em C
+CRC_STANDARDS = {
+    "CRC-8": (8, crc8),
+    "CRC-16-CCITT": (16, crc16_ccitt),
+    "CRC-32": (32, zlib.crc32),
+}
+
+# Padrão usado quando a configuração é apenas "CRC"
+DEFAULT_CRC = "CRC-32"
+
+# Posições (a partir de 1) dos bits de dados e de paridade em cada bloco de Hamming(12, 8)
+HAMMING_DATA_POSITIONS = np.array([3, 5, 6, 7, 9, 10, 11, 12])
+HAMMING_PARITY_POSITIONS = np.array([1, 2, 4, 8])
+
+def hamming_generator():
+    """
+    Monta a matriz geradora (8 x 12) do código de Hamming usado no projeto.
+    Cada bit de paridade na posição 2^k cobre os bits de dados cuja posição tem o bit k ligado.
+    :return: Matriz uint8 tal que (byte @ G) % 2 é o bloco codificado.
+    """
+    generator = np.zeros((8, 12), dtype=np.uint8)
+    generator[np.arange(8), HAMMING_DATA_POSITIONS - 1] = 1
+    for parity in HAMMING_PARITY_POSITIONS:
+        generator[:, parity - 1] = (HAMMING_DATA_POSITIONS & parity) > 0
+    return generator
+
+HAMMING_GENERATOR = hamming_generator()
+
+# Código convolucional de taxa 1/2 e comprimento de restrição 7, com os geradores 133 e 171 (octal)
+CONVOLUTIONAL_CONSTRAINT = 7
+CONVOLUTIONAL_GENERATORS = [0o133, 0o171]
+
+# Coeficientes de cada gerador, do bit atual (bit mais significativo do gerador) para o mais antigo
+CONVOLUTIONAL_TAPS = (np.array(CONVOLUTIONAL_GENERATORS)[:, np.newaxis] >> np.arange(CONVOLUTIONAL_CONSTRAINT - 1, -1, -1)) & 1
+
+def ones_run_position(binary_sequence):
+    """
+    Calcula a posição de cada bit dentro da sequência de bits 1 consecutivos a que ele pertence.
+    Feito com somas acumuladas, sem laço em Python.
+    :param binary_sequence: Lista ou array de bits.
+    :return: Array com 1, 2, 3... para os bits 1 de cada sequência e 0 para os bits 0.
+    """
+    bits = np.asarray(binary_sequence, dtype=np.int64)
+    count = np.cumsum(bits)
+    # Contagem acumulada no último bit 0 antes de cada posição
+    last_zero = np.maximum.accumulate(np.where(bits == 0, count, 0))
+    return count - last_zero
 
 def char_count(binary_sequence):
     """
     Função para contagem de caracteres.
-    Adiciona o tamanho da sequência em ASCII (convertido para bits) no início da sequência binária.
-    :param binary_sequence: Lista de bits representando a sequência binária.
-    :return: Lista de bits com o protocolo de enquadramento contagem de caracteres.
+    Adiciona o tamanho da sequência (em bits) como um inteiro binário de COUNT_WIDTH bits no início da sequência binária.
+    :param binary_sequence: Array de bits representando a sequência binária.
+    :return: Array de bits com o protocolo de enquadramento contagem de caracteres.
     """
-    sequence_size = text_to_bits(str(len(binary_sequence))) # Converte o tamanho da sequência para ASCII representado em binário
-    
-    # Converte a string de contagem de caracteres para a forma de lista 
-    sequence_size_ascii = []
-    for bit in sequence_size:
-        sequence_size_ascii.append(int(bit))
-    return sequence_size_ascii + binary_sequence
+    sequence_size = bytes_to_bits(len(binary_sequence).to_bytes(COUNT_WIDTH // 8, "big"))
+    return np.concatenate([sequence_size, binary_sequence])
 
 def byte_insertion(binary_sequence):
     """
     Realiza a inserção de flags para delimitar quadros e trata flags e escapes acidentais nos dados.
-    :param binary_sequence: Lista de bytes (dados do quadro).
-    :return: Lista de bytes com as inserções de flag e escape realizadas.
+    O enquadramento é feito sobre bytes alinhados, em tempo linear no tamanho dos dados.
+    :param binary_sequence: Array de bits (dados do quadro, com comprimento múltiplo de 8).
+    :return: Array de bits com as inserções de flag e escape realizadas.
     """
-    # Declaração da Flag e do Escape padrão
-    flag =   [0,1,1,1,1,1,1,0]
-    escape = [0,1,1,1,1,0,1,1]
-    
-    # Verifica se a flag ou o escape estão presentes na sequência e adiciona o escape
-    for i in range(len(binary_sequence)):
-        if binary_sequence[i:i+8] == flag or binary_sequence[i:i+8] == escape:
-            binary_sequence = binary_sequence[:i] + escape + binary_sequence[i:] 
-    
-    # Adiciona a flag no início e no final da sequência
-    return flag + binary_sequence + flag
+    if len(binary_sequence) % 8 != 0:
+        raise ValueError("A inserção de bytes exige uma sequência com número inteiro de bytes")
+
+    # Adiciona a flag no início e no final da sequência com os escapes inseridos
+    return bytes_to_bits(FLAG + stuff_bytes(bits_to_bytes(binary_sequence)) + FLAG)
 
 def char_insertion(binary_sequence):
     """
-    Realiza a inserção de flags para delimitar quadros e trata flags acidentais ao inserir caracteres nos dados.
-    :param binary_sequence: Lista de bytes (dados do quadro).
-    :return: Lista de bytes com as inserções de flag e caracteres realizadas.
+    Realiza a inserção de flags para delimitar quadros e trata flags acidentais com inserção de bits (bit stuffing):
+    um bit 0 é inserido após cada cinco bits 1 consecutivos, de forma que a flag nunca aparece nos dados.
+    :param binary_sequence: Array de bits (dados do quadro).
+    :return: Array de bits com as inserções de flag e de bits realizadas.
     """
-    
     # Declaração da Flag
-    flag = [0,1,1,1,1,1,1,0]
-    
-    framed_data = [bit for bit in flag]  # Adiciona o byte de flag inicial
-    
-    char_insertion = [0,1,1,1,1,1,0,1,0] # Flag com a inserção de caractere
+    flag = np.array([0,1,1,1,1,1,1,0], dtype=np.uint8)
 
-    # Verifica se a flag está presente na sequência e trata com char_insertion
-    for bit in range(len(binary_sequence)):
-        if binary_sequence[bit:bit+8] == flag:
-            binary_sequence = binary_sequence[:bit]+ char_insertion + binary_sequence[bit+8:]
+    bits = np.asarray(binary_sequence, dtype=np.uint8)
+    run = ones_run_position(bits)
     
-    # Adiciona os caracteres na sequência
-    framed_data.extend(binary_sequence)
-            
-    # Adiciona o byte de flag final    
-    framed_data.extend(flag)  
+    # O bit inserido zera a contagem, então as inserções caem após o 5º, 10º, 15º... bit 1 de cada sequência original
+    stuffing_positions = np.flatnonzero((run > 0) & (run % 5 == 0)) + 1
+    stuffed = np.insert(bits, stuffing_positions, 0)
     
-    return framed_data
+    # Adiciona os bytes de flag inicial e final
+    return np.concatenate([flag, stuffed, flag])
 
 def parity_bit(binary_sequence):
     """
     Função para cálculo de bit de paridade.
-    :param binary_sequence: Lista de bits representando a sequência binária.
-    :return: Lista de bits com bit de paridade.
+    :param binary_sequence: Array de bits representando a sequência binária.
+    :return: Array de bits com bit de paridade.
     """
     # Cálculo do bit de paridade
-    binary_sequence.append(sum(binary_sequence) % 2)  # Soma os bits 1 e verifica se é par ou ímpar
-    return binary_sequence
+    parity = np.count_nonzero(binary_sequence) % 2  # Conta os bits 1 e verifica se é par ou ímpar
+    return np.append(binary_sequence, np.uint8(parity))
 
-def crc(binary_sequence):
+def crc(binary_sequence, standard="CRC"):
     """
-    Calcula o CRC usando o polinômio gerador pré-determinado (1101).
-    :param dividendo: lista de bits representando o dividendo.
-    :return: lista de bits resultante que contém o dividendo concatenado ao CRC.
+    Calcula o CRC da sequência com o padrão selecionado, por tabela, e o concatena ao final.
+    Os bits são agrupados em bytes para o cálculo (o último byte é completado com zeros).
+    :param binary_sequence: Array de bits representando a sequência binária.
+    :param standard: Padrão do CRC ("CRC-8", "CRC-16-CCITT", "CRC-32" ou "CRC" para o padrão DEFAULT_CRC).
+    :return: Array de bits resultante que contém a sequência concatenada ao CRC.
     """
-    # Dividendo
-    dividendo = binary_sequence
+    if standard == "CRC":
+        standard = DEFAULT_CRC
+    width, compute = CRC_STANDARDS[standard]
     
-    # Polinômio gerador
-    polynomial = [1, 1, 0, 1]
+    value = compute(bits_to_bytes(binary_sequence))
     
-    # Adicionar zeros ao final do dividendo para o cálculo do CRC
-    crc = dividendo + [0] * (len(polynomial) - 1)
-
-    # Dividir o dividendo pelo polinômio gerador
-    for i in range(len(dividendo)):
-        if crc[i] == 1:  # Se o bit atual do CRC for 1
-            for j in range(len(polynomial)):
-                # Realiza a operação XOR com o polinômio gerador
-                crc[i + j] ^= polynomial[j]
-
-    # Retorna o dividendo concatenado ao CRC (os últimos 3 bits)
-    return dividendo + crc[-(len(polynomial) - 1):]
+    # Retorna a sequência concatenada ao CRC (bit mais significativo primeiro)
+    return np.concatenate([binary_sequence, bytes_to_bits(value.to_bytes(width // 8, "big"))])
 
 def hamming(binary_sequence):
     """
     Função para cálculo de código de Hamming. Nessa implementação, o código de Hamming é calculado para cada byte (8bits).
-    :param binary_sequence: Lista de bits representando a sequência binária.
-    :return: Lista de bits com código de Hamming.
+    A mensagem inteira é codificada de uma vez, como uma matriz (n_bytes, 8) multiplicada pela matriz geradora (mod 2).
+    :param binary_sequence: Array de bits representando a sequência binária.
+    :return: Array de bits com código de Hamming.
     """
-    # Dividir a sequência em grupos de 8 bits (1 byte)
-    grouped_bytes = [binary_sequence[i:i + 8] for i in range(0, len(binary_sequence), 8)]
-    hamming_sequence = ''
-
-    for byte in grouped_bytes:
-        # Garantir que o byte tenha exatamente 8 bits
-        if len(byte) != 8:
-            hamming_sequence += ''.join(map(str, byte))
-        else:
-            # Conversão dos bits de string para inteiros (caso necessário)
-            byte = list(map(int, byte))
-
-            # Cálculo dos bits de paridade
-            p1 = (byte[0] + byte[1] + byte[3] + byte[4] + byte[6]) % 2
-            p2 = (byte[0] + byte[2] + byte[3] + byte[5] + byte[6]) % 2
-            p4 = (byte[1] + byte[2] + byte[3] + byte[7]) % 2
-            p8 = (byte[4] + byte[5] + byte[6] + byte[7]) % 2
-
-            # Construir o novo byte com os bits de Hamming
-            hamming_byte = [p1, p2, byte[0], p4, byte[1], byte[2], byte[3], p8, byte[4], byte[5], byte[6], byte[7]]
-
-            # Adicionar o byte codificado à sequência final
-            hamming_sequence += ''.join(map(str, hamming_byte))
-
-    return [int(bit) for bit in hamming_sequence]
+    bits = np.asarray(binary_sequence, dtype=np.uint8)
+    
+    # Dividir a sequência em grupos de 8 bits (1 byte); bits que não completam um byte seguem sem codificação
+    complete = len(bits) - len(bits) % 8
+    grouped_bytes = bits[:complete].reshape(-1, 8)
+    
+    # Cada linha vira p1 p2 d0 p4 d1 d2 d3 p8 d4 d5 d6 d7
+    encoded = (grouped_bytes @ HAMMING_GENERATOR) & 1
+    
+    return np.concatenate([encoded.ravel(), bits[complete:]])
 
-def ascii_to_binary(ascii_input):
+def convolutional(binary_sequence):
     """
-    Função para converter uma string ASCII para uma sequência binária.
-    Lida com o input de dados do transmissor.
-    :param ascii_input: String ASCII a ser convertida.
-    :return: String binária representando a sequência ASCII.
+    Codifica a sequência com o código convolucional de taxa 1/2 (K = 7, geradores 133 e 171).
+    Cada saída é a convolução (mod 2) da entrada com os coeficientes do gerador. A entrada recebe 6 bits 0 de
+    cauda, que levam o codificador de volta ao estado inicial.
+    :param binary_sequence: Array de bits representando a sequência binária.
+    :return: Array de bits codificados, com as duas saídas intercaladas (2 * (n + 6) bits).
     """
-    binary_output = ""
-    for char in ascii_input:
-        binary_output += format(ord(char), "08b")
-    return binary_output
+    bits = np.asarray(binary_sequence, dtype=np.uint8)
+    padded = np.concatenate([bits, np.zeros(CONVOLUTIONAL_CONSTRAINT - 1, dtype=np.uint8)])
+    encoded = np.empty((len(padded), 2), dtype=np.uint8)
+    for output, taps in enumerate(CONVOLUTIONAL_TAPS):
+        encoded[:, output] = np.convolve(padded, taps)[:len(padded)] & 1
+    return encoded.ravel()
 
-def main(framing, error_detection, error_correction, ascii_input):
+def encode_frame(framing, error_detection, error_correction, binary_sequence):
     """
-    Função principal para a camada de enlace.
+    Monta um quadro: aplica o enquadramento, a detecção e a correção de erros selecionados.
     :param framing: Tipo de enquadramento a ser utilizado.
     :param error_detection: Tipo de detecção de erros a ser utilizada.
     :param error_correction: Tipo de correção de erros a ser utilizada.
-    :param ascii_input: String ASCII a ser transmitida.
-    :return: Lista de bits representando a sequência binária e a string ASCII convertida para binário.
+    :param binary_sequence: Array de bits com os dados do quadro.
+    :return: Array de bits do quadro pronto para a camada física.
     """
-    # Converte a string ASCII para binário e coloca em uma lista
-    bin_ascii_input = ascii_to_binary(ascii_input)
-    binary_sequence = [int(bit) for bit in bin_ascii_input]
-  
     # Verifica o tipo de enquadramento a ser utilizado
     if framing == "Contagem de Caracteres":
         binary_sequence = char_count(binary_sequence)
@@ -168,12 +310,61 @@ def main(framing, error_detection, error_correction, ascii_input):
     # Verifica o tipo de detecção de erros a ser utilizado
     if error_detection == "Bit de Paridade":
         binary_sequence = parity_bit(binary_sequence)
-    elif error_detection == "CRC":
-        binary_sequence = crc(binary_sequence)
+    elif error_detection == "CRC" or error_detection in CRC_STANDARDS:
+        binary_sequence = crc(binary_sequence, error_detection)
         
     # Verifica o tipo de correção de erros a ser utilizada
     if error_correction == "Hamming":
         binary_sequence = hamming(binary_sequence)
+    elif error_correction == "Convolucional":
+        binary_sequence = convolutional(binary_sequence)
+
+    return binary_sequence
+
+def segment(data, mtu=DEFAULT_MTU, message_id=0):
+    """
+    Divide uma mensagem em segmentos de no máximo mtu bytes, cada um precedido pelo cabeçalho SEGMENT_HEADER.
+    Uma mensagem vazia gera um único segmento vazio.
+    :param data: Bytes da mensagem.
+    :param mtu: Quantidade máxima de bytes de dados por segmento.
+    :param message_id: Identificador da mensagem (módulo 2^16), usado pelo receptor para separar mensagens.
+    :return: Gerador de bytes, um segmento (cabeçalho + dados) por vez.
+    """
+    if not 0 < mtu <= 0xFFFF:
+        raise ValueError("O MTU deve estar entre 1 e 65535 bytes")
+    total = max(1, -(-len(data) // mtu))
+    view = memoryview(data)
+    for seq in range(total):
+        chunk = view[seq * mtu:(seq + 1) * mtu]
+        yield SEGMENT_HEADER.pack(message_id & 0xFFFF, seq, total, len(chunk)) + chunk
+
+def segment_frames(framing, error_detection, error_correction, data, mtu=DEFAULT_MTU, message_id=0):
+    """
+    Segmenta uma mensagem e monta um quadro para cada segmento.
+    Os quadros são gerados sob demanda, então o custo por quadro não depende do tamanho da mensagem.
+    :param framing: Tipo de enquadramento a ser utilizado.
+    :param error_detection: Tipo de detecção de erros a ser utilizada.
+    :param error_correction: Tipo de correção de erros a ser utilizada.
+    :param data: Bytes da mensagem.
+    :param mtu: Quantidade máxima de bytes de dados por quadro.
+    :param message_id: Identificador da mensagem.
+    :return: Gerador de arrays de bits, um quadro por segmento.
+    """
+    for chunk in segment(data, mtu, message_id):
+        yield encode_frame(framing, error_detection, error_correction, bytes_to_bits(chunk))
+
+def main(framing, error_detection, error_correction, ascii_input):
+    """
+    Função principal para a camada de enlace: envia o texto inteiro em um único quadro, sem segmentação.
+    :param framing: Tipo de enquadramento a ser utilizado.
+    :param error_detection: Tipo de detecção de erros a ser utilizada.
+    :param error_correction: Tipo de correção de erros a ser utilizada.
+    :param ascii_input: Texto a ser transmitido (codificado em UTF-8).
+    :return: Array de bits representando a sequência binária e o array de bits do texto antes do enquadramento.
+    """
+    # Converte o texto para bits diretamente a partir dos seus bytes
+    bin_ascii_input = text_to_bits(ascii_input)
+    binary_sequence = encode_frame(framing, error_detection, error_correction, bin_ascii_input)
 
     # O retorno de bin_ascii_input é necessário para mostrar na interface do transmissor
     return binary_sequence, bin_ascii_input
\ No newline at end of file
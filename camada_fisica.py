@@ -1,19 +1,76 @@
-import matplotlib.pyplot as plt
 import numpy as np
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from itertools import islice
+
+# Tipos de amostra aceitos para o sinal modulado
+SAMPLE_DTYPES = {"float64": np.float64, "float32": np.float32, "int16": np.int16}
+
+@dataclass(frozen=True)
+class SignalParams:
+    """
+    Parâmetros do sinal compartilhados entre transmissor e receptor.
+    As frequências são dadas em Hz; cada símbolo dura 1 / symbol_rate segundos e é amostrado samples_per_symbol vezes.
+    No tipo "int16" o sinal é transmitido em ponto fixo, com a amplitude mapeada para o maior valor do tipo.
+    """
+    samples_per_symbol: int = 100
+    symbol_rate: float = 1.0
+    amplitude: float = 1.0
+    carrier_frequency: float = 1.0   # Portadora do ASK e do 8-QAM
+    fsk_frequency_one: float = 1.0   # Portadora do FSK para o bit 1
+    fsk_frequency_zero: float = 3.0  # Portadora do FSK para o bit 0
+    dtype: str = "float64"
+
+    def __post_init__(self):
+        if self.dtype not in SAMPLE_DTYPES:
+            raise ValueError(f"Tipo de amostra inválido: {self.dtype}")
+
+    @property
+    def sample_rate(self):
+        """Taxa de amostragem do sinal em amostras por segundo."""
+        return self.samples_per_symbol * self.symbol_rate
+
+    @property
+    def scale(self):
+        """Fator entre a amplitude em ponto flutuante e o valor transmitido."""
+        if self.dtype == "int16":
+            return np.iinfo(np.int16).max / self.amplitude
+        return 1.0
+
+    def to_samples(self, waveform):
+        """
+        Converte formas de onda em ponto flutuante para o tipo de amostra configurado.
+        :param waveform: Array em ponto flutuante.
+        :return: Array no tipo de amostra configurado.
+        """
+        dtype = SAMPLE_DTYPES[self.dtype]
+        if np.issubdtype(dtype, np.integer):
+            return np.round(waveform * self.scale).astype(dtype)
+        return waveform.astype(dtype, copy=False)
+
+    def from_samples(self, signal):
+        """
+        Converte o sinal recebido de volta para ponto flutuante na escala da amplitude.
+        :param signal: Lista ou array com as amostras no tipo configurado.
+        :return: Array em ponto flutuante.
+        """
+        signal = np.asarray(signal)
+        if np.issubdtype(SAMPLE_DTYPES[self.dtype], np.integer):
+            return signal.astype(np.float32) / np.float32(self.scale)
+        return signal.astype(SAMPLE_DTYPES[self.dtype], copy=False)
+
+# Parâmetros originais do projeto: 100 amostras por símbolo em float64
+DEFAULT_PARAMS = SignalParams()
 
 def nrz_polar_modulation(binary_sequence):
     """
     Função para modulação NRZ-Polar.
-    :param binary_sequence: Lista de bits representando a sequência binária.
-    :return: Sinal modulado e eixo do tempo.
+    :param binary_sequence: Lista ou array de bits representando a sequência binária.
+    :return: Sinal modulado (array int8) e eixo do tempo.
     """   
-    # Geração do sinal NRZ-Polar
-    signal = []
-    for bit in binary_sequence:
-        if bit == 1:
-            signal.extend([1])   # +V para 1
-        else:
-            signal.extend([-1])  # -V para 0
+    # Geração do sinal NRZ-Polar: +V para 1 e -V para 0
+    bits = np.asarray(binary_sequence, dtype=np.int8)
+    signal = 2 * bits - 1
 
     # Geração do eixo do tempo
     time = np.linspace(0, len(signal), len(signal), endpoint=False)
@@ -23,18 +80,17 @@ def nrz_polar_modulation(binary_sequence):
 def manchester_modulation(binary_sequence):
     """
     Função para modulação Manchester.
-    :param binary_sequence: Lista de bits representando a sequência binária.
-    :return: Sinal modulado e eixo do tempo.
+    :param binary_sequence: Lista ou array de bits representando a sequência binária.
+    :return: Sinal modulado (array int8) e eixo do tempo.
     """
     # Clock Manchester
-    clock = 0, 1
+    clock = np.array([0, 1], dtype=np.int8)
     
-    # Geração do sinal Manchester
-    signal = []
-    for bit in binary_sequence:  
-        signal.extend([bit ^ clock[0], bit ^ clock[1]]) # bit XOR com o clock
+    # Geração do sinal Manchester: cada bit XOR com as duas metades do clock, intercaladas
+    bits = np.asarray(binary_sequence, dtype=np.int8)
+    signal = (bits[:, np.newaxis] ^ clock).ravel()
         
-     # Gerar o eixo de tempo correspondente ao sinal
+    # Gerar o eixo de tempo correspondente ao sinal
     time = np.linspace(0, len(signal), len(signal), endpoint=False)  # Cada bit gera 2 valores
 
     return signal, time	
@@ -42,59 +98,64 @@ def manchester_modulation(binary_sequence):
 def bipolar_modulation(binary_sequence):
     """
     Função para modulação bipolar.
-    :param binary_sequence: Lista de bits representando a sequência binária.
-    :return: Sinal modulado e eixo do tempo.
-    """
-    # Geração do sinal bipolar
-    signal = []
-    last_bit_one = -1 # Variável de alternância de polaridade
-    for bit in binary_sequence:
-        if bit == 1:
-            if last_bit_one == 1:
-                signal.extend([-1]) # -V para 1
-                last_bit_one = -1
-            else:
-                signal.extend([1])   # +V para 1
-                last_bit_one = 1
-        else:
-            signal.extend([0])  # 0 para 0
+    :param binary_sequence: Lista ou array de bits representando a sequência binária.
+    :return: Sinal modulado (array int8) e eixo do tempo.
+    """
+    bits = np.asarray(binary_sequence, dtype=np.int8)
+
+    # Alternância de polaridade: a soma acumulada conta os bits 1 já transmitidos.
+    # O 1º, 3º, 5º... bit 1 vai em +V e o 2º, 4º, 6º... em -V (a paridade sobrevive ao overflow de uint8)
+    ones_parity = np.cumsum(bits, dtype=np.uint8) & 1
+    signal = bits * (2 * ones_parity.view(np.int8) - 1)  # 0 para 0
 
     # Geração do eixo do tempo
     time = np.linspace(0, len(signal), len(signal), endpoint=False)
     
     return signal, time
 
-def ask_modulation(A, F, bit_stream, digi_mod):
+def carrier_waveforms(A, F, params=DEFAULT_PARAMS):
+    """
+    Calcula uma única vez a forma de onda da portadora para um intervalo de símbolo.
+    :param A: Amplitude da onda portadora.
+    :param F: Frequência da onda portadora.
+    :param params: Parâmetros do sinal (amostras por símbolo e taxa de amostragem).
+    :return: Array em ponto flutuante com as amostras da portadora em um intervalo de símbolo.
+    """
+    j = np.arange(params.samples_per_symbol)
+    return A * np.sin(2 * np.pi * F * j / params.sample_rate)
+
+def carrier_modulation(waveforms, bit_stream, digi_mod):
+    """
+    Monta o sinal modulado por portadora copiando a forma de onda pré-calculada de cada símbolo.
+    :param waveforms: Array (2, amostras) com a forma de onda do bit 0 (linha 0) e do bit 1 (linha 1).
+    :param bit_stream: Lista ou array representando o stream de bits.
+    :param digi_mod: Tipo de modulação digital.
+    :return: Array representando o sinal modulado.
+    """
+    levels = np.asarray(bit_stream)
+    if digi_mod == "Bipolar": # Se for bipolar
+        symbols = levels != 0 # Inclui a tensão -1 V como bit 1
+    else:
+        symbols = levels == 1
+
+    # Uma única indexação monta todos os símbolos de uma vez
+    return waveforms[symbols.astype(np.intp)].ravel()
+
+def ask_modulation(A, F, bit_stream, digi_mod, params=DEFAULT_PARAMS):
     """
     Realiza modulação ASK (Amplitude Shift Keying) em um stream de bits.
     :param A: Amplitude da onda portadora.
     :param F: Frequência da onda portadora.
     :param bit_stream: Lista ou array representando o stream de bits.
     :param digi_mod: Tipo de modulação digital.
-    :return: Array representando o sinal modulado ASK.
+    :param params: Parâmetros do sinal.
+    :return: Array representando o sinal modulado ASK, no tipo de amostra configurado.
     """
-    sig_size = len(bit_stream)
-    signal = np.zeros(sig_size * 100)  # Inicializa o array para o sinal modulado
-    
-    for i in range(sig_size):
-        if digi_mod == "Bipolar": # Se for bipolar
-            if bit_stream[i] in (1, -1): # Inclui a tensão -1 V como bit 1 
-                for j in range(100):
-                    signal[(i * 100) + j] = A * np.sin(2 * np.pi * F * j / 100)
-            else:
-                for j in range(100):
-                    signal[(i * 100) + j] = 0
-        else:
-            if bit_stream[i] == 1:
-                for j in range(100):
-                    signal[(i * 100) + j] = A * np.sin(2 * np.pi * F * j / 100)
-            else:
-                for j in range(100):
-                    signal[(i * 100) + j] = 0
-
-    return signal
-
-def fsk_modulation(A, F1, F2, bit_stream, digi_mod):
+    carrier = carrier_waveforms(A, F, params)
+    waveforms = params.to_samples(np.stack([np.zeros_like(carrier), carrier])) # Bit 0 sem portadora, bit 1 com portadora
+    return carrier_modulation(waveforms, bit_stream, digi_mod)
+
+def fsk_modulation(A, F1, F2, bit_stream, digi_mod, params=DEFAULT_PARAMS):
     """
     Realiza modulação FSK (Frequency Shift Keying) em um stream de bits.
     :param A: Amplitude da onda portadora.
@@ -102,94 +163,230 @@ def fsk_modulation(A, F1, F2, bit_stream, digi_mod):
     :param F2: Frequência da onda portadora para o valor de tensão do bit 0.
     :param bit_stream: Lista ou array representando o stream de bits.
     :param digi_mod: Tipo de modulação digital.
-    :return: Array representando o sinal modulado FSK.
+    :param params: Parâmetros do sinal.
+    :return: Array representando o sinal modulado FSK, no tipo de amostra configurado.
     """
-    sig_size = len(bit_stream)
-    signal = np.zeros(sig_size * 100)  # Inicializa o array para o sinal modulado
-    
-    for i in range(sig_size):
-        if digi_mod == "Bipolar": # Se for bipolar
-            if bit_stream[i] in (1, -1): # Inclui a tensão -1 V como bit 1 
-                for j in range(100):
-                    signal[(i * 100) + j] = A * np.sin(2 * np.pi * F1 * j / 100)
-            else:
-                for j in range(100):
-                    signal[(i * 100) + j] = A * np.sin(2 * np.pi * F2 * j / 100)
-        else:
-            if bit_stream[i] == 1:
-                for j in range(100):
-                    signal[(i * 100) + j] = A * np.sin(2 * np.pi * F1 * j / 100)
-            else:
-                for j in range(100):
-                    signal[(i * 100) + j] = A * np.sin(2 * np.pi * F2 * j / 100)
-
-    return signal
-
-def qam8_modulation(A, F, bit_stream, digi_mod):
+    waveforms = params.to_samples(np.stack([carrier_waveforms(A, F2, params), carrier_waveforms(A, F1, params)]))
+    return carrier_modulation(waveforms, bit_stream, digi_mod)
+
+def qam8_waveforms(A, F, params=DEFAULT_PARAMS):
+    """
+    Calcula a forma de onda de cada um dos 8 símbolos da constelação 8-QAM.
+    :param A: Amplitude base da onda portadora.
+    :param F: Frequência da onda portadora.
+    :param params: Parâmetros do sinal (amostras por símbolo e taxa de símbolos).
+    :return: Array (8, amostras por símbolo) em ponto flutuante, indexado pelos 3 bits do símbolo.
+    """
+    t = np.linspace(0, 1 / params.symbol_rate, params.samples_per_symbol, endpoint=False)  # Intervalo de tempo para um símbolo
+    index = np.arange(8)
+    amplitude = np.where(index & 4, A, A / 2)
+    phase = (index & 3) * np.pi / 4
+    return amplitude[:, np.newaxis] * np.sin(2 * np.pi * F * t + phase[:, np.newaxis])
+
+def qam8_symbols(bit_stream, digi_mod):
+    """
+    Agrupa o stream de bits em símbolos de 3 bits, completando o último símbolo com bits 0.
+    :param bit_stream: Lista ou array representando o stream de bits.
+    :param digi_mod: Tipo de modulação digital.
+    :return: Array com o índice (0 a 7) de cada símbolo.
+    """
+    levels = np.asarray(bit_stream)
+    if digi_mod == "Bipolar":
+        ones = levels != 0 # Inclui a tensão -1 V como bit 1
+    else:
+        ones = levels == 1
+
+    symbols = np.zeros(-(-len(ones) // 3), dtype=np.intp)
+    for shift in range(3):
+        column = ones[shift::3]
+        symbols[:len(column)] |= column.astype(np.intp) << (2 - shift)
+    return symbols
+
+def qam8_modulation(A, F, bit_stream, digi_mod, params=DEFAULT_PARAMS):
     """
     Realiza modulação 8-QAM (Quadrature Amplitude Modulation com 8 estados) em um stream de bits.
     :param A: Amplitude base da onda portadora.
     :param F: Frequência da onda portadora.
-    :param bit_stream: Lista ou array representando o stream de bits (deve ter múltiplos de 3).
-    :return: Array representando o sinal modulado 8-QAM.
-    """
-    # Modificações para satisfazer a constelação 8-QAM
-    bit_zero=0
-    if digi_mod == "NRZ-Polar": # Se for bipolar
-        bit_zero = -1
-    elif digi_mod == "Bipolar":
-        for i in range(len(bit_stream)):
-            if bit_stream[i] == -1:
-                bit_stream[i] = 1
+    :param bit_stream: Lista ou array representando o stream de bits.
+    :param digi_mod: Tipo de modulação digital.
+    :param params: Parâmetros do sinal.
+    :return: Array representando o sinal modulado 8-QAM, no tipo de amostra configurado.
+    """
+    # Cada símbolo é uma cópia da linha correspondente da tabela; o stream de entrada não é alterado
+    return params.to_samples(qam8_waveforms(A, F, params))[qam8_symbols(bit_stream, digi_mod)].ravel()
     
-    # Adiciona zeros ao bit_stream até que seu comprimento seja múltiplo de 3
-    while len(bit_stream) % 3 != 0:
-        bit_stream.append(bit_zero)
+# Os gráficos são renderizados por uma única thread em segundo plano, fora do caminho de transmissão
+plot_executor = None
+pending_plots = {} # Caminho do arquivo -> renderização agendada
 
-    sig_size = len(bit_stream) // 3  # Cada símbolo 8-QAM representa 3 bits
-    signal = np.zeros(sig_size * 100)  # Inicializa o array para o sinal modulado
-    t = np.linspace(0, 1, 100, endpoint=False)  # Intervalo de tempo para um símbolo
-    
-    # Constelação 8-QAM (amplitude e fase para cada combinação de bits)
-    constellation = {
-        (bit_zero, bit_zero, bit_zero): (A / 2, 0),
-        (bit_zero, bit_zero, 1): (A / 2, np.pi / 4),
-        (bit_zero, 1, bit_zero): (A / 2, np.pi / 2),
-        (bit_zero, 1, 1): (A / 2, 3 * np.pi / 4),
-        (1, bit_zero,bit_zero): (A, 0),
-        (1, bit_zero, 1): (A, np.pi / 4),
-        (1, 1, bit_zero): (A, np.pi / 2),
-        (1, 1, 1): (A, 3 * np.pi / 4),
-    }
-
-    for i in range(sig_size):
-        # Extrair os 3 bits que formam o símbolo
-        bits = tuple(bit_stream[i * 3:(i + 1) * 3])
-        if bits not in constellation:
-            raise ValueError(f"Bits inválidos na constelação: {bits}")
-        
-        # Obter amplitude e fase do símbolo na constelação
-        amp, phase = constellation[bits]
-        
-        # Gerar o sinal para o símbolo atual
-        for j in range(100):
-            signal[(i * 100) + j] = amp * np.sin(2 * np.pi * F * t[j] + phase)
+def min_max_envelope(signal, max_points=4000):
+    """
+    Decima o sinal para plotagem mantendo o mínimo e o máximo de cada intervalo, de forma que o custo de
+    renderização seja limitado independentemente do tamanho do quadro.
+    :param signal: Array representando o sinal.
+    :param max_points: Número máximo de pontos devolvidos.
+    :return: Eixo x (índice das amostras) e valores do envelope.
+    """
+    signal = np.asarray(signal)
+    if len(signal) <= max_points:
+        return np.arange(len(signal)), signal
 
-    
-    return signal
-    
-def main(digital_modulation_selected, analogical_modulation_selected, binary_output):
+    width = -(-len(signal) // (max_points // 2)) # Amostras por intervalo
+    starts = np.arange(0, len(signal), width)
+    envelope = np.column_stack([np.minimum.reduceat(signal, starts), np.maximum.reduceat(signal, starts)])
+    return np.repeat(starts, 2), envelope.ravel()
+
+def render_plot(path, x, y, title, xlabel, figsize, steps=False):
+    """
+    Renderiza um gráfico e salva em arquivo.
+    Usa a API orientada a objetos do matplotlib (sem pyplot), que pode rodar fora da thread principal.
+    :param path: Caminho do arquivo PNG.
+    :param x: Eixo x.
+    :param y: Valores a serem plotados.
+    :param title: Título do gráfico.
+    :param xlabel: Rótulo do eixo x.
+    :param figsize: Tamanho da figura.
+    :param steps: Se verdadeiro, desenha o sinal em degraus (sinal digital).
+    """
+    from matplotlib.figure import Figure # Importado apenas quando algum gráfico é gerado
+
+    figure = Figure(figsize=figsize)
+    axes = figure.subplots()
+    if steps:
+        axes.plot(x, y, drawstyle='steps-post', label="Sinal")
+        axes.legend()
+    else:
+        axes.plot(x, y)
+    axes.set_title(title)
+    axes.set_xlabel(xlabel)
+    axes.set_ylabel("Amplitude")
+    axes.grid(True)
+    figure.savefig(path)
+
+def submit_plot(path, x, y, title, xlabel, figsize, steps=False):
+    """
+    Agenda a renderização de um gráfico em segundo plano, sem bloquear quem chamou.
+    Se um gráfico anterior para o mesmo arquivo ainda não começou a ser renderizado, ele é descartado.
+    """
+    global plot_executor
+    if plot_executor is None:
+        plot_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="plot")
+
+    previous = pending_plots.get(path)
+    if previous is not None:
+        previous.cancel()
+    pending_plots[path] = plot_executor.submit(render_plot, path, x, y, title, xlabel, figsize, steps)
+
+def plot_digital_signal(path, signal, title):
+    """
+    Agenda o gráfico de um sinal digital (em degraus), decimado para um número limitado de pontos.
     """
-    Executa a modulação digital e analógica selecionada, além de plotar os gráficos.
+    x, y = min_max_envelope(signal)
+    # Correção do eixo x para plotagem: repete o último valor até o fim do último bit
+    x = np.append(x, len(signal))
+    y = np.append(y, y[-1] if len(y) else 0)
+    submit_plot(path, x, y, title, "Tempo", (10, 4), steps=True)
+
+def plot_analog_signal(path, signal, title):
+    """
+    Agenda o gráfico de um sinal modulado por portadora, decimado para um número limitado de pontos.
+    """
+    x, y = min_max_envelope(signal)
+    submit_plot(path, x, y, title, "Amostras", (12, 4))
+
+def wait_for_plots():
+    """
+    Aguarda a renderização dos gráficos agendados (por exemplo, antes de a interface carregar as imagens).
+    """
+    for path, future in list(pending_plots.items()):
+        if not future.cancelled():
+            future.result()
+        if pending_plots.get(path) is future:
+            del pending_plots[path]
+
+def bit_chunks(binary_output, chunk_size):
+    """
+    Divide uma sequência de bits em blocos de tamanho fixo sem materializar a sequência inteira.
+    :param binary_output: Lista, array ou qualquer iterável de bits (inclusive geradores sem fim).
+    :param chunk_size: Número de bits por bloco.
+    :return: Gerador de arrays int8 com até chunk_size bits cada.
+    """
+    if isinstance(binary_output, (list, tuple, np.ndarray)):
+        for start in range(0, len(binary_output), chunk_size):
+            yield np.asarray(binary_output[start:start + chunk_size], dtype=np.int8)
+        return
+
+    iterator = iter(binary_output)
+    while True:
+        chunk = np.fromiter(islice(iterator, chunk_size), dtype=np.int8)
+        if len(chunk) == 0:
+            return
+        yield chunk
+
+def stream_modulation(digital_modulation_selected, analogical_modulation_selected, binary_output, params=DEFAULT_PARAMS, chunk_size=4096):
+    """
+    Executa a modulação digital e analógica selecionada em blocos, com memória constante em relação ao tamanho da mensagem.
+    Os blocos concatenados são idênticos ao sinal devolvido por main: a alternância de polaridade do Bipolar e os
+    bits que ainda não completaram um símbolo 8-QAM são carregados de um bloco para o próximo. Cada símbolo começa
+    na mesma fase da portadora, como no caminho em lote, então a fase também é preservada entre os blocos.
+    :param digital_modulation_selected: Modulação digital selecionada.
+    :param analogical_modulation_selected: Modulação analógica selecionada.
+    :param binary_output: Lista, array ou iterável de bits a ser modulado.
+    :param params: Parâmetros do sinal.
+    :param chunk_size: Número de bits consumidos por bloco.
+    :return: Gerador de blocos de amostras moduladas.
+    """
+    if digital_modulation_selected == "NRZ-Polar":
+        line_coding = nrz_polar_modulation
+    elif digital_modulation_selected == "Manchester":
+        line_coding = manchester_modulation
+    elif digital_modulation_selected == "Bipolar":
+        line_coding = bipolar_modulation
+
+    if analogical_modulation_selected == "ASK":
+        carrier = lambda levels: ask_modulation(params.amplitude, params.carrier_frequency, levels, digital_modulation_selected, params)
+    elif analogical_modulation_selected == "FSK":
+        carrier = lambda levels: fsk_modulation(params.amplitude, params.fsk_frequency_one, params.fsk_frequency_zero, levels, digital_modulation_selected, params)
+    elif analogical_modulation_selected == "8-QAM":
+        carrier = lambda levels: qam8_modulation(params.amplitude, params.carrier_frequency, levels, digital_modulation_selected, params)
+
+    odd_ones = False # Indica se a quantidade de bits 1 já modulados é ímpar (próximo bit 1 em -V no Bipolar)
+    pending = np.zeros(0, dtype=np.int8) # Tensões que ainda não completam um símbolo 8-QAM
+
+    for chunk in bit_chunks(binary_output, chunk_size):
+        levels, _ = line_coding(chunk)
+
+        if digital_modulation_selected == "Bipolar":
+            # Cada bloco começa em +V; inverte quando o bloco anterior terminou em +V
+            if odd_ones:
+                levels = -levels
+            odd_ones ^= bool(np.count_nonzero(chunk) & 1)
+
+        if analogical_modulation_selected == "8-QAM":
+            levels = np.concatenate([pending, levels])
+            complete = len(levels) - len(levels) % 3
+            pending = levels[complete:]
+            levels = levels[:complete]
+
+        if len(levels):
+            yield carrier(levels)
+
+    # O último símbolo 8-QAM é completado com bits 0, como no caminho em lote
+    if len(pending):
+        yield carrier(pending)
+
+def main(digital_modulation_selected, analogical_modulation_selected, binary_output, params=DEFAULT_PARAMS, plot=False):
+    """
+    Executa a modulação digital e analógica selecionada e, opcionalmente, agenda a plotagem dos gráficos.
     :param digital_modulation_selected: Modulação digital selecionada.
     :param analogical_modulation_selected: Modulação analógica selecionada.
     :param binary_output: Sequência de bits a ser modulada.
+    :param params: Parâmetros do sinal (amostras por símbolo, portadoras, amplitude e tipo de amostra).
+    :param plot: Se verdadeiro, os gráficos são gerados em segundo plano (ver wait_for_plots).
     :return: Sinal modulado.
     """
-    # Garantir que a sequência de bits é uma lista de inteiros
-    binary_sequence = []
-    for bit in binary_output:
-        binary_sequence.append(int(bit))
+    # Garantir que a sequência de bits é um array compacto de inteiros
+    binary_sequence = np.asarray(binary_output, dtype=np.int8)
     
     if digital_modulation_selected == "NRZ-Polar":
         signal,time = nrz_polar_modulation(binary_sequence) 
@@ -197,38 +394,17 @@ def main(digital_modulation_selected, analogical_modulation_selected, binary_out
         signal, time = manchester_modulation(binary_sequence)
     elif digital_modulation_selected == "Bipolar":
         signal, time = bipolar_modulation(binary_sequence)
-    
-    # Correção do eixo x para plotagem
-    time_extended = np.append(time, time[-1] + (time[1] - time[0]))
-    signal_extended = np.append(signal, signal[-1])
-    
-    # Plotar o sinal digital modulado
-    plt.figure(figsize=(10, 4))
-    plt.plot(time_extended, signal_extended, drawstyle='steps-post', label="Sinal")
-    plt.title(f"Modulação {digital_modulation_selected}")
-    plt.xlabel("Tempo")
-    plt.ylabel("Amplitude")
-    plt.grid(True)
-    plt.legend()
-    plt.savefig(f"modulacao_digital.png")
-    plt.close()  # Fecha a figura para liberar memória
-
        
     if analogical_modulation_selected == "ASK":
-        signal2 = ask_modulation(1, 1, signal, digital_modulation_selected)
+        signal2 = ask_modulation(params.amplitude, params.carrier_frequency, signal, digital_modulation_selected, params)
     elif analogical_modulation_selected == "FSK":
-        signal2 = fsk_modulation(1, 1, 3, signal, digital_modulation_selected)
+        signal2 = fsk_modulation(params.amplitude, params.fsk_frequency_one, params.fsk_frequency_zero, signal, digital_modulation_selected, params)
     elif analogical_modulation_selected == "8-QAM":
-        signal2 = qam8_modulation(1, 1, signal, digital_modulation_selected)
+        signal2 = qam8_modulation(params.amplitude, params.carrier_frequency, signal, digital_modulation_selected, params)
     
-    # Plotar o sinal analógico modulado
-    plt.figure(figsize=(12, 4))
-    plt.plot(signal2)
-    plt.title(f"Sinal {analogical_modulation_selected} Modulado")
-    plt.xlabel("Amostras")
-    plt.ylabel("Amplitude")
-    plt.grid(True)
-    plt.savefig(f"modulacao_analogica.png")
-    plt.close()  # Fecha a figura para liberar memória
+    # Plotar os sinais digital e analógico modulados
+    if plot:
+        plot_digital_signal("modulacao_digital.png", signal, f"Modulação {digital_modulation_selected}")
+        plot_analog_signal("modulacao_analogica.png", signal2, f"Sinal {analogical_modulation_selected} Modulado")
     
     return signal2
\ No newline at end of file
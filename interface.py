@@ -38,7 +38,7 @@ class ModulationApp(Gtk.Window):
         right_box = Gtk.Box(orientation=Gtk.Orientation.VERTICAL, spacing=10)
         right_box.set_border_width(10)
 
-        self.label_ascii_input = Gtk.Label(label="Entrada ASCII (12 caracteres):")
+        self.label_ascii_input = Gtk.Label(label="Entrada de texto:")
         self.ascii_input_entry = Gtk.Entry()
 
         # Labels e Comboboxes
@@ -63,12 +63,15 @@ class ModulationApp(Gtk.Window):
         self.label_error_detection = Gtk.Label(label="Detecção de Erros:")
         self.error_detection_combo = Gtk.ComboBoxText()
         self.error_detection_combo.append_text("Bit de Paridade")
-        self.error_detection_combo.append_text("CRC")
+        self.error_detection_combo.append_text("CRC-8")
+        self.error_detection_combo.append_text("CRC-16-CCITT")
+        self.error_detection_combo.append_text("CRC-32")
 
         self.label_error_correction = Gtk.Label(label="Correção de Erros:")
         self.error_correction_combo = Gtk.ComboBoxText()
         self.error_correction_combo.append_text("Nenhum")
         self.error_correction_combo.append_text("Hamming")
+        self.error_correction_combo.append_text("Convolucional")
 
         # Botão para enviar seleção
         self.submit_button = Gtk.Button(label="Selecionar")
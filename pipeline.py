@@ -0,0 +1,165 @@
+from dataclasses import dataclass
+from functools import partial
+import numpy as np
+
+import camada_enlace as ce
+import camada_fisica as cf
+
+@dataclass(frozen=True)
+class CodecConfig:
+    """
+    Configuração completa de codificação de um enlace, com os mesmos nomes usados na interface.
+    """
+    digital_mod: str
+    analog_mod: str
+    framing: str
+    error_detection: str
+    error_correction: str
+    params: cf.SignalParams = cf.DEFAULT_PARAMS
+
+# Etapas da camada de enlace, na ordem em que são aplicadas; opções ausentes das tabelas não fazem nada
+FRAMINGS = {
+    "Contagem de Caracteres": ce.char_count,
+    "Inserção de Bytes": ce.byte_insertion,
+    "Inserção de Bits": ce.char_insertion,
+}
+ERROR_DETECTIONS = {"Bit de Paridade": ce.parity_bit}
+ERROR_DETECTIONS.update({standard: partial(ce.crc, standard=standard) for standard in ["CRC", *ce.CRC_STANDARDS]})
+ERROR_CORRECTIONS = {"Hamming": ce.hamming, "Convolucional": ce.convolutional}
+
+# Codificações de linha (apenas o sinal; o eixo do tempo só é usado nos gráficos)
+LINE_CODES = {
+    "NRZ-Polar": cf.nrz_polar_modulation,
+    "Manchester": cf.manchester_modulation,
+    "Bipolar": cf.bipolar_modulation,
+}
+
+def carrier_table(analog_mod, params):
+    """
+    Calcula a tabela de formas de onda da modulação por portadora, uma linha por símbolo, no tipo de amostra configurado.
+    :param analog_mod: Modulação analógica.
+    :param params: Parâmetros do sinal.
+    :return: Array (símbolos, amostras por símbolo).
+    """
+    A = params.amplitude
+    if analog_mod == "ASK":
+        carrier = cf.carrier_waveforms(A, params.carrier_frequency, params)
+        waveforms = np.stack([np.zeros_like(carrier), carrier])
+    elif analog_mod == "FSK":
+        waveforms = np.stack([cf.carrier_waveforms(A, params.fsk_frequency_zero, params), cf.carrier_waveforms(A, params.fsk_frequency_one, params)])
+    elif analog_mod == "8-QAM":
+        waveforms = cf.qam8_waveforms(A, params.carrier_frequency, params)
+    else:
+        raise ValueError(f"Modulação analógica inválida: {analog_mod}")
+    return params.to_samples(waveforms)
+
+def max_frame_samples(config, data_bytes):
+    """
+    Calcula o maior número de amostras que um quadro com data_bytes bytes de dados pode gerar, considerando o pior
+    caso de cada etapa (todos os bytes escapados na inserção de bytes, um bit inserido a cada cinco na inserção de bits).
+    :param config: Configuração de codificação (CodecConfig).
+    :param data_bytes: Bytes de dados do quadro (incluindo o cabeçalho do segmento).
+    :return: Número máximo de amostras do quadro modulado.
+    """
+    bits = 8 * data_bytes
+    if config.framing == "Contagem de Caracteres":
+        bits += ce.COUNT_WIDTH
+    elif config.framing == "Inserção de Bytes":
+        bits = 2 * bits + 2 * 8
+    elif config.framing == "Inserção de Bits":
+        bits += bits // 5 + 2 * 8
+
+    if config.error_detection == "Bit de Paridade":
+        bits += 1
+    elif config.error_detection in ERROR_DETECTIONS:
+        standard = ce.DEFAULT_CRC if config.error_detection == "CRC" else config.error_detection
+        bits += ce.CRC_STANDARDS[standard][0]
+
+    if config.error_correction == "Hamming":
+        bits = bits // 8 * 12 + bits % 8
+    elif config.error_correction == "Convolucional":
+        bits = 2 * (bits + ce.CONVOLUTIONAL_CONSTRAINT - 1)
+
+    # Manchester transmite duas tensões por bit, e o 8-QAM agrupa três tensões por símbolo
+    levels = 2 * bits if config.digital_mod == "Manchester" else bits
+    symbols = -(-levels // 3) if config.analog_mod == "8-QAM" else levels
+    return symbols * config.params.samples_per_symbol
+
+class EncodePipeline:
+    """
+    Cadeia de codificação do transmissor montada uma única vez para uma configuração:
+    enquadramento -> detecção de erros -> correção de erros -> codificação de linha -> portadora.
+    As funções de cada etapa e as formas de onda da portadora são resolvidas na construção, e as amostras são
+    escritas em um buffer reaproveitado entre as chamadas, que só cresce quando um quadro maior aparece.
+    """
+
+    def __init__(self, config):
+        """
+        :param config: Configuração de codificação (CodecConfig).
+        """
+        if config.digital_mod not in LINE_CODES:
+            raise ValueError(f"Modulação digital inválida: {config.digital_mod}")
+        self.config = config
+        self.link_stages = [
+            stage for stage in (
+                FRAMINGS.get(config.framing),
+                ERROR_DETECTIONS.get(config.error_detection),
+                ERROR_CORRECTIONS.get(config.error_correction),
+            ) if stage is not None
+        ]
+        self.line_code = LINE_CODES[config.digital_mod]
+        self.waveforms = carrier_table(config.analog_mod, config.params)
+        self.samples = np.empty((0, config.params.samples_per_symbol), dtype=self.waveforms.dtype)
+
+    def symbols(self, levels):
+        """
+        Converte as tensões da codificação de linha no índice da forma de onda de cada símbolo.
+        :param levels: Array int8 com as tensões.
+        :return: Array com o índice de cada símbolo na tabela de formas de onda.
+        """
+        if self.config.analog_mod == "8-QAM":
+            return cf.qam8_symbols(levels, self.config.digital_mod)
+        if self.config.digital_mod == "Bipolar":
+            return (levels != 0).astype(np.intp) # Inclui a tensão -1 V como bit 1
+        return (levels == 1).astype(np.intp)
+
+    def encode(self, binary_sequence):
+        """
+        Aplica as etapas da camada de enlace.
+        :param binary_sequence: Lista ou array de bits com os dados do quadro.
+        :return: Array de bits do quadro.
+        """
+        binary_sequence = np.asarray(binary_sequence, dtype=np.uint8)
+        for stage in self.link_stages:
+            binary_sequence = stage(binary_sequence)
+        return binary_sequence
+
+    def modulate(self, binary_sequence, plot=False):
+        """
+        Aplica a codificação de linha e a modulação por portadora.
+        O array devolvido é uma visão do buffer interno e é sobrescrito na próxima chamada.
+        :param binary_sequence: Array de bits do quadro.
+        :param plot: Se verdadeiro, os gráficos são gerados em segundo plano (ver cf.wait_for_plots).
+        :return: Sinal modulado, no tipo de amostra configurado.
+        """
+        levels, _ = self.line_code(np.asarray(binary_sequence, dtype=np.int8))
+        symbols = self.symbols(levels)
+
+        # O buffer de amostras cresce (pelo menos dobrando) apenas quando o quadro não cabe nele
+        if len(self.samples) < len(symbols):
+            self.samples = np.empty((max(len(symbols), 2 * len(self.samples)), self.waveforms.shape[1]), dtype=self.waveforms.dtype)
+        samples = np.take(self.waveforms, symbols, axis=0, out=self.samples[:len(symbols)]).ravel()
+
+        if plot:
+            # O gráfico é renderizado depois, então recebe uma cópia que não será sobrescrita
+            cf.plot_digital_signal("modulacao_digital.png", levels, f"Modulação {self.config.digital_mod}")
+            cf.plot_analog_signal("modulacao_analogica.png", samples.copy(), f"Sinal {self.config.analog_mod} Modulado")
+        return samples
+
+    def __call__(self, binary_sequence):
+        """
+        Codifica e modula um quadro.
+        :param binary_sequence: Lista ou array de bits com os dados do quadro.
+        :return: Sinal modulado (sobrescrito na próxima chamada).
+        """
+        return self.modulate(self.encode(binary_sequence))
@@ -2,55 +2,75 @@ from interface import ModulationApp
 import gi
 gi.require_version('Gtk', '3.0')
 from gi.repository import Gtk
-import asyncio
-import websockets
-import json
+import itertools
 import camada_fisica as cf
 import camada_enlace as ce
+import pipeline as pl
+import arq_transmissor as arq
+import transmissor as tx
 
-async def enviar_quadro(quadro, digital_mod, analog_mod, framing, error_detection, error_correction):
+def montar_mensagem(quadro, num_bits):
     """
-    Envia um quadro para o servidor WebSocket.
-    :param quadro: O quadro a ser enviado (como array NumPy).
-    :param digital_mod: A modulação digital a ser utilizada.
-    :param analog_mod: A modulação analógica a ser utilizada.
-    :param framing: O tipo de enquadramento a ser utilizado.
-    :param error_detection: O tipo de detecção de erros a ser utilizada.
-    :param error_correction: O tipo de correção de erros a ser utilizada.
+    Monta a mensagem de um quadro para o servidor WebSocket.
+    As configurações não vão no quadro: são enviadas uma vez, na abertura da sessão da conexão (ver transmissor.py).
+    :param quadro: O quadro a ser enviado (como array NumPy; é serializado antes da modulação do próximo quadro).
+    :param num_bits: O número de bits do quadro antes da modulação (o 8-QAM completa o último símbolo).
+    :return: Dicionário com o quadro, serializado pelo transmissor (ver protocolo.py).
     """
-    async with websockets.connect("ws://localhost:8765") as websocket:
-        # Monta o JSON com o quadro e as configurações
-        # A array do numpy precisa ser convertida para lista e enviada como JSON
-        # As configurações são enviadas como strings, mas, no contexto do projeto, poderiam ser enviadas como bits
-        data = {
-            "quadro": quadro.tolist(),  # Converte o array NumPy para lista
-            "digital_mod": digital_mod,
-            "analog_mod": analog_mod,
-            "framing": framing,
-            "error_detection": error_detection,
-            "error_correction": error_correction
-        }
-        # Envia os dados para o servidor
-        await websocket.send(json.dumps(data))
-        
+    return {"quadro": quadro, "num_bits": num_bits}
+
 def main():
+    # Parâmetros do sinal (amostras por símbolo, portadoras, amplitude e tipo de amostra)
+    params = cf.DEFAULT_PARAMS
+
+    # Identificadores das mensagens enviadas, para que o receptor separe os segmentos de cada uma
+    message_ids = itertools.count()
+
+    # Protocolo de retransmissão e tamanho da janela deslizante
+    arq_mode = arq.GO_BACK_N
+    window_size = 4
+
+    # Conexões com o servidor mantidas abertas entre os envios, em um loop de eventos próprio
+    transmitter = tx.Transmitter(tx.DEFAULT_URI, arq_mode=arq_mode, window_size=window_size)
+
     # Função de callback que será chamada ao dar submit na interface
     def handle_submit(digital_mod, analog_mod, framing, error_detection, error_correction, ascii_input):
         
-        # Chama as funções da camada de enlace e física
-        message, bin_ascii = ce.main(framing, error_detection, error_correction, ascii_input)  
-        quadro = cf.main(digital_mod, analog_mod, message)
+        # A cadeia de codificação é montada uma vez e reaproveitada em todos os quadros da mensagem
+        config = pl.CodecConfig(digital_mod, analog_mod, framing, error_detection, error_correction, params)
+        encoder = pl.EncodePipeline(config)
+
+        # Tamanho máximo dos dados de cada quadro, para que o quadro modulado caiba no limite de uma mensagem;
+        # mensagens maiores são segmentadas em vários quadros
+        mtu = transmitter.segment_mtu(config)
+
+        # Segmenta a mensagem e envia um quadro por segmento (os gráficos mostram apenas o primeiro quadro)
+        data = ascii_input.encode("utf-8", "surrogatepass")
+        message_id = next(message_ids)
+        def mensagens():
+            for seq, segment in enumerate(ce.segment(data, mtu, message_id)):
+                message = encoder.encode(ce.bytes_to_bits(segment))
+                quadro = encoder.modulate(message, plot=(seq == 0))
+                yield montar_mensagem(quadro, len(message))
         
-        asyncio.run(enviar_quadro(quadro, digital_mod, analog_mod, framing, error_detection, error_correction))
+        sender = transmitter.send(mensagens(), config).result()
+        if sender.retransmissions:
+            print(f"Retransmissões na conexão: {sender.retransmissions} (NAKs: {sender.naks}, temporizadores: {sender.timeouts})")
+        if sender.replies:
+            print(f"Tempo médio no receptor: decodificação {sender.decode_ms / sender.replies:.2f} ms, resposta {sender.latency_ms / sender.replies:.2f} ms")
+
+        # Os gráficos são renderizados em segundo plano; a interface só os carrega depois do envio
+        cf.wait_for_plots()
 
         # Retorna o binário gerado para exibir na interface separado em bytes
-        return ' '.join(bin_ascii[i:i+8] for i in range(0, len(bin_ascii), 8))
+        return ce.format_bits(ce.bytes_to_bits(data))
 
     # Cria a instância da interface, passando a função de callback
     win = ModulationApp(handle_submit)
     win.connect("destroy", Gtk.main_quit)
     win.show_all()
     Gtk.main()
+    transmitter.close()
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -0,0 +1,100 @@
+import json
+import struct
+from dataclasses import asdict
+import numpy as np
+
+import camada_enlace as ce
+import camada_fisica as cf
+import pipeline as pl
+
+# Uma conexão carrega uma sessão: a configuração de codificação é enviada uma única vez, em uma mensagem de texto
+# {"type": "config", ...}, e vale para todos os quadros seguintes da conexão, até a próxima configuração.
+
+# Formato binário das mensagens de quadro, enviado como frame binário do WebSocket:
+# cabeçalho fixo (little-endian) seguido das amostras brutas no tipo de amostra da sessão.
+# magic, versão, indicadores, número de sequência, número de bits do quadro e número de amostras.
+# O preenchimento final deixa o cabeçalho com 24 bytes, então as amostras começam alinhadas em 8 bytes.
+MAGIC = b"TR1Q"
+VERSION = 2
+FRAME_HEADER = struct.Struct("<4sBB2xIII4x")
+HAS_SEQ = 0x01 # Indicador: o quadro tem número de sequência (ARQ)
+
+# Tamanho máximo de uma mensagem de quadro; o receptor usa o mesmo valor como limite do WebSocket (max_size)
+MAX_MESSAGE_BYTES = 1 << 22
+
+# Pior caso do JSON: o texto de uma amostra ("-1.2345678901234567e-100", com o separador ", ") e os demais campos
+JSON_SAMPLE_BYTES = {"float64": 26, "float32": 26, "int16": 8}
+JSON_OVERHEAD = 256
+
+def encode_config(config, arq_mode=None, window_size=1):
+    """
+    Serializa a mensagem que abre (ou troca) a configuração da sessão.
+    :param config: Configuração de codificação (pipeline.CodecConfig).
+    :param arq_mode: Protocolo de retransmissão usado na conexão, ou None.
+    :param window_size: Tamanho da janela do protocolo de retransmissão.
+    :return: Texto JSON da mensagem.
+    """
+    return json.dumps(dict(asdict(config), type="config", arq=arq_mode, window=window_size))
+
+def message_bytes(num_samples, params=cf.DEFAULT_PARAMS, wire_format="binary"):
+    """
+    Calcula o tamanho máximo da mensagem de um quadro serializado.
+    :param num_samples: Número de amostras do quadro.
+    :param params: Parâmetros do sinal da sessão.
+    :param wire_format: Serialização das mensagens de quadro ("binary" ou "json").
+    :return: Tamanho da mensagem, em bytes.
+    """
+    if wire_format == "json":
+        return JSON_OVERHEAD + num_samples * JSON_SAMPLE_BYTES[params.dtype]
+    return FRAME_HEADER.size + num_samples * np.dtype(cf.SAMPLE_DTYPES[params.dtype]).itemsize
+
+def segment_mtu(config, wire_format="binary", budget=MAX_MESSAGE_BYTES):
+    """
+    Calcula o maior MTU (bytes de dados por segmento) cujo quadro, no pior caso, cabe no orçamento de uma mensagem.
+    :param config: Configuração de codificação (pipeline.CodecConfig).
+    :param wire_format: Serialização das mensagens de quadro ("binary" ou "json").
+    :param budget: Tamanho máximo da mensagem de um quadro, em bytes.
+    :return: MTU para ce.segment.
+    """
+    def fits(mtu):
+        samples = pl.max_frame_samples(config, ce.SEGMENT_HEADER.size + mtu)
+        return message_bytes(samples, config.params, wire_format) <= budget
+
+    if not fits(1):
+        raise ValueError(f"A configuração gera quadros maiores que o limite de {budget} bytes por mensagem")
+
+    # O tamanho do quadro cresce com o MTU, então a busca é binária
+    low, high = 1, 0xFFFF
+    while low < high:
+        middle = (low + high + 1) // 2
+        if fits(middle):
+            low = middle
+        else:
+            high = middle - 1
+    return low
+
+def encode_binary(message, params=cf.DEFAULT_PARAMS):
+    """
+    Serializa a mensagem de um quadro no formato binário.
+    :param message: Dicionário com o quadro (array NumPy) e o número de bits (ver projeto_tr1.montar_mensagem), com o
+    número de sequência acrescentado pelo ARQ, se houver.
+    :param params: Parâmetros do sinal da sessão, que definem o tipo das amostras.
+    :return: Bytes da mensagem.
+    """
+    dtype = np.dtype(cf.SAMPLE_DTYPES[params.dtype]).newbyteorder("<")
+    samples = np.ascontiguousarray(message["quadro"], dtype=dtype)
+    seq = message.get("seq")
+    header = FRAME_HEADER.pack(MAGIC, VERSION, HAS_SEQ if seq is not None else 0, seq or 0, message["num_bits"], len(samples))
+    return header + samples.tobytes()
+
+def encode_json(message, params=cf.DEFAULT_PARAMS):
+    """
+    Serializa a mensagem de um quadro em JSON (formato legível, usado para depuração).
+    :param message: Dicionário com o quadro (array NumPy) e o número de bits.
+    :param params: Parâmetros do sinal da sessão (não usados no JSON; mantidos pela mesma assinatura do binário).
+    :return: Texto JSON da mensagem.
+    """
+    return json.dumps(dict(message, type="frame", quadro=np.asarray(message["quadro"]).tolist()))
+
+# Serializações disponíveis para as mensagens de quadro
+WIRE_FORMATS = {"binary": encode_binary, "json": encode_json}
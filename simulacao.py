@@ -0,0 +1,183 @@
+import argparse
+import csv
+import itertools
+import json
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import asdict
+
+import numpy as np
+
+import camada_enlace as ce
+import camada_fisica as cf
+import pipeline as pl
+
+# Os módulos do receptor ficam na pasta Servidor e são importados como módulos de topo, como no servidor
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "Servidor"))
+import canal as cn
+import decode_camada_enlace as dce
+import decode_camada_fisica as dcf
+import decode_pipeline as dpl
+
+# Opções disponíveis em cada etapa, com os mesmos nomes usados na interface
+DIGITAL_MODULATIONS = ["NRZ-Polar", "Manchester", "Bipolar"]
+ANALOG_MODULATIONS = ["ASK", "FSK", "8-QAM"]
+FRAMINGS = ["Contagem de Caracteres", "Inserção de Bytes", "Inserção de Bits"]
+ERROR_DETECTIONS = ["Bit de Paridade", "CRC-8", "CRC-16-CCITT", "CRC-32"]
+ERROR_CORRECTIONS = ["Nenhum", "Hamming", "Convolucional"]
+
+# Caracteres usados para gerar as mensagens aleatórias
+ALPHABET = np.frombuffer(b"ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789 .,", dtype=np.uint8)
+
+def count_bit_errors(sent, received):
+    """
+    Conta os bits diferentes entre a mensagem enviada e a recebida.
+    Bytes faltando ou sobrando no final contam como 8 bits errados cada.
+    :param sent: Bytes enviados.
+    :param received: Bytes recebidos.
+    :return: Número de bits errados.
+    """
+    common = min(len(sent), len(received))
+    diff = np.bitwise_xor(np.frombuffer(sent[:common], dtype=np.uint8), np.frombuffer(received[:common], dtype=np.uint8))
+    return int(np.unpackbits(diff).sum()) + 8 * abs(len(sent) - len(received))
+
+def run_point(task):
+    """
+    Simula todos os quadros de um ponto da varredura: uma combinação de codificações e um ponto do canal.
+    Executada nos processos do pool, por isso recebe e devolve apenas tipos simples.
+    :param task: Dicionário com a combinação, o canal, o número de quadros, o tamanho da mensagem, os parâmetros do sinal e a semente.
+    :return: Dicionário com os contadores e as taxas de erro do ponto.
+    """
+    digital_mod, analog_mod, framing, error_detection, error_correction = task["combination"]
+    channel_model, channel_value = task["channel"]
+    tx_params = cf.SignalParams(**task["params"])
+    rx_params = dcf.SignalParams(**task["params"])
+
+    message_seed, channel_seed = task["seed"].spawn(2)
+    message_rng = np.random.default_rng(message_seed)
+    if channel_model == "AWGN":
+        channel = cn.make_channel(channel_model, seed=channel_seed, snr_db=channel_value)
+    else:
+        channel = cn.make_channel(channel_model, seed=channel_seed, error_probability=channel_value)
+
+    # As cadeias de codificação são montadas uma vez e reaproveitadas em todos os quadros do ponto
+    encoder = pl.EncodePipeline(pl.CodecConfig(*task["combination"], tx_params))
+    decoder = dpl.DecodePipeline(dpl.CodecConfig(*task["combination"], rx_params), channel)
+
+    frame_errors = detected_errors = bit_errors = delivered_bits = 0
+    start = time.perf_counter()
+    for _ in range(task["frames"]):
+        message = ALPHABET[message_rng.integers(0, len(ALPHABET), task["message_length"])].tobytes()
+        try:
+            bits = encoder.encode(ce.bytes_to_bits(message))
+            received = dce.bits_to_bytes(decoder(encoder.modulate(bits), len(bits)))
+        except Exception:
+            # Erro detectado por alguma etapa do receptor: o quadro é descartado
+            frame_errors += 1
+            detected_errors += 1
+            continue
+
+        errors = count_bit_errors(message, received)
+        frame_errors += errors > 0
+        bit_errors += errors
+        delivered_bits += 8 * len(message)
+    elapsed = time.perf_counter() - start
+
+    return {
+        "digital_mod": digital_mod,
+        "analog_mod": analog_mod,
+        "framing": framing,
+        "error_detection": error_detection,
+        "error_correction": error_correction,
+        "channel": channel_model,
+        "channel_value": channel_value,
+        "frames": task["frames"],
+        "frame_errors": frame_errors,
+        "detected_errors": detected_errors,
+        "bit_errors": bit_errors,
+        "delivered_bits": delivered_bits,
+        "ber": bit_errors / delivered_bits if delivered_bits else float("nan"),
+        "fer": frame_errors / task["frames"],
+        "frames_per_sec": task["frames"] / elapsed if elapsed > 0 else float("inf"),
+    }
+
+def build_tasks(args):
+    """
+    Monta a lista de pontos da varredura: todas as combinações de codificações para cada ponto do canal.
+    :param args: Argumentos da linha de comando.
+    :return: Lista de tarefas para run_point.
+    """
+    combinations = list(itertools.product(args.digital, args.analog, args.framing, args.error_detection, args.error_correction))
+    channel_points = [("AWGN", snr) for snr in args.snr] + [("BSC", rate) for rate in args.error_rate]
+    params = asdict(cf.SignalParams(samples_per_symbol=args.samples_per_symbol, dtype=args.dtype))
+
+    points = list(itertools.product(combinations, channel_points))
+    seeds = np.random.SeedSequence(args.seed).spawn(len(points))
+    return [
+        {
+            "combination": combination,
+            "channel": channel,
+            "frames": args.frames,
+            "message_length": args.message_length,
+            "params": params,
+            "seed": seed,
+        }
+        for (combination, channel), seed in zip(points, seeds)
+    ]
+
+def write_results(results, csv_path, json_path):
+    """
+    Salva os resultados da varredura em CSV e/ou JSON.
+    """
+    if csv_path:
+        with open(csv_path, "w", newline="", encoding="utf-8") as file:
+            writer = csv.DictWriter(file, fieldnames=list(results[0].keys()))
+            writer.writeheader()
+            writer.writerows(results)
+    if json_path:
+        with open(json_path, "w", encoding="utf-8") as file:
+            json.dump(results, file, ensure_ascii=False, indent=2)
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Varredura Monte Carlo de BER/FER para todas as combinações de codificação.")
+    parser.add_argument("--snr", type=float, nargs="*", default=[0.0, -5.0, -10.0], help="Pontos de SNR (dB) do canal AWGN")
+    parser.add_argument("--error-rate", type=float, nargs="*", default=[], help="Probabilidades de erro de bit do canal binário simétrico")
+    parser.add_argument("--frames", type=int, default=100, help="Quadros simulados por ponto")
+    parser.add_argument("--message-length", type=int, default=12, help="Caracteres por mensagem")
+    parser.add_argument("--samples-per-symbol", type=int, default=cf.DEFAULT_PARAMS.samples_per_symbol, help="Amostras por símbolo")
+    parser.add_argument("--dtype", choices=list(cf.SAMPLE_DTYPES), default=cf.DEFAULT_PARAMS.dtype, help="Tipo das amostras do sinal")
+    parser.add_argument("--digital", nargs="*", choices=DIGITAL_MODULATIONS, default=DIGITAL_MODULATIONS)
+    parser.add_argument("--analog", nargs="*", choices=ANALOG_MODULATIONS, default=ANALOG_MODULATIONS)
+    parser.add_argument("--framing", nargs="*", choices=FRAMINGS, default=FRAMINGS)
+    parser.add_argument("--error-detection", nargs="*", choices=ERROR_DETECTIONS, default=ERROR_DETECTIONS)
+    parser.add_argument("--error-correction", nargs="*", choices=ERROR_CORRECTIONS, default=ERROR_CORRECTIONS)
+    parser.add_argument("--workers", type=int, default=None, help="Processos do pool (padrão: número de CPUs)")
+    parser.add_argument("--seed", type=int, default=0, help="Semente para mensagens e canais, para execuções reprodutíveis")
+    parser.add_argument("--csv", default="resultados.csv", help="Arquivo CSV de saída (vazio para não gerar)")
+    parser.add_argument("--json", default="", help="Arquivo JSON de saída (vazio para não gerar)")
+    return parser.parse_args(argv)
+
+def main(argv=None):
+    """
+    Executa a varredura em um pool de processos e salva a tabela de BER/FER e quadros por segundo.
+    """
+    args = parse_args(argv)
+    tasks = build_tasks(args)
+    if not tasks:
+        print("Nenhum ponto para simular.")
+        return []
+
+    workers = args.workers or os.cpu_count() or 1
+    start = time.perf_counter()
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        results = list(executor.map(run_point, tasks, chunksize=max(1, len(tasks) // (4 * workers))))
+    elapsed = time.perf_counter() - start
+
+    write_results(results, args.csv, args.json)
+    print(f"{len(results)} pontos, {len(results) * args.frames} quadros em {elapsed:.1f} s")
+    return results
+
+if __name__ == "__main__":
+    main()
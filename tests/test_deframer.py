@@ -0,0 +1,42 @@
+import os
+import sys
+
+import numpy as np
+import pytest
+
+# Os módulos do receptor ficam na pasta Servidor e são importados como módulos de topo, como no servidor
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+sys.path.insert(0, os.path.join(ROOT, "Servidor"))
+import camada_enlace as ce
+import decode_camada_enlace as dce
+
+def corrupted_stream(seed, framing, error_detection, frames=50, corrupted=3):
+    """
+    Gera um fluxo de quadros com um bit invertido em alguns deles.
+    :return: Dados de cada quadro, índices dos quadros corrompidos e array de bits do fluxo.
+    """
+    rng = np.random.default_rng(seed)
+    data = [rng.integers(0, 2, 8 * int(rng.integers(20, 120)), dtype=np.uint8) for _ in range(frames)]
+    encoded = [ce.encode_frame(framing, error_detection, "Nenhum", bits).astype(np.uint8) for bits in data]
+    corrupted = set(rng.choice(frames, corrupted, replace=False).tolist())
+    for index in corrupted:
+        # Inverte um bit qualquer depois da flag inicial (dados, flag final ou código de detecção)
+        encoded[index][int(rng.integers(8, len(encoded[index]) - 8))] ^= 1
+    return data, corrupted, np.concatenate(encoded)
+
+@pytest.mark.parametrize("seed", range(5))
+@pytest.mark.parametrize("chunk", [None, 64])
+def test_byte_insertion_resyncs_after_corrupted_frame(seed, chunk):
+    # Depois de um quadro corrompido, o desenquadrador não pode ficar preso em uma flag fora do alinhamento dos bytes
+    data, corrupted, stream = corrupted_stream(seed, "Inserção de Bytes", "CRC")
+    deframer = dce.Deframer("Inserção de Bytes", "CRC", "Nenhum")
+    chunk = chunk or len(stream)
+    frames = []
+    for position in range(0, len(stream), chunk):
+        frames += deframer.feed(stream[position:position + chunk])
+
+    delivered = {frame.tobytes() for frame in frames}
+    missing = [index for index, bits in enumerate(data) if index not in corrupted and bits.tobytes() not in delivered]
+    assert missing == []
+    assert deframer.errors
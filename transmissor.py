@@ -0,0 +1,182 @@
+import asyncio
+import threading
+from dataclasses import dataclass
+from functools import partial
+import websockets
+from websockets.protocol import State
+
+import arq_transmissor as arq
+import pipeline as pl
+import protocolo as pr
+
+# Endereço padrão do servidor (receptor)
+DEFAULT_URI = "ws://localhost:8765"
+
+@dataclass
+class Connection:
+    """
+    Conexão do pool: o transmissor ARQ sobre o WebSocket e a configuração da sessão já enviada ao receptor.
+    """
+    sender: arq.ARQSender
+    config: pl.CodecConfig = None
+
+class Transmitter:
+    """
+    Cliente WebSocket persistente do transmissor: um único loop de eventos, executado em uma thread própria, e um
+    pequeno pool de conexões mantidas abertas entre os envios.
+    Cada conexão tem o seu próprio transmissor ARQ, que continua a numeração dos quadros de um envio para o outro
+    (o receptor mantém um estado de ARQ por conexão), e a sua sessão: a configuração de codificação só é enviada
+    quando muda, e os quadros levam apenas as amostras e o número de sequência. As conexões são abertas sob demanda, com novas tentativas e
+    espera exponencial quando o servidor não responde, e uma conexão encerrada é descartada e reaberta no próximo envio.
+    Os envios devolvem um concurrent.futures.Future, então quem chama pode encadear vários sem esperar cada um.
+    """
+
+    def __init__(self, uri=DEFAULT_URI, pool_size=2, arq_mode=arq.GO_BACK_N, window_size=4, wire_format="binary",
+                 initial_backoff=0.1, max_backoff=5.0, max_connect_attempts=5):
+        """
+        :param uri: Endereço do servidor WebSocket.
+        :param pool_size: Número máximo de conexões abertas (e de envios simultâneos).
+        :param arq_mode: Protocolo de retransmissão (Go-Back-N ou Selective Repeat).
+        :param window_size: Número máximo de quadros enviados e ainda não confirmados em cada conexão.
+        :param wire_format: Serialização das mensagens de quadro: "binary" ou "json" (legível, para depuração).
+        :param initial_backoff: Espera, em segundos, antes da segunda tentativa de conexão.
+        :param max_backoff: Espera máxima, em segundos, entre as tentativas de conexão.
+        :param max_connect_attempts: Número de tentativas de conexão antes de desistir.
+        """
+        if wire_format not in pr.WIRE_FORMATS:
+            raise ValueError(f"Formato de mensagem inválido: {wire_format}")
+        if pool_size < 1:
+            raise ValueError("O pool deve ter pelo menos uma conexão")
+        self.uri = uri
+        self.pool_size = pool_size
+        self.arq_mode = arq_mode
+        self.window_size = window_size
+        self.wire_format = wire_format
+        self.initial_backoff = initial_backoff
+        self.max_backoff = max_backoff
+        self.max_connect_attempts = max_connect_attempts
+
+        self.loop = asyncio.new_event_loop()
+        self.thread = threading.Thread(target=self.loop.run_forever, name="transmissor", daemon=True)
+        self.thread.start()
+        self.pool = self.submit(self.create_pool()).result()
+
+    async def create_pool(self):
+        """
+        Cria a fila de conexões do pool no loop do transmissor; os lugares vazios (None) são conectados sob demanda.
+        :return: Fila com um lugar por conexão.
+        """
+        pool = asyncio.Queue()
+        for _ in range(self.pool_size):
+            pool.put_nowait(None)
+        return pool
+
+    def submit(self, coroutine):
+        """
+        Agenda uma corrotina no loop do transmissor a partir de qualquer thread.
+        :param coroutine: Corrotina a ser executada.
+        :return: concurrent.futures.Future com o resultado.
+        """
+        return asyncio.run_coroutine_threadsafe(coroutine, self.loop)
+
+    async def connect(self):
+        """
+        Abre uma conexão com o servidor, tentando de novo com espera exponencial em caso de falha.
+        :return: Nova conexão, ainda sem sessão.
+        """
+        delay = self.initial_backoff
+        for attempt in range(1, self.max_connect_attempts + 1):
+            try:
+                websocket = await websockets.connect(self.uri)
+                return Connection(arq.ARQSender(websocket, self.arq_mode, self.window_size))
+            except (OSError, asyncio.TimeoutError, websockets.exceptions.InvalidHandshake) as e:
+                if attempt == self.max_connect_attempts:
+                    raise ConnectionError(f"Não foi possível conectar a {self.uri}: {e}") from e
+                print(f"Falha ao conectar a {self.uri} ({e}); nova tentativa em {delay:.1f} s")
+                await asyncio.sleep(delay)
+                delay = min(2 * delay, self.max_backoff)
+
+    async def checkout(self):
+        """
+        Retira uma conexão do pool, esperando se todas estiverem em uso e reconectando se ela tiver sido encerrada.
+        :return: Conexão aberta.
+        """
+        connection = await self.pool.get()
+        if connection is None or connection.sender.websocket.state is not State.OPEN:
+            try:
+                connection = await self.connect()
+            except BaseException:
+                self.pool.put_nowait(None)
+                raise
+        return connection
+
+    async def send_async(self, messages, config):
+        """
+        Envia os quadros de uma mensagem por uma das conexões do pool, com retransmissão (ARQ).
+        Se a sessão da conexão tiver outra configuração, a nova é enviada antes dos quadros; como a conexão só
+        volta ao pool depois que todos os quadros são confirmados, nenhum quadro da configuração anterior fica pendente.
+        Se a conexão cair no meio do envio, ela é descartada e o erro é repassado: os quadros já gerados não podem
+        ser renumerados em outra conexão.
+        :param messages: Iterável com a mensagem de cada quadro (ver projeto_tr1.montar_mensagem).
+        :param config: Configuração de codificação dos quadros (pipeline.CodecConfig).
+        :return: Transmissor ARQ usado, com as estatísticas acumuladas da conexão.
+        """
+        connection = await self.checkout()
+        sender = connection.sender
+        try:
+            if connection.config != config:
+                await sender.websocket.send(pr.encode_config(config, self.arq_mode, self.window_size))
+                sender.serialize = partial(pr.WIRE_FORMATS[self.wire_format], params=config.params)
+                connection.config = config
+            await sender.send(messages)
+        except BaseException:
+            await sender.websocket.close()
+            self.pool.put_nowait(None)
+            raise
+        self.pool.put_nowait(connection)
+        return sender
+
+    def segment_mtu(self, config):
+        """
+        Calcula o MTU dos segmentos de uma configuração, para que cada quadro caiba no limite de tamanho das mensagens
+        aceito pelo receptor (ver protocolo.segment_mtu).
+        :param config: Configuração de codificação (pipeline.CodecConfig).
+        :return: Quantidade máxima de bytes de dados por segmento.
+        """
+        return pr.segment_mtu(config, self.wire_format)
+
+    def send(self, messages, config):
+        """
+        Agenda o envio dos quadros de uma mensagem sem bloquear quem chama.
+        Os quadros são gerados sob demanda na thread do transmissor, à medida que a janela avança.
+        :param messages: Iterável com a mensagem de cada quadro (ver projeto_tr1.montar_mensagem).
+        :param config: Configuração de codificação dos quadros (pipeline.CodecConfig).
+        :return: concurrent.futures.Future com o transmissor ARQ usado.
+        """
+        return self.submit(self.send_async(messages, config))
+
+    async def close_connections(self):
+        """
+        Encerra as conexões abertas que estão no pool.
+        """
+        while not self.pool.empty():
+            connection = self.pool.get_nowait()
+            if connection is not None:
+                await connection.sender.websocket.close()
+
+    def close(self):
+        """
+        Encerra as conexões e o loop do transmissor; deve ser chamado depois que os envios terminarem.
+        """
+        if not self.loop.is_running():
+            return
+        self.submit(self.close_connections()).result()
+        self.loop.call_soon_threadsafe(self.loop.stop)
+        self.thread.join()
+        self.loop.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()